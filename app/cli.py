@@ -0,0 +1,195 @@
+"""
+Command line tools for maintaining the Catholic Missal API data.
+
+Usage:
+    python -m app.cli reparse [--workers N] [--start YYYY-MM-DD] [--end YYYY-MM-DD]
+    python -m app.cli backfill START END [--concurrency N] [--rate R] [--batch-size N]
+    python -m app.cli build-corpus [--output PATH]
+    python -m app.cli export-calendar START_YEAR END_YEAR [--format parquet|arrow] [--region CODE] [--output PATH]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from datetime import datetime, date
+from typing import List, Optional
+
+from .core.config import settings
+
+
+def _parse_date(value: str) -> date:
+    """argparse type for YYYY-MM-DD dates."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError("Invalid date format. Use YYYY-MM-DD (e.g., 2024-12-25)")
+
+
+def reparse_command(args: argparse.Namespace) -> int:
+    """Rebuild parsed readings from the raw page archive."""
+    from .services.archive import HTMLArchive
+    from .services.batch import reparse_archive
+    from .services.storage import ReadingsStore
+
+    started = time.monotonic()
+    store = ReadingsStore()
+    try:
+        stats = reparse_archive(
+            HTMLArchive(args.archive_dir),
+            store,
+            workers=args.workers,
+            start=args.start,
+            end=args.end,
+        )
+    finally:
+        store.close()
+    elapsed = time.monotonic() - started
+
+    print(
+        f"Re-parsed {stats['pages']} archived pages in {elapsed:.1f}s: "
+        f"{stats['parsed']} parsed, {stats['empty']} empty, {stats['errors']} errors"
+    )
+    return 1 if stats["errors"] else 0
+
+
+def backfill_command(args: argparse.Namespace) -> int:
+    """Fetch readings for a date range into the persistent store."""
+    from .services.batch import backfill_readings
+    from .services.data_sources import DataSourceManager
+
+    if args.end < args.start:
+        print("Start date must be before or equal to end date", file=sys.stderr)
+        return 2
+    if args.rate <= 0 or args.concurrency < 1:
+        print("--rate must be positive and --concurrency at least 1", file=sys.stderr)
+        return 2
+
+    def progress(stats):
+        print(
+            f"{stats['fetched']} fetched, {stats['empty']} empty, {stats['errors']} errors "
+            f"of {stats['dates']} dates ({stats['dates_per_second']:.2f} dates/sec)",
+            flush=True,
+        )
+
+    async def run():
+        manager = DataSourceManager()
+        try:
+            return await backfill_readings(
+                manager,
+                args.start,
+                args.end,
+                checkpoint_path=args.checkpoint,
+                concurrency=args.concurrency,
+                rate=args.rate,
+                batch_size=args.batch_size,
+                skip_existing=not args.refetch,
+                progress=progress,
+            )
+        finally:
+            await manager.close()
+
+    stats = asyncio.run(run())
+    print(
+        f"Backfill finished in {stats['elapsed']:.1f}s: {stats['fetched']} fetched, "
+        f"{stats['empty']} empty, {stats['errors']} errors "
+        f"({stats['dates_per_second']:.2f} dates/sec)"
+    )
+    return 1 if stats["errors"] else 0
+
+
+def build_corpus_command(args: argparse.Namespace) -> int:
+    """Compile the stored readings into a memory-mappable corpus file."""
+    from .services.corpus import write_corpus
+    from .services.storage import ReadingsStore
+
+    started = time.monotonic()
+    store = ReadingsStore()
+    try:
+        count = write_corpus(args.output, store.iter_json())
+    finally:
+        store.close()
+    elapsed = time.monotonic() - started
+
+    print(f"Compiled {count} dates into {args.output} in {elapsed:.1f}s")
+    return 0
+
+
+def export_calendar_command(args: argparse.Namespace) -> int:
+    """Export liturgical days for a range of years as Parquet or Arrow IPC."""
+    from .services.columnar import columnar_available, write_columnar
+    from .services.regions import REGIONS, UNIVERSAL
+
+    if not columnar_available():
+        print("Columnar exports require the optional pyarrow package", file=sys.stderr)
+        return 2
+    if args.end_year < args.start_year:
+        print("Start year must be before or equal to end year", file=sys.stderr)
+        return 2
+    if args.region not in (None, UNIVERSAL) and args.region not in REGIONS:
+        print(f"Unknown region: {args.region}. Available: {', '.join([UNIVERSAL] + sorted(REGIONS))}",
+              file=sys.stderr)
+        return 2
+
+    output = args.output or f"liturgical-calendar-{args.start_year}-{args.end_year}.{args.format}"
+    started = time.monotonic()
+    size = write_columnar(output, args.start_year, args.end_year, args.format, args.region)
+    elapsed = time.monotonic() - started
+
+    print(
+        f"Exported {args.end_year - args.start_year + 1} years to {output} "
+        f"({size} bytes) in {elapsed:.1f}s"
+    )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all commands."""
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    reparse = commands.add_parser("reparse", help="Rebuild parsed readings from archived pages (no network)")
+    reparse.add_argument("--archive-dir", default=settings.ARCHIVE_DIR, help="Archive directory")
+    reparse.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    reparse.add_argument("--start", type=_parse_date, default=None, help="First date to re-parse")
+    reparse.add_argument("--end", type=_parse_date, default=None, help="Last date to re-parse")
+    reparse.set_defaults(handler=reparse_command)
+
+    backfill = commands.add_parser("backfill", help="Fetch readings for a date range into the store (resumable)")
+    backfill.add_argument("start", type=_parse_date, help="First date (YYYY-MM-DD)")
+    backfill.add_argument("end", type=_parse_date, help="Last date (YYYY-MM-DD)")
+    backfill.add_argument("--concurrency", type=int, default=settings.BACKFILL_CONCURRENCY,
+                          help="Requests in flight at once")
+    backfill.add_argument("--rate", type=float, default=settings.BACKFILL_RATE,
+                          help="Upstream requests per second")
+    backfill.add_argument("--batch-size", type=int, default=settings.BACKFILL_BATCH_SIZE,
+                          help="Readings written per store transaction")
+    backfill.add_argument("--checkpoint", default=settings.BACKFILL_CHECKPOINT, help="Checkpoint file")
+    backfill.add_argument("--refetch", action="store_true", help="Fetch dates already in the store again")
+    backfill.set_defaults(handler=backfill_command)
+
+    build_corpus = commands.add_parser("build-corpus", help="Compile stored readings into a memory-mapped corpus")
+    build_corpus.add_argument("--output", default=settings.READINGS_CORPUS_PATH, help="Corpus file to write")
+    build_corpus.set_defaults(handler=build_corpus_command)
+
+    export = commands.add_parser("export-calendar", help="Export liturgical days as Parquet or Arrow IPC")
+    export.add_argument("start_year", type=int, help="First year")
+    export.add_argument("end_year", type=int, help="Last year")
+    export.add_argument("--format", choices=["parquet", "arrow"], default="parquet", help="Output format")
+    export.add_argument("--region", default=None, help="Regional calendar (default: universal)")
+    export.add_argument("--output", default=None, help="File to write")
+    export.set_defaults(handler=export_calendar_command)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a command line tool."""
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""
+Request parameters and attribution shared by the endpoints that answer from
+the liturgical calendar (/calendar and the daily /prayers), so neither router
+has to import the other.
+"""
+
+from typing import Optional
+
+from fastapi import HTTPException, Query
+
+from ..services.regions import REGIONS, UNIVERSAL
+
+CALENDAR_ATTRIBUTION = (
+    "Data sources: USCCB (United States Conference of Catholic Bishops), "
+    "Vatican Official Sources, Catholic Missal API Liturgical Calculator. "
+    "Used in accordance with fair use and educational purposes."
+)
+
+
+async def get_region(
+    region: Optional[str] = Query(
+        None,
+        description="Regional calendar to follow, e.g. 'us'. Defaults to the universal calendar."
+    )
+) -> Optional[str]:
+    """Dependency validating the region query parameter."""
+    if region is None or region == UNIVERSAL:
+        return None
+    if region not in REGIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown region: {region}. "
+                   f"Available: {', '.join([UNIVERSAL] + sorted(REGIONS))}"
+        )
+    return region
@@ -0,0 +1,305 @@
+"""
+Response compression with precompressed cache entries.
+
+Responses are compressed with brotli (when the optional `brotli` package is
+installed) or gzip, depending on the client's Accept-Encoding. Endpoints mark
+responses that are safe to share by sending `Cache-Control: public,
+max-age=N`; those responses are kept in an in-memory cache together with each
+compressed variant, so an entry is rendered and compressed once and then
+served to every client as finished bytes. Conditional requests matching the
+ETag of a cached response are answered with 304 Not Modified.
+"""
+
+import gzip
+import re
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # Optional dependency; gzip is always available
+    brotli = None
+
+from .config import settings
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/xml")
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+def cache_control(max_age: int) -> str:
+    """Cache-Control value marking a response as cacheable by this middleware and clients."""
+    return f"public, max-age={max_age}"
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header matches an entity tag (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    tag = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == tag:
+            return True
+    return False
+
+
+def negotiate_encoding(accept_encoding: str) -> str:
+    """Pick the best supported encoding from an Accept-Encoding header."""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name] = quality
+
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return "identity"
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress a complete body."""
+    if encoding == "br":
+        return brotli.compress(data, quality=5)
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    return data
+
+
+class _StreamCompressor:
+    """Incremental compressor that flushes after every chunk."""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=5)
+        else:
+            self._compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        self.encoding = encoding
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class CachedResponse:
+    """A finished response body with its compressed variants."""
+
+    __slots__ = ("status", "headers", "bodies", "expires")
+
+    def __init__(self, status: int, headers: List[Tuple[bytes, bytes]], body: bytes, expires: float):
+        self.status = status
+        self.headers = headers
+        self.bodies: Dict[str, bytes] = {"identity": body}
+        self.expires = expires
+
+    def body(self, encoding: str) -> bytes:
+        """Get the body in an encoding, compressing it on first use only."""
+        if encoding not in self.bodies:
+            self.bodies[encoding] = compress(self.bodies["identity"], encoding)
+        return self.bodies[encoding]
+
+
+class ResponseCache:
+    """Bounded LRU cache of finished responses keyed by request path and query."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CachedResponse):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CompressionMiddleware:
+    """ASGI middleware negotiating gzip/brotli and caching public responses."""
+
+    def __init__(self, app, minimum_size: Optional[int] = None, cache_entries: Optional[int] = None):
+        self.app = app
+        self.minimum_size = minimum_size if minimum_size is not None else settings.COMPRESSION_MIN_SIZE
+        self.cache = ResponseCache(
+            cache_entries if cache_entries is not None else settings.RESPONSE_CACHE_ENTRIES
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = ""
+        if_none_match = None
+        for name, value in scope.get("headers", []):
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+            elif name == b"if-none-match":
+                if_none_match = value.decode("latin-1")
+        encoding = negotiate_encoding(accept_encoding)
+
+        key = None
+        if scope["method"] == "GET":
+            key = scope["path"] + "?" + scope.get("query_string", b"").decode("latin-1")
+            entry = self.cache.get(key)
+            if entry is not None:
+                if if_none_match is not None and self._not_modified(entry, if_none_match):
+                    await self._send_not_modified(send, entry)
+                    return
+                await self._send_cached(send, entry, encoding)
+                return
+
+        responder = _Responder(self, send, encoding, key)
+        await self.app(scope, receive, responder.send)
+
+    async def _send_cached(self, send, entry: CachedResponse, encoding: str):
+        """Send a cached response, compressed if worthwhile."""
+        body = entry.bodies["identity"]
+        if not self._should_compress(entry.headers, len(body)):
+            encoding = "identity"
+        body = entry.body(encoding)
+
+        headers = list(entry.headers)
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        headers.append((b"vary", b"Accept-Encoding"))
+        if encoding != "identity":
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+
+        await send({"type": "http.response.start", "status": entry.status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    def _not_modified(self, entry: CachedResponse, if_none_match: str) -> bool:
+        """Whether a conditional request matches the ETag of a cached response."""
+        for name, value in entry.headers:
+            if name == b"etag":
+                return etag_matches(if_none_match, value.decode("latin-1"))
+        return False
+
+    async def _send_not_modified(self, send, entry: CachedResponse):
+        """Answer a conditional request for a cached response with 304."""
+        headers = [
+            (name, value) for name, value in entry.headers
+            if name in (b"etag", b"cache-control", b"last-modified")
+        ]
+        headers.append((b"vary", b"Accept-Encoding"))
+        await send({"type": "http.response.start", "status": 304, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+    def _should_compress(self, headers: List[Tuple[bytes, bytes]], size: Optional[int]) -> bool:
+        """Whether a response with these headers and size should be compressed."""
+        content_type = b""
+        for name, value in headers:
+            if name == b"content-encoding":
+                return False
+            if name == b"content-type":
+                content_type = value
+        if size is not None and size < self.minimum_size:
+            return False
+        return content_type.decode("latin-1").startswith(COMPRESSIBLE_TYPES)
+
+
+class _Responder:
+    """Intercepts one response on its way out of the application."""
+
+    def __init__(self, middleware: CompressionMiddleware, send, encoding: str, key: Optional[str]):
+        self.middleware = middleware
+        self._send = send
+        self.encoding = encoding
+        self.key = key
+        self.start: Optional[dict] = None
+        self.streaming: Optional[_StreamCompressor] = None
+        self.started = False
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.started:
+            await self._send_chunk(body, more_body)
+            return
+
+        self.started = True
+        headers = [
+            (name, value) for name, value in self.start.get("headers", [])
+            if name != b"content-length" and not (name == b"vary" and value.lower() == b"accept-encoding")
+        ]
+
+        if more_body:
+            # Streaming response: compress incrementally, chunk by chunk
+            if self.encoding != "identity" and self.middleware._should_compress(headers, None):
+                self.streaming = _StreamCompressor(self.encoding)
+                headers.append((b"content-encoding", self.encoding.encode("latin-1")))
+            headers.append((b"vary", b"Accept-Encoding"))
+            await self._send({**self.start, "headers": headers})
+            await self._send_chunk(body, more_body)
+            return
+
+        max_age = self._cacheable_max_age()
+        entry = CachedResponse(self.start["status"], headers, body, time.monotonic() + (max_age or 0))
+        if max_age:
+            self.middleware.cache.put(self.key, entry)
+        await self.middleware._send_cached(self._send, entry, self.encoding)
+
+    async def _send_chunk(self, body: bytes, more_body: bool):
+        if self.streaming is not None:
+            body = self.streaming.chunk(body) if body else b""
+            if not more_body:
+                body += self.streaming.finish()
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    def _cacheable_max_age(self) -> Optional[int]:
+        """The max-age of a public 200 response to a GET, if it may be cached."""
+        if self.key is None or self.start["status"] != 200:
+            return None
+        max_age = None
+        for name, value in self.start.get("headers", []):
+            if name == b"set-cookie":
+                return None
+            if name == b"vary" and value.lower() != b"accept-encoding":
+                # Entries are keyed by URL only, so variants by other headers are not shared
+                return None
+            if name == b"cache-control":
+                control = value.decode("latin-1")
+                match = _MAX_AGE.search(control)
+                if "public" in control and match:
+                    max_age = min(int(match.group(1)), settings.RESPONSE_CACHE_TIME)
+        return max_age
@@ -13,6 +13,8 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "Catholic Missal API"
     VERSION: str = "1.0.0"
+    # Routers to serve; others are never imported (e.g. ["calendar"] for a calendar-only worker)
+    API_ROUTERS: List[str] = ["calendar", "readings", "prayers", "documents", "search"]
     
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = ["*"]
@@ -23,15 +25,60 @@ class Settings(BaseSettings):
     
     # Rate Limiting (requests per minute)
     RATE_LIMIT_REQUESTS: int = 60
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BURST: int = 20  # Requests a client may make back-to-back
+    RATE_LIMIT_MAX_CLIENTS: int = 10000  # Buckets tracked before the oldest are evicted
+    RATE_LIMIT_API_KEY_HEADER: str = "X-API-Key"
+    RATE_LIMIT_API_KEYS: List[str] = []  # Keys given their own bucket; other clients are limited by IP
+    RATE_LIMIT_TRUST_FORWARDED: bool = False  # Use X-Forwarded-For behind a trusted proxy
+    
+    # Load shedding
+    MAX_CONCURRENT_REQUESTS: int = 100
     
     # Cache Settings (in seconds)
     CACHE_EXPIRE_TIME: int = 3600  # 1 hour
     READINGS_CACHE_TIME: int = 86400  # 24 hours
     CALENDAR_CACHE_TIME: int = 86400  # 24 hours
+    DOCUMENTS_CACHE_TIME: int = 604800  # 1 week, then revalidated with the source
+    
+    # Response compression and caching of public responses
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 500  # Bytes; smaller responses are sent as-is
+    RESPONSE_CACHE_ENTRIES: int = 2048
+    RESPONSE_CACHE_TIME: int = 86400  # Upper bound on any cached response's lifetime
     
     # Database (if needed for caching/storage)
     DATABASE_URL: Optional[str] = "sqlite:///./catholic_missal.db"
     
+    # Raw upstream page archive (for re-parsing without refetching)
+    ARCHIVE_ENABLED: bool = True
+    ARCHIVE_DIR: str = "./data/archive"
+    
+    # Compiled readings corpus (python -m app.cli build-corpus); used when present
+    READINGS_CORPUS_PATH: str = "./data/readings.corpus"
+    
+    # Readings range limits (days); streamed NDJSON responses allow longer ranges
+    READINGS_RANGE_MAX_DAYS: int = 31
+    READINGS_STREAM_MAX_DAYS: int = 400
+    READINGS_STREAM_MAX_FETCHES: int = 120  # Upstream fetches per stream, enough for any season; the rest are listed as not fetched
+    
+    # Columnar calendar exports (GET /calendar/export, python -m app.cli export-calendar)
+    CALENDAR_EXPORT_MAX_YEARS: int = 200
+    
+    # Search (GET /search)
+    SEARCH_MAX_PAGE_SIZE: int = 100
+    
+    # Batch lookups (POST /calendar/batch, /readings/batch)
+    BATCH_MAX_DATES: int = 366
+    BATCH_CONCURRENCY: int = 8  # Readings lookups in flight per batch
+    BATCH_MAX_FETCHES: int = 10  # Upstream fetches per batch; other uncached dates are listed as not fetched
+    
+    # Backfill (python -m app.cli backfill)
+    BACKFILL_CONCURRENCY: int = 4
+    BACKFILL_RATE: float = 2.0  # Upstream requests per second
+    BACKFILL_BATCH_SIZE: int = 50
+    BACKFILL_CHECKPOINT: str = "./data/backfill-checkpoint.json"
+    
     # Logging
     LOG_LEVEL: str = "INFO"
     
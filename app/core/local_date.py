@@ -0,0 +1,109 @@
+"""
+Time-zone aware "today".
+
+Clients may pass `?tz=America/Chicago` (or an `X-Timezone` header) so that
+"today" is their local date rather than the server's. Zone lookups are
+cached per process.
+
+"Today" URLs are answered by the date they resolve to: the middleware here
+rewrites e.g. /calendar/today?tz=Asia/Manila to /calendar/2024-12-25 before
+routing, so every zone on the same date shares one response cache entry,
+and strips Cache-Control on the way out, since the meaning of a "today" URL
+changes at midnight.
+"""
+
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from fastapi import Header, HTTPException, Query
+
+TIMEZONE_HEADER = b"x-timezone"
+
+
+@lru_cache(maxsize=512)
+def get_zone(name: str) -> ZoneInfo:
+    """
+    Look up a time zone by IANA name, e.g. 'Europe/Rome'.
+
+    Raises ValueError for unknown zones.
+    """
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError, OSError):
+        raise ValueError(f"Unknown time zone: {name}")
+
+
+def local_today(tz: Optional[str] = None) -> date:
+    """Today's date in a time zone, or on the server's clock without one."""
+    if not tz:
+        return date.today()
+    return datetime.now(get_zone(tz)).date()
+
+
+async def get_today(
+    tz: Optional[str] = Query(
+        None,
+        description="IANA time zone for 'today', e.g. 'America/Chicago'. Defaults to the server's."
+    ),
+    x_timezone: Optional[str] = Header(None)
+) -> date:
+    """Dependency resolving 'today' from the tz query parameter or X-Timezone header."""
+    try:
+        return local_today(tz or x_timezone)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+class LocalDateMiddleware:
+    """
+    Serves "today" paths as the date paths they resolve to.
+
+    `paths` maps each "today" path to a template of its dated path, e.g.
+    {"/api/v1/calendar/today": "/api/v1/calendar/{date}"}. Requests with an
+    unknown zone are passed through unchanged, for the endpoint to reject.
+    """
+
+    def __init__(self, app, paths: Dict[str, str]):
+        self.app = app
+        self.paths = paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD") or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        query = parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+        tz = next((value for name, value in query if name == "tz"), None)
+        if tz is None:
+            for name, value in scope.get("headers", []):
+                if name == TIMEZONE_HEADER:
+                    tz = value.decode("latin-1")
+        try:
+            today = local_today(tz)
+        except ValueError:
+            await self.app(scope, receive, send)
+            return
+
+        path = self.paths[scope["path"]].format(date=today.isoformat())
+        scope = {
+            **scope,
+            "path": path,
+            "raw_path": path.encode("latin-1"),
+            "query_string": urlencode([(name, value) for name, value in query if name != "tz"]).encode("latin-1"),
+        }
+
+        async def send_uncached(message):
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": [
+                        (name, value) for name, value in message.get("headers", [])
+                        if name not in (b"cache-control", b"etag")
+                    ],
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_uncached)
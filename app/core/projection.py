@@ -0,0 +1,102 @@
+"""
+Sparse fieldsets for API responses.
+
+Clients may pass `?fields=season,color,readings.gospel.reference` to receive
+only those fields. Paths are validated against the response model and turned
+into a Pydantic `include` tree, so unrequested subtrees are never encoded.
+"""
+
+from typing import Any, Dict, Optional, Type
+
+from fastapi import HTTPException, Query
+from fastapi.responses import Response
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_SINGLETON
+
+
+def build_include(model: Type[BaseModel], fields: str) -> Dict[str, Any]:
+    """
+    Convert a comma-separated list of dotted field paths into an include tree.
+
+    Raises ValueError for paths that do not exist on the model.
+    """
+    include: Dict[str, Any] = {}
+
+    for path in fields.split(","):
+        path = path.strip()
+        if not path:
+            continue
+
+        current_model: Optional[Type[BaseModel]] = model
+        node = include
+        parts = path.split(".")
+
+        for position, name in enumerate(parts):
+            field = current_model.__fields__.get(name) if current_model else None
+            if field is None:
+                raise ValueError(f"Unknown field '{path}'")
+
+            if position == len(parts) - 1:
+                # The whole subtree was requested
+                node[name] = ...
+                break
+
+            if node.get(name) is ...:
+                # A parent path already requested the whole subtree
+                break
+
+            child = node.setdefault(name, {})
+            if field.shape != SHAPE_SINGLETON:
+                # Lists of models are projected element by element
+                child = child.setdefault("__all__", {})
+            node = child
+
+            nested = field.type_
+            current_model = nested if isinstance(nested, type) and issubclass(nested, BaseModel) else None
+
+    return include
+
+
+def requests_field(include: Optional[Dict[str, Any]], name: str) -> bool:
+    """Whether a projection (or no projection) asks for a top-level field."""
+    return include is None or name in include
+
+
+class FieldsQuery:
+    """
+    Dependency parsing the `fields` query parameter for a model.
+
+    Resolves to None when no projection was requested.
+    """
+
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+
+    def __call__(
+        self,
+        fields: Optional[str] = Query(
+            None,
+            description="Comma-separated fields to return, using dots for nested fields "
+                        "(e.g. season,color,readings.gospel.reference)"
+        )
+    ) -> Optional[Dict[str, Any]]:
+        if not fields:
+            return None
+        try:
+            include = build_include(self.model, fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return include or None
+
+
+def projected_response(
+    response: BaseModel,
+    include: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Encode a response envelope with only the included fields."""
+    return Response(
+        content=response.json(include=include),
+        media_type="application/json",
+        headers=headers
+    )
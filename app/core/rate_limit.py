@@ -0,0 +1,135 @@
+"""
+Inbound rate limiting and load shedding.
+
+Each client (identified by a known API key, or else by IP address) gets a
+token bucket that refills at RATE_LIMIT_REQUESTS per minute. Only keys listed
+in RATE_LIMIT_API_KEYS get their own bucket, so clients cannot escape their
+limit, or evict other clients' buckets, by sending made-up keys. A global
+concurrency limit rejects requests immediately once the server is saturated,
+so latency stays bounded instead of growing with the queue. Requests shed
+that way do not count against the client's rate limit.
+"""
+
+import json
+import math
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+from .config import settings
+
+
+class RateLimiter:
+    """Per-client token buckets with a bounded number of tracked clients."""
+
+    def __init__(self, requests_per_minute: int, burst: int, max_clients: int = 10000):
+        self.rate = requests_per_minute / 60.0
+        self.burst = max(1, burst)
+        self.max_clients = max_clients
+        # client key -> (tokens, last refill time); least recently seen first
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def acquire(self, key: str, now: Optional[float] = None) -> float:
+        """
+        Take one token from the client's bucket.
+
+        Returns 0 if the request is allowed, otherwise the number of seconds
+        until a token becomes available.
+        """
+        if now is None:
+            now = time.monotonic()
+
+        tokens, updated = self._buckets.pop(key, (float(self.burst), now))
+        tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+
+        if tokens >= 1:
+            tokens -= 1
+            wait = 0.0
+        else:
+            wait = (1 - tokens) / self.rate if self.rate > 0 else 60.0
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+
+        return wait
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware applying per-client rate limits and a global concurrency cap.
+
+    Only paths under API_V1_STR are limited; documentation and the welcome
+    page are always served.
+    """
+
+    def __init__(
+        self,
+        app,
+        limiter: Optional[RateLimiter] = None,
+        max_concurrent: Optional[int] = None,
+        path_prefix: Optional[str] = None,
+        api_keys: Optional[Iterable[str]] = None,
+    ):
+        self.app = app
+        self.limiter = limiter or RateLimiter(
+            settings.RATE_LIMIT_REQUESTS,
+            settings.RATE_LIMIT_BURST,
+            settings.RATE_LIMIT_MAX_CLIENTS,
+        )
+        self.max_concurrent = max_concurrent or settings.MAX_CONCURRENT_REQUESTS
+        self.path_prefix = path_prefix if path_prefix is not None else settings.API_V1_STR
+        self.api_key_header = settings.RATE_LIMIT_API_KEY_HEADER.lower().encode("latin-1")
+        self.api_keys = frozenset(api_keys if api_keys is not None else settings.RATE_LIMIT_API_KEYS)
+        self.active = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        if self.active >= self.max_concurrent:
+            await self._reject(send, 503, "Server is busy, please retry shortly", 1)
+            return
+
+        wait = self.limiter.acquire(self._client_key(scope))
+        if wait > 0:
+            await self._reject(send, 429, "Rate limit exceeded", math.ceil(wait))
+            return
+
+        self.active += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.active -= 1
+
+    def _client_key(self, scope) -> str:
+        """Identify the client by known API key, forwarded address or peer address."""
+        forwarded = None
+        for name, value in scope.get("headers", []):
+            if name == self.api_key_header and value:
+                key = value.decode("latin-1")
+                if key in self.api_keys:
+                    return "key:" + key
+            elif name == b"x-forwarded-for":
+                forwarded = value
+
+        if forwarded and settings.RATE_LIMIT_TRUST_FORWARDED:
+            return "ip:" + forwarded.decode("latin-1").split(",")[0].strip()
+
+        client = scope.get("client")
+        return "ip:" + (client[0] if client else "unknown")
+
+    async def _reject(self, send, status: int, detail: str, retry_after: int):
+        """Send a small JSON error without touching the application."""
+        body = json.dumps({"detail": detail}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(retry_after).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -20,13 +20,16 @@ All liturgical texts are used in accordance with Church policies.
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
+import importlib
 import uvicorn
 from datetime import datetime, date
 from typing import Optional, List
 
-from .routers import calendar, readings, prayers
 from .models.responses import APIInfo
 from .core.config import settings
+from .core.compression import CompressionMiddleware
+from .core.local_date import LocalDateMiddleware
+from .core.rate_limit import RateLimitMiddleware
 
 app = FastAPI(
     title="Catholic Missal API",
@@ -42,6 +45,22 @@ app = FastAPI(
     },
 )
 
+# Compression and cached public responses (innermost, so cache hits are still rate limited)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# "Today" paths are served as the date they resolve to in the client's time
+# zone (outside compression, so all zones on a date share one cached response)
+app.add_middleware(LocalDateMiddleware, paths={
+    "/api/v1/calendar/today": "/api/v1/calendar/{date}",
+    "/api/v1/readings/today": "/api/v1/readings/{date}",
+    "/api/v1/prayers/today": "/api/v1/prayers/for/{date}",
+})
+
+# Rate limiting and load shedding (added before CORS so CORS headers wrap its rejections)
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -51,10 +70,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Routers by module name, with their prefix and tag. Only the modules listed
+# in API_ROUTERS are imported, so workers serving a subset of the API start faster.
+ROUTERS = {
+    "calendar": ("/api/v1/calendar", "Calendar"),
+    "readings": ("/api/v1/readings", "Readings"),
+    "prayers": ("/api/v1/prayers", "Prayers"),
+    "documents": ("/api/v1/documents", "Documents"),
+    "search": ("/api/v1/search", "Search"),
+}
+
 # Include routers
-app.include_router(calendar.router, prefix="/api/v1/calendar", tags=["Calendar"])
-app.include_router(readings.router, prefix="/api/v1/readings", tags=["Readings"])
-app.include_router(prayers.router, prefix="/api/v1/prayers", tags=["Prayers"])
+for name in settings.API_ROUTERS:
+    if name not in ROUTERS:
+        raise ValueError(f"Unknown router in API_ROUTERS: {name}. Available: {', '.join(ROUTERS)}")
+    prefix, tag = ROUTERS[name]
+    module = importlib.import_module(f".routers.{name}", __package__)
+    app.include_router(module.router, prefix=prefix, tags=[tag])
 
 @app.get("/", response_class=HTMLResponse)
 async def root():
@@ -119,7 +151,9 @@ async def get_api_info():
             "/api/v1/calendar/today",
             "/api/v1/readings/today", 
             "/api/v1/calendar/{date}",
-            "/api/v1/readings/{date}"
+            "/api/v1/readings/{date}",
+            "/api/v1/documents",
+            "/api/v1/search"
         ]
     )
 
@@ -0,0 +1,168 @@
+"""
+Compact internal representations of liturgical data.
+
+Caches and per-year calendar tables hold these slotted, immutable records
+instead of Pydantic models: no per-instance __dict__, repeated strings are
+interned, and a reading's citation is only stored when it differs from its
+reference. They are converted to the Pydantic models in liturgical.py only
+when a response is built.
+"""
+
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional, Tuple
+
+from .liturgical import (
+    LiturgicalSeason, LiturgicalRank, LiturgicalColor,
+    Reading, Psalm, DailyReadings, Celebration, LiturgicalDay
+)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class CompactReading:
+    """A single scripture reading."""
+    reference: str
+    source: str
+    text: Optional[str] = None
+    short_text: Optional[str] = None
+    citation: Optional[str] = None  # Only set when different from reference
+
+    @classmethod
+    def from_model(cls, reading: Optional[Reading]) -> Optional["CompactReading"]:
+        if reading is None:
+            return None
+        return cls(
+            reference=reading.reference,
+            source=_intern(reading.source),
+            text=reading.text,
+            short_text=reading.short_text,
+            citation=reading.citation if reading.citation != reading.reference else None,
+        )
+
+    def to_model(self) -> Reading:
+        return Reading(
+            reference=self.reference,
+            citation=self.citation or self.reference,
+            text=self.text,
+            short_text=self.short_text,
+            source=self.source,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompactPsalm:
+    """Responsorial psalm."""
+    reference: str
+    source: str
+    refrain: Optional[str] = None
+    verses: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def from_model(cls, psalm: Optional[Psalm]) -> Optional["CompactPsalm"]:
+        if psalm is None:
+            return None
+        return cls(
+            reference=psalm.reference,
+            source=_intern(psalm.source),
+            refrain=psalm.refrain,
+            verses=tuple(psalm.verses) if psalm.verses is not None else None,
+        )
+
+    def to_model(self) -> Psalm:
+        return Psalm(
+            reference=self.reference,
+            refrain=self.refrain,
+            verses=list(self.verses) if self.verses is not None else None,
+            source=self.source,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompactReadings:
+    """Complete set of readings for a day."""
+    date: date
+    source: str
+    last_updated: datetime
+    first_reading: Optional[CompactReading] = None
+    responsorial_psalm: Optional[CompactPsalm] = None
+    second_reading: Optional[CompactReading] = None
+    gospel_acclamation: Optional[str] = None
+    gospel: Optional[CompactReading] = None
+
+    @classmethod
+    def from_model(cls, readings: DailyReadings) -> "CompactReadings":
+        return cls(
+            date=readings.date,
+            source=_intern(readings.source),
+            last_updated=readings.last_updated,
+            first_reading=CompactReading.from_model(readings.first_reading),
+            responsorial_psalm=CompactPsalm.from_model(readings.responsorial_psalm),
+            second_reading=CompactReading.from_model(readings.second_reading),
+            gospel_acclamation=readings.gospel_acclamation,
+            gospel=CompactReading.from_model(readings.gospel),
+        )
+
+    def to_model(self) -> DailyReadings:
+        return DailyReadings(
+            date=self.date,
+            first_reading=self.first_reading.to_model() if self.first_reading else None,
+            responsorial_psalm=self.responsorial_psalm.to_model() if self.responsorial_psalm else None,
+            second_reading=self.second_reading.to_model() if self.second_reading else None,
+            gospel_acclamation=self.gospel_acclamation,
+            gospel=self.gospel.to_model() if self.gospel else None,
+            source=self.source,
+            last_updated=self.last_updated,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompactCelebration:
+    """A liturgical celebration; instances are shared by every date they fall on."""
+    name: str
+    rank: LiturgicalRank
+    color: LiturgicalColor
+    description: Optional[str] = None
+    proper_readings: bool = False
+    precedence: Optional[int] = None  # Table of Liturgical Days; derived from rank when None
+
+    def to_model(self) -> Celebration:
+        return Celebration(
+            name=self.name,
+            rank=self.rank,
+            color=self.color,
+            description=self.description,
+            proper_readings=self.proper_readings,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompactDay:
+    """One entry of a per-year calendar table (the date is its position)."""
+    season: LiturgicalSeason
+    season_week: Optional[int]
+    celebrations: Tuple[CompactCelebration, ...]
+    color: LiturgicalColor
+    sunday_cycle: Optional[str] = None
+    weekday_cycle: Optional[str] = None
+    psalter_week: Optional[int] = None
+
+    def to_model(self, target_date: date, source: str) -> LiturgicalDay:
+        celebrations = [c.to_model() for c in self.celebrations]
+        return LiturgicalDay(
+            date=target_date,
+            season=self.season,
+            season_week=self.season_week,
+            sunday_cycle=self.sunday_cycle,
+            weekday_cycle=self.weekday_cycle,
+            psalter_week=self.psalter_week,
+            weekday=target_date.strftime("%A"),
+            celebrations=celebrations,
+            primary_celebration=celebrations[0] if celebrations else None,
+            color=self.color,
+            source=source,
+        )
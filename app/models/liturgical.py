@@ -81,6 +81,9 @@ class LiturgicalDay(BaseModel):
     date: date = Field(..., description="Calendar date")
     season: LiturgicalSeason = Field(..., description="Liturgical season")
     season_week: Optional[int] = Field(None, description="Week number in the season")
+    sunday_cycle: Optional[str] = Field(None, description="Sunday lectionary cycle (A, B or C)")
+    weekday_cycle: Optional[str] = Field(None, description="Weekday lectionary cycle (I or II)")
+    psalter_week: Optional[int] = Field(None, description="Liturgy of the Hours psalter week (1-4)")
     weekday: str = Field(..., description="Day of the week")
     celebrations: List[Celebration] = Field(default_factory=list, description="Celebrations for this day")
     primary_celebration: Optional[Celebration] = Field(None, description="Primary celebration")
@@ -100,6 +103,14 @@ class Prayer(BaseModel):
     copyright_notice: Optional[str] = Field(None, description="Copyright information")
 
 
+class LiturgicalDocument(BaseModel):
+    """Summary of an official liturgical document."""
+    title: str = Field(..., description="Document title")
+    url: str = Field(..., description="URL of the full document")
+    content: str = Field(..., description="Truncated document text")
+    source: str = Field(..., description="Source of the document")
+
+
 class MissalPart(BaseModel):
     """Part of the Mass from the Missal."""
     name: str = Field(..., description="Name of the part")
@@ -0,0 +1,19 @@
+"""
+Request models for the API.
+"""
+
+from pydantic import BaseModel, Field
+from datetime import date
+from typing import List
+
+from ..core.config import settings
+
+
+class BatchDatesRequest(BaseModel):
+    """Batch lookup request for many arbitrary dates."""
+    dates: List[date] = Field(
+        ...,
+        min_items=1,
+        max_items=settings.BATCH_MAX_DATES,
+        description="Dates to look up (YYYY-MM-DD), in the order results should be returned"
+    )
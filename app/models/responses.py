@@ -5,7 +5,7 @@ Response models for the API.
 from pydantic import BaseModel, Field
 from datetime import datetime, date
 from typing import List, Optional, Dict, Any
-from .liturgical import LiturgicalDay, DailyReadings, Prayer, MissalPart
+from .liturgical import LiturgicalDay, DailyReadings, Prayer, MissalPart, LiturgicalDocument
 
 
 class APIInfo(BaseModel):
@@ -45,6 +45,69 @@ class ReadingsResponse(BaseModel):
     source_attribution: str = Field(..., description="Data source attribution")
 
 
+class CalendarBatchResponse(BaseModel):
+    """Batch calendar endpoint response."""
+    liturgical_days: List[LiturgicalDay] = Field(..., description="Liturgical days, in request order")
+    not_fetched: List[str] = Field(
+        [],
+        description="Dates (YYYY-MM-DD) left without readings because the request reached its "
+                    "upstream fetch limit; ask for them again later"
+    )
+    success: bool = Field(True)
+    source_attribution: str = Field(..., description="Data source attribution")
+
+
+class ReadingsBatchResponse(BaseModel):
+    """Batch readings endpoint response."""
+    readings: List[DailyReadings] = Field(..., description="Daily readings, in request order")
+    not_fetched: List[str] = Field(
+        [],
+        description="Dates (YYYY-MM-DD) left without readings because the request reached its "
+                    "upstream fetch limit; ask for them again later"
+    )
+    success: bool = Field(True)
+    source_attribution: str = Field(..., description="Data source attribution")
+
+
+class SearchResult(BaseModel):
+    """One search match."""
+    kind: str = Field(..., description="Kind of document: 'prayer' or 'reading'")
+    title: str = Field(..., description="Title of the match")
+    excerpt: str = Field(..., description="Beginning of the matching text")
+    score: float = Field(..., description="Relevance score (higher is better)")
+    name: Optional[str] = Field(None, description="Prayer name")
+    category: Optional[str] = Field(None, description="Prayer category")
+    language: Optional[str] = Field(None, description="Prayer language code")
+    date: Optional[str] = Field(None, description="Date of the reading (YYYY-MM-DD)")
+    part: Optional[str] = Field(None, description="Part of the Mass readings (e.g., 'gospel')")
+    reference: Optional[str] = Field(None, description="Scripture reference of the reading")
+
+
+class SearchResponse(BaseModel):
+    """Search endpoint response."""
+    query: str = Field(..., description="The search query")
+    total: int = Field(..., description="Total number of matches")
+    page: int = Field(..., description="Page number (from 1)")
+    page_size: int = Field(..., description="Results per page")
+    results: List[SearchResult] = Field(..., description="Matches on this page, best first")
+    success: bool = Field(True)
+
+
+class PassageReading(BaseModel):
+    """A reading whose passage overlaps a searched reference."""
+    date: str = Field(..., description="Date of the reading (YYYY-MM-DD)")
+    part: str = Field(..., description="Part of the Mass readings (e.g., 'gospel')")
+    reference: str = Field(..., description="Reference of the reading as stored")
+
+
+class PassageResponse(BaseModel):
+    """Passage lookup endpoint response."""
+    passages: List[str] = Field(..., description="The searched reference, normalized")
+    readings: List[PassageReading] = Field(..., description="Overlapping readings, by date")
+    success: bool = Field(True)
+    source_attribution: str = Field(..., description="Data source attribution")
+
+
 class PrayersResponse(BaseModel):
     """Prayers endpoint response."""
     prayers: List[Prayer] = Field(..., description="List of prayers")
@@ -52,6 +115,23 @@ class PrayersResponse(BaseModel):
     source_attribution: str = Field(..., description="Data source attribution")
 
 
+class DailyPrayersResponse(BaseModel):
+    """Prayers for a day, with the liturgical day they were chosen for."""
+    liturgical_day: LiturgicalDay = Field(..., description="Liturgical day information")
+    season_prayers: List[Prayer] = Field(..., description="Prayers of the day's liturgical season")
+    common_prayers: List[Prayer] = Field(..., description="Common prayers")
+    language: str = Field(..., description="Language of the prayers")
+    success: bool = Field(True)
+    source_attribution: str = Field(..., description="Data source attribution")
+
+
+class DocumentsResponse(BaseModel):
+    """Liturgical documents endpoint response."""
+    documents: List[LiturgicalDocument] = Field(..., description="Liturgical document summaries")
+    success: bool = Field(True)
+    source_attribution: str = Field(..., description="Data source attribution")
+
+
 class MissalResponse(BaseModel):
     """Missal parts response."""
     parts: List[MissalPart] = Field(..., description="Missal parts")
@@ -2,47 +2,240 @@
 Calendar endpoints for liturgical calendar information.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from datetime import datetime, date
-from typing import Optional
+from typing import Optional, Set, Dict, Any
 
-from ..models.responses import CalendarResponse, ErrorResponse
-from ..services.data_sources import DataSourceManager
-from ..services.liturgical_calendar import LiturgicalCalendar
+from ..core.calendar_params import CALENDAR_ATTRIBUTION, get_region
+from ..core.compression import cache_control, etag_matches
+from ..core.config import settings
+from ..core.local_date import get_today
+from ..core.projection import FieldsQuery, projected_response, requests_field
+from ..models.liturgical import LiturgicalDay
+from ..models.requests import BatchDatesRequest
+from ..models.responses import CalendarResponse, CalendarBatchResponse, ErrorResponse
+from ..services.data_sources import DataSourceManager, FetchBudget, close_shared_manager, get_shared_manager
+from ..services.columnar import COLUMNAR_MEDIA_TYPES, columnar_available, iter_columnar
+from ..services.export import export_year
+from ..services.liturgical_calendar import get_calendar
 
 router = APIRouter()
 
-# Global data source manager
-data_manager = DataSourceManager()
+# Optional, potentially slow parts of a liturgical day that must be asked for
+INCLUDE_OPTIONS = {"readings"}
 
 
 async def get_data_manager():
-    """Dependency to get the data source manager."""
-    return data_manager
+    """Dependency to get the data source manager shared by all routers."""
+    return get_shared_manager()
+
+
+async def get_include(
+    include: Optional[str] = Query(
+        None,
+        description="Comma-separated extras to include. Use 'readings' to add Mass readings "
+                    "(may require a call to an upstream source)."
+    )
+) -> Set[str]:
+    """Dependency parsing the include query parameter."""
+    requested = {part.strip() for part in (include or "").split(",") if part.strip()}
+    unknown = requested - INCLUDE_OPTIONS
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown include option(s): {', '.join(sorted(unknown))}. "
+                   f"Available: {', '.join(sorted(INCLUDE_OPTIONS))}"
+        )
+    return requested
+
+
+def wants_readings(include: Set[str], fields: Optional[Dict[str, Any]]) -> bool:
+    """Whether readings were asked for and will be part of the response."""
+    asked = "readings" in include or (fields is not None and "readings" in fields)
+    return asked and requests_field(fields, "readings")
 
 
 @router.get("/today", response_model=CalendarResponse)
 async def get_today_calendar(
+    include: Set[str] = Depends(get_include),
+    fields: Optional[Dict[str, Any]] = Depends(FieldsQuery(LiturgicalDay)),
+    region: Optional[str] = Depends(get_region),
+    today: date = Depends(get_today),
+    manager: DataSourceManager = Depends(get_data_manager)
+):
+    """
+    Get liturgical calendar information for today.
+    
+    Pass `?tz=` (or an X-Timezone header) with an IANA time zone, e.g.
+    'America/Chicago', for the local date; the server's date is used otherwise.
+    """
+    return await get_calendar_for_date(today, manager, include, fields, region=region)
+
+
+@router.post("/batch", response_model=CalendarBatchResponse)
+async def get_calendar_batch(
+    request: BatchDatesRequest,
+    include: Set[str] = Depends(get_include),
+    fields: Optional[Dict[str, Any]] = Depends(FieldsQuery(LiturgicalDay)),
+    region: Optional[str] = Depends(get_region),
     manager: DataSourceManager = Depends(get_data_manager)
 ):
-    """Get liturgical calendar information for today."""
-    today = date.today()
-    return await get_calendar_for_date(today, manager)
+    """
+    Get liturgical calendar information for many dates in one request.
+    
+    Dates may be in any order and span several years; results are returned
+    in the order requested. Add `?include=readings` for Mass readings,
+    `?fields=` to return only some fields of each day, and `?region=` to
+    follow a regional calendar. Readings are fetched from the upstream
+    source for at most BATCH_MAX_FETCHES dates; dates left without readings
+    because of that are listed in `not_fetched`.
+    """
+    try:
+        budget = FetchBudget(settings.BATCH_MAX_FETCHES)
+        liturgical_days = await manager.get_liturgical_days(
+            request.dates,
+            include_readings=wants_readings(include, fields),
+            region=region,
+            budget=budget
+        )
+        
+        response = CalendarBatchResponse(
+            liturgical_days=liturgical_days,
+            not_fetched=[d.isoformat() for d in sorted(budget.skipped)],
+            source_attribution=CALENDAR_ATTRIBUTION
+        )
+        if fields is None:
+            return response
+        return projected_response(response, {
+            "liturgical_days": {"__all__": fields},
+            "not_fetched": ...,
+            "success": ...,
+            "source_attribution": ...,
+        })
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error retrieving liturgical calendar information: {str(e)}"
+        )
+
+
+def export_response(export_format: str, year: int, region: Optional[str], request: Request) -> Response:
+    """
+    Serve the cached export of a year, or 304 when the client's copy is current.
+    
+    The export is built once per (format, year, region) and then served as
+    finished bytes, so polling calendar clients cost almost nothing.
+    """
+    blob = export_year(export_format, year, region)
+    headers = {
+        "ETag": blob.etag,
+        "Cache-Control": cache_control(settings.CALENDAR_CACHE_TIME),
+    }
+    if etag_matches(request.headers.get("if-none-match", ""), blob.etag):
+        return Response(status_code=304, headers=headers)
+    
+    filename = f"liturgical-calendar-{year}" + (f"-{region}" if region else "") + f".{export_format}"
+    headers["Content-Disposition"] = f'inline; filename="{filename}"'
+    return Response(content=blob.body, media_type=blob.media_type, headers=headers)
+
+
+@router.get("/{year}.ics", response_class=Response)
+async def get_calendar_ics(
+    request: Request,
+    year: int = Path(..., ge=1583, le=9998),
+    region: Optional[str] = Depends(get_region)
+):
+    """
+    Subscribe to the liturgical calendar of a year in iCalendar format.
+    
+    Celebrations and Sundays are all-day events. Add `?region=us` for a
+    regional calendar. Responses carry an ETag for conditional polling.
+    """
+    return export_response("ics", year, region, request)
+
+
+@router.get("/{year}.csv", response_class=Response)
+async def get_calendar_csv(
+    request: Request,
+    year: int = Path(..., ge=1583, le=9998),
+    region: Optional[str] = Depends(get_region)
+):
+    """
+    Download every day of a year as CSV.
+    
+    Columns: date, weekday, season, season_week, color, sunday_cycle,
+    weekday_cycle, psalter_week, celebration, rank, other_celebrations.
+    """
+    return export_response("csv", year, region, request)
+
+
+@router.get("/export/{start_year}/{end_year}", response_class=StreamingResponse)
+async def export_calendar_columnar(
+    start_year: int = Path(..., ge=1583, le=9998),
+    end_year: int = Path(..., ge=1583, le=9998),
+    format: str = Query("arrow", description="'arrow' (Arrow IPC stream) or 'parquet'"),
+    region: Optional[str] = Depends(get_region)
+):
+    """
+    Export liturgical days for a range of years in a columnar format.
+    
+    Each year is built from the calendar's year table and streamed as it is
+    encoded (one record batch, or Parquet row group, per year). Columns
+    include season, week, color, celebrations and lectionary references.
+    Requires the optional pyarrow package.
+    """
+    if format not in COLUMNAR_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown format: {format}. Available: {', '.join(COLUMNAR_MEDIA_TYPES)}"
+        )
+    if start_year > end_year:
+        raise HTTPException(
+            status_code=400,
+            detail="Start year must be before or equal to end year"
+        )
+    if end_year - start_year + 1 > settings.CALENDAR_EXPORT_MAX_YEARS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Export cannot exceed {settings.CALENDAR_EXPORT_MAX_YEARS} years"
+        )
+    if not columnar_available():
+        raise HTTPException(
+            status_code=501,
+            detail="Columnar exports require the optional pyarrow package"
+        )
+    
+    extension = "arrows" if format == "arrow" else "parquet"
+    filename = f"liturgical-calendar-{start_year}-{end_year}" + (f"-{region}" if region else "") + f".{extension}"
+    return StreamingResponse(
+        iter_columnar(start_year, end_year, format, region),
+        media_type=COLUMNAR_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
 
 
 @router.get("/{date_str}", response_model=CalendarResponse)
 async def get_calendar_for_date_endpoint(
     date_str: str,
+    response: Response,
+    include: Set[str] = Depends(get_include),
+    fields: Optional[Dict[str, Any]] = Depends(FieldsQuery(LiturgicalDay)),
+    region: Optional[str] = Depends(get_region),
     manager: DataSourceManager = Depends(get_data_manager)
 ):
     """
     Get liturgical calendar information for a specific date.
     
     Date format: YYYY-MM-DD (e.g., 2024-12-25)
+    Add `?include=readings` for Mass readings, `?fields=season,color`
+    (dotted paths for nested fields) to return only some fields, and
+    `?region=us` to follow a regional calendar.
     """
     try:
         target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        return await get_calendar_for_date(target_date, manager)
+        return await get_calendar_for_date(target_date, manager, include, fields, response, region)
     except ValueError:
         raise HTTPException(
             status_code=400,
@@ -52,20 +245,47 @@ async def get_calendar_for_date_endpoint(
 
 async def get_calendar_for_date(
     target_date: date,
-    manager: DataSourceManager
-) -> CalendarResponse:
-    """Get liturgical calendar information for a specific date."""
+    manager: DataSourceManager,
+    include: Set[str] = frozenset(),
+    fields: Optional[Dict[str, Any]] = None,
+    response: Optional[Response] = None,
+    region: Optional[str] = None
+):
+    """
+    Get liturgical calendar information for a specific date.
+    
+    When a response is given, the result is marked as publicly cacheable if
+    it cannot change: calendar data is computed locally, and readings are
+    final once found for a past date.
+    """
     try:
-        liturgical_day = await manager.get_liturgical_day(target_date)
+        include_readings = wants_readings(include, fields)
+        liturgical_day = await manager.get_liturgical_day(
+            target_date,
+            include_readings=include_readings,
+            region=region
+        )
         
-        return CalendarResponse(
+        headers = {}
+        if response is not None and (
+            not include_readings
+            or (liturgical_day.readings is not None and target_date < date.today())
+        ):
+            headers["Cache-Control"] = cache_control(settings.CALENDAR_CACHE_TIME)
+        
+        calendar_response = CalendarResponse(
             liturgical_day=liturgical_day,
-            source_attribution=(
-                "Data sources: USCCB (United States Conference of Catholic Bishops), "
-                "Vatican Official Sources, Catholic Missal API Liturgical Calculator. "
-                "Used in accordance with fair use and educational purposes."
-            )
+            source_attribution=CALENDAR_ATTRIBUTION
         )
+        if fields is None:
+            if response is not None:
+                response.headers.update(headers)
+            return calendar_response
+        return projected_response(calendar_response, {
+            "liturgical_day": fields,
+            "success": ...,
+            "source_attribution": ...,
+        }, headers)
     
     except Exception as e:
         raise HTTPException(
@@ -75,24 +295,32 @@ async def get_calendar_for_date(
 
 
 @router.get("/season/{year}", response_model=dict)
-async def get_liturgical_year(year: int):
+async def get_liturgical_year(
+    year: int,
+    response: Response,
+    region: Optional[str] = Depends(get_region)
+):
     """
     Get key dates for a liturgical year.
     
-    Returns important dates like Easter, Advent start, etc.
+    Returns important dates like Easter, Advent start, etc. The Epiphany and
+    the Ascension depend on the region.
     """
+    response.headers["Cache-Control"] = cache_control(settings.CALENDAR_CACHE_TIME)
     try:
-        calendar = LiturgicalCalendar(year)
+        anchors = get_calendar(year, region).anchors
         
         key_dates = {
             "year": year,
-            "easter": calendar.easter_date.isoformat(),
-            "advent_start": calendar.advent_start.isoformat(),
-            "ash_wednesday": (calendar.easter_date.replace(day=calendar.easter_date.day - 46)).isoformat(),
-            "palm_sunday": (calendar.easter_date.replace(day=calendar.easter_date.day - 7)).isoformat(),
-            "good_friday": (calendar.easter_date.replace(day=calendar.easter_date.day - 2)).isoformat(),
-            "pentecost": (calendar.easter_date.replace(day=calendar.easter_date.day + 49)).isoformat(),
-            "christ_the_king": None,  # Would need calculation
+            "epiphany": anchors["epiphany"].isoformat(),
+            "easter": anchors["easter"].isoformat(),
+            "advent_start": anchors["advent_start"].isoformat(),
+            "ash_wednesday": anchors["ash_wednesday"].isoformat(),
+            "palm_sunday": anchors["palm_sunday"].isoformat(),
+            "good_friday": anchors["good_friday"].isoformat(),
+            "ascension": anchors["ascension"].isoformat(),
+            "pentecost": anchors["pentecost"].isoformat(),
+            "christ_the_king": anchors["christ_the_king"].isoformat(),
         }
         
         return {
@@ -111,4 +339,4 @@ async def get_liturgical_year(year: int):
 @router.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
-    await data_manager.close()
\ No newline at end of file
+    await close_shared_manager()
\ No newline at end of file
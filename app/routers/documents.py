@@ -0,0 +1,49 @@
+"""
+Documents endpoints for official liturgical documents.
+"""
+
+from fastapi import APIRouter, HTTPException, Depends
+
+from ..models.responses import DocumentsResponse
+from ..services.data_sources import DataSourceManager, close_shared_manager, get_shared_manager
+
+router = APIRouter()
+
+
+async def get_data_manager():
+    """Dependency to get the data source manager shared by all routers."""
+    return get_shared_manager()
+
+
+@router.get("/", response_model=DocumentsResponse)
+async def get_liturgical_documents(
+    manager: DataSourceManager = Depends(get_data_manager)
+):
+    """
+    Get summaries of official Vatican liturgical documents.
+    
+    Summaries are cached and revalidated with the Vatican website periodically,
+    so repeat calls are served from memory.
+    """
+    try:
+        documents = await manager.get_liturgical_documents()
+        
+        return DocumentsResponse(
+            documents=documents,
+            source_attribution=(
+                "Documents sourced from the official Vatican website. "
+                "Excerpts used with attribution for educational purposes."
+            )
+        )
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error retrieving liturgical documents: {str(e)}"
+        )
+
+
+@router.on_event("shutdown")
+async def shutdown_event():
+    """Clean up resources on shutdown."""
+    await close_shared_manager()
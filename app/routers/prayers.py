@@ -3,284 +3,249 @@ Prayers endpoints for liturgical prayers and texts.
 
 Note: This module provides access to common prayers and liturgical texts
 in accordance with copyright and fair use guidelines.
+
+Prayers come from the packaged prayer catalog and are served in the language
+asked for with `?lang=` or the Accept-Language header, falling back to
+English for prayers that have no translation.
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Header, Depends, Query, Response
+from datetime import datetime, date
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
-from ..models.responses import PrayersResponse
-from ..models.liturgical import Prayer
+from ..core.calendar_params import CALENDAR_ATTRIBUTION, get_region
+from ..core.compression import cache_control
+from ..core.config import settings
+from ..core.local_date import get_today
+from ..models.responses import DailyPrayersResponse, PrayersResponse
+from ..services.liturgical_calendar import get_calendar
+from ..services.prayer_catalog import get_prayer_catalog, season_key
 
 router = APIRouter()
 
+COMMON_ATTRIBUTION = (
+    "Traditional Catholic prayers in the public domain. "
+    "These prayers are part of the common heritage of the Catholic Church."
+)
 
-@router.get("/common", response_model=PrayersResponse)
-async def get_common_prayers():
+
+async def get_language(
+    lang: Optional[str] = Query(None, description="Language code, e.g. 'en', 'es' or 'la'"),
+    accept_language: Optional[str] = Header(None)
+) -> str:
+    """The language to serve prayers in, from ?lang= or Accept-Language."""
+    catalog = get_prayer_catalog()
+    if lang is not None:
+        if lang.lower() not in catalog.languages:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown language: {lang}. Available: {', '.join(catalog.languages)}"
+            )
+        return lang.lower()
+    return catalog.negotiate(accept_language)
+
+
+def render_prayers(group: str, key: str, language: str) -> bytes:
+    """Serialized response for a known category, season or prayer key in a language."""
+    catalog = get_prayer_catalog()
+    if group == "category":
+        prayers = catalog.category(key, language)
+        attribution = COMMON_ATTRIBUTION if key == "common" else (
+            f"Catholic prayers in the '{key}' category. "
+            "Traditional prayers are in the public domain. "
+            "Liturgical texts used under fair use guidelines."
+        )
+    elif group == "season":
+        prayers = catalog.season(key, language)
+        attribution = (
+            f"Catholic prayers for the {key} season. "
+            "Traditional prayers are in the public domain."
+        )
+    else:
+        prayers = [catalog.named(key, language)]
+        attribution = "Traditional prayers are in the public domain."
+    return PrayersResponse(prayers=prayers, source_attribution=attribution).json().encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def prayer_bodies() -> Dict[Tuple[str, str, str], bytes]:
     """
-    Get common Catholic prayers.
+    Every category, season and prayer response in every language.
     
-    These prayers are in the public domain or used under fair use.
+    The catalog never changes while the process runs, so all responses are
+    rendered once, on first use, and then served as the same bytes. The
+    table only ever holds what the catalog defines.
     """
-    common_prayers = [
-        Prayer(
-            name="Our Father",
-            category="Lord's Prayer",
-            text=(
-                "Our Father, who art in heaven, hallowed be thy name; "
-                "thy kingdom come; thy will be done on earth as it is in heaven. "
-                "Give us this day our daily bread; and forgive us our trespasses "
-                "as we forgive those who trespass against us; "
-                "and lead us not into temptation, but deliver us from evil. Amen."
-            ),
-            source="Traditional Catholic Prayer",
-            language="en"
-        ),
-        Prayer(
-            name="Hail Mary",
-            category="Marian Prayer",
-            text=(
-                "Hail Mary, full of grace, the Lord is with thee; "
-                "blessed art thou among women, and blessed is the fruit of thy womb, Jesus. "
-                "Holy Mary, Mother of God, pray for us sinners, "
-                "now and at the hour of our death. Amen."
-            ),
-            source="Traditional Catholic Prayer",
-            language="en"
-        ),
-        Prayer(
-            name="Glory Be",
-            category="Doxology",
-            text=(
-                "Glory be to the Father, and to the Son, and to the Holy Spirit. "
-                "As it was in the beginning, is now, and ever shall be, "
-                "world without end. Amen."
-            ),
-            source="Traditional Catholic Prayer",
-            language="en"
-        ),
-        Prayer(
-            name="Apostles' Creed",
-            category="Creed",
-            text=(
-                "I believe in God, the Father almighty, Creator of heaven and earth, "
-                "and in Jesus Christ, his only Son, our Lord, "
-                "who was conceived by the Holy Spirit, born of the Virgin Mary, "
-                "suffered under Pontius Pilate, was crucified, died and was buried; "
-                "he descended into hell; on the third day he rose again from the dead; "
-                "he ascended into heaven, and is seated at the right hand of God the Father almighty; "
-                "from there he will come to judge the living and the dead. "
-                "I believe in the Holy Spirit, the holy catholic Church, "
-                "the communion of saints, the forgiveness of sins, "
-                "the resurrection of the body, and life everlasting. Amen."
-            ),
-            source="Traditional Catholic Prayer",
-            language="en"
-        ),
-        Prayer(
-            name="Act of Contrition",
-            category="Penitential Prayer",
-            text=(
-                "O my God, I am heartily sorry for having offended Thee, "
-                "and I detest all my sins because I dread the loss of heaven and the pains of hell; "
-                "but most of all because they offend Thee, my God, "
-                "Who art all-good and deserving of all my love. "
-                "I firmly resolve, with the help of Thy grace, "
-                "to confess my sins, to do penance, and to amend my life. Amen."
-            ),
-            source="Traditional Catholic Prayer",
-            language="en"
-        )
-    ]
+    catalog = get_prayer_catalog()
+    groups = {"category": catalog.categories, "season": catalog.seasons, "name": catalog.keys}
+    return {
+        (group, key, language): render_prayers(group, key, language)
+        for group, keys in groups.items()
+        for key in keys
+        for language in catalog.languages
+    }
+
+
+def prayers_json(group: str, key: str, language: str) -> Optional[bytes]:
+    """
+    Serialized response for a category, season or prayer name in a language.
     
-    return PrayersResponse(
-        prayers=common_prayers,
-        source_attribution=(
-            "Traditional Catholic prayers in the public domain. "
-            "These prayers are part of the common heritage of the Catholic Church."
+    Returns None when the category, season or name is unknown.
+    """
+    if group == "name":
+        key = get_prayer_catalog().key(key)
+    return prayer_bodies().get((group, key, language))
+
+
+def prayers_response(body: bytes, language: str) -> Response:
+    """A cacheable JSON response varying by the requested language."""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={
+            "Cache-Control": cache_control(settings.CACHE_EXPIRE_TIME),
+            "Content-Language": language,
+            "Vary": "Accept-Language",
+        }
+    )
+
+
+@lru_cache(maxsize=1024)
+def daily_prayers_json(target_date: date, region: Optional[str], language: str) -> bytes:
+    """
+    Serialized prayers for a date: its liturgical day and seasonal prayers.
+    
+    The day comes from the shared calendar year table and the prayers from
+    the catalog indexes, so building a response is two lookups; the bytes
+    are then reused for every request for the same date and language.
+    """
+    catalog = get_prayer_catalog()
+    liturgical_day = get_calendar(target_date.year, region).get_liturgical_day(target_date)
+    season = season_key(liturgical_day.season, target_date)
+    return DailyPrayersResponse(
+        liturgical_day=liturgical_day,
+        season_prayers=(catalog.season(season, language) or []) if season else [],
+        common_prayers=catalog.category("common", language),
+        language=language,
+        source_attribution=f"{COMMON_ATTRIBUTION} {CALENDAR_ATTRIBUTION}"
+    ).json().encode("utf-8")
+
+
+@router.get("/today", response_model=DailyPrayersResponse)
+async def get_prayers_for_today(
+    region: Optional[str] = Depends(get_region),
+    language: str = Depends(get_language),
+    today: date = Depends(get_today)
+):
+    """
+    Get today's liturgical day together with its seasonal and common prayers.
+    
+    Saves a call to /calendar/today before /prayers/seasonal/{season}. Pass
+    `?tz=` with an IANA time zone for the local date.
+    """
+    try:
+        body = daily_prayers_json(today, region, language)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error retrieving prayers for the day: {str(e)}"
         )
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Content-Language": language, "Vary": "Accept-Language"}
     )
 
 
+@router.get("/for/{date_str}", response_model=DailyPrayersResponse)
+async def get_prayers_for_date(
+    date_str: str,
+    region: Optional[str] = Depends(get_region),
+    language: str = Depends(get_language)
+):
+    """
+    Get the liturgical day of a date together with its seasonal and common prayers.
+    
+    Date format: YYYY-MM-DD (e.g., 2024-12-25)
+    """
+    try:
+        target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid date format. Use YYYY-MM-DD (e.g., 2024-12-25)"
+        )
+    
+    try:
+        body = daily_prayers_json(target_date, region, language)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error retrieving prayers for the day: {str(e)}"
+        )
+    return prayers_response(body, language)
+
+
+@router.get("/common", response_model=PrayersResponse)
+async def get_common_prayers(language: str = Depends(get_language)):
+    """
+    Get common Catholic prayers.
+    
+    These prayers are in the public domain or used under fair use.
+    """
+    return prayers_response(prayers_json("category", "common", language), language)
+
+
 @router.get("/category/{category}", response_model=PrayersResponse)
-async def get_prayers_by_category(category: str):
+async def get_prayers_by_category(category: str, language: str = Depends(get_language)):
     """
     Get prayers by category.
     
-    Available categories: marian, penitential, eucharistic, seasonal
+    Available categories: marian, penitential, eucharistic
     """
     category_lower = category.lower()
+    body = prayers_json("category", category_lower, language) if category_lower != "common" else None
     
-    prayers_by_category = {
-        "marian": [
-            Prayer(
-                name="Hail Mary",
-                category="Marian Prayer",
-                text=(
-                    "Hail Mary, full of grace, the Lord is with thee; "
-                    "blessed art thou among women, and blessed is the fruit of thy womb, Jesus. "
-                    "Holy Mary, Mother of God, pray for us sinners, "
-                    "now and at the hour of our death. Amen."
-                ),
-                source="Traditional Catholic Prayer",
-                language="en"
-            ),
-            Prayer(
-                name="Memorare",
-                category="Marian Prayer",
-                text=(
-                    "Remember, O most gracious Virgin Mary, "
-                    "that never was it known that anyone who fled to thy protection, "
-                    "implored thy help, or sought thy intercession was left unaided. "
-                    "Inspired by this confidence, I fly unto thee, "
-                    "O Virgin of virgins, my Mother; "
-                    "to thee do I come, before thee I stand, sinful and sorrowful. "
-                    "O Mother of the Word Incarnate, "
-                    "despise not my petitions, but in thy mercy hear and answer me. Amen."
-                ),
-                source="Traditional Catholic Prayer - St. Bernard",
-                language="en"
-            )
-        ],
-        "penitential": [
-            Prayer(
-                name="Act of Contrition",
-                category="Penitential Prayer",
-                text=(
-                    "O my God, I am heartily sorry for having offended Thee, "
-                    "and I detest all my sins because I dread the loss of heaven and the pains of hell; "
-                    "but most of all because they offend Thee, my God, "
-                    "Who art all-good and deserving of all my love. "
-                    "I firmly resolve, with the help of Thy grace, "
-                    "to confess my sins, to do penance, and to amend my life. Amen."
-                ),
-                source="Traditional Catholic Prayer",
-                language="en"
-            )
-        ],
-        "eucharistic": [
-            Prayer(
-                name="Prayer Before Communion",
-                category="Eucharistic Prayer",
-                text=(
-                    "Lord Jesus Christ, Son of the living God, "
-                    "who, by the will of the Father and the work of the Holy Spirit, "
-                    "through your Death gave life to the world, "
-                    "free me by this, your most holy Body and Blood, "
-                    "from all my sins and from every evil; "
-                    "keep me always faithful to your commandments, "
-                    "and never let me be separated from you."
-                ),
-                source="Roman Missal",
-                language="en",
-                copyright_notice="From the Roman Missal - used under fair use"
-            )
-        ]
-    }
-    
-    if category_lower not in prayers_by_category:
+    if body is None:
+        available = [c for c in get_prayer_catalog().categories if c != "common"]
         raise HTTPException(
             status_code=404,
-            detail=f"Category '{category}' not found. Available categories: marian, penitential, eucharistic"
+            detail=f"Category '{category}' not found. Available categories: {', '.join(available)}"
         )
     
-    return PrayersResponse(
-        prayers=prayers_by_category[category_lower],
-        source_attribution=(
-            f"Catholic prayers in the '{category}' category. "
-            "Traditional prayers are in the public domain. "
-            "Liturgical texts used under fair use guidelines."
-        )
-    )
+    return prayers_response(body, language)
 
 
 @router.get("/seasonal/{season}", response_model=PrayersResponse)
-async def get_seasonal_prayers(season: str):
+async def get_seasonal_prayers(season: str, language: str = Depends(get_language)):
     """
     Get prayers for liturgical seasons.
     
     Available seasons: advent, christmas, lent, easter
     """
-    season_lower = season.lower()
-    
-    seasonal_prayers = {
-        "advent": [
-            Prayer(
-                name="O Come, O Come Emmanuel (Prayer)",
-                category="Advent Prayer",
-                text=(
-                    "O come, O come, Emmanuel, and ransom captive Israel, "
-                    "that mourns in lonely exile here until the Son of God appear. "
-                    "Rejoice! Rejoice! Emmanuel shall come to thee, O Israel!"
-                ),
-                source="Traditional Advent Antiphon",
-                language="en"
-            )
-        ],
-        "christmas": [
-            Prayer(
-                name="Prayer for Christmas",
-                category="Christmas Prayer",
-                text=(
-                    "Almighty God, you have given us your only-begotten Son "
-                    "to take our nature upon him and to be born of a pure virgin: "
-                    "Grant that we, who have been born again and made your children by adoption and grace, "
-                    "may daily be renewed by your Holy Spirit; "
-                    "through Jesus Christ our Lord, who lives and reigns with you and the Holy Spirit, "
-                    "one God, now and for ever. Amen."
-                ),
-                source="Traditional Christmas Prayer",
-                language="en"
-            )
-        ],
-        "lent": [
-            Prayer(
-                name="Lenten Prayer",
-                category="Lenten Prayer",
-                text=(
-                    "Almighty and ever living God, "
-                    "you invite us deeper into your world, your people, your Lent. "
-                    "May this season be for us a time of outward simplicity "
-                    "and inward complexity; "
-                    "a time of outward fasting and inward feasting; "
-                    "a time of outward discipline and inward freedom. "
-                    "Help us to walk with Jesus along the way of the cross, "
-                    "that we may be found faithful in all things. Amen."
-                ),
-                source="Traditional Lenten Prayer",
-                language="en"
-            )
-        ],
-        "easter": [
-            Prayer(
-                name="Easter Prayer",
-                category="Easter Prayer",
-                text=(
-                    "God of mercy, we no longer look for Jesus among the dead, "
-                    "for he is alive and has become the Lord of life. "
-                    "Increase in our minds and hearts "
-                    "the risen life we share with Christ "
-                    "and help us to grow as your people "
-                    "toward the fullness of eternal life with you, "
-                    "through Jesus Christ, our Savior and Lord, "
-                    "who lives and reigns with you and the Holy Spirit, "
-                    "one God, now and forever. Amen."
-                ),
-                source="Traditional Easter Prayer",
-                language="en"
-            )
-        ]
-    }
+    body = prayers_json("season", season.lower(), language)
     
-    if season_lower not in seasonal_prayers:
+    if body is None:
         raise HTTPException(
             status_code=404,
-            detail=f"Season '{season}' not found. Available seasons: advent, christmas, lent, easter"
+            detail=f"Season '{season}' not found. Available seasons: {', '.join(get_prayer_catalog().seasons)}"
         )
     
-    return PrayersResponse(
-        prayers=seasonal_prayers[season_lower],
-        source_attribution=(
-            f"Catholic prayers for the {season} season. "
-            "Traditional prayers are in the public domain."
-        )
-    )
\ No newline at end of file
+    return prayers_response(body, language)
+
+
+@router.get("/name/{name}", response_model=PrayersResponse)
+async def get_prayer_by_name(name: str, language: str = Depends(get_language)):
+    """
+    Get one prayer by key or by name in any language.
+    
+    E.g. /name/hail-mary?lang=la and /name/Ave Maria?lang=la both return
+    the Latin "Ave Maria".
+    """
+    body = prayers_json("name", name.lower(), language)
+    
+    if body is None:
+        raise HTTPException(status_code=404, detail=f"Prayer '{name}' not found")
+    
+    return prayers_response(body, language)
@@ -2,46 +2,180 @@
 Readings endpoints for daily Mass readings.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from datetime import datetime, date, timedelta
-from typing import Optional
+from typing import Optional, AsyncIterator, Dict, Any
+import json
 
-from ..models.responses import ReadingsResponse, ErrorResponse
-from ..services.data_sources import DataSourceManager
+from ..core.compression import cache_control
+from ..core.config import settings
+from ..core.local_date import get_today
+from ..core.projection import FieldsQuery, projected_response
+from ..models.liturgical import DailyReadings
+from ..models.requests import BatchDatesRequest
+from ..models.responses import (
+    ReadingsResponse, ReadingsBatchResponse, ErrorResponse, PassageResponse, PassageReading
+)
+from ..services.data_sources import DataSourceManager, FetchBudget, close_shared_manager, get_shared_manager
+from ..services.scripture import ScriptureReferenceError, parse_reference
 
 router = APIRouter()
 
-# Global data source manager
-data_manager = DataSourceManager()
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+READINGS_ATTRIBUTION = (
+    "Readings sourced from USCCB (United States Conference of Catholic Bishops) "
+    "and other official Catholic sources. Used in accordance with fair use "
+    "and educational purposes. For commercial use, please ensure proper licensing."
+)
+
+# Rest of the ReadingsResponse envelope after the readings object
+COMPILED_ENVELOPE_TAIL = (
+    ',"success":true,"source_attribution":' + json.dumps(READINGS_ATTRIBUTION) + "}"
+).encode("utf-8")
 
 
 async def get_data_manager():
-    """Dependency to get the data source manager."""
-    return data_manager
+    """Dependency to get the data source manager shared by all routers."""
+    return get_shared_manager()
+
+
+# Dependency parsing ?fields= projections of DailyReadings
+readings_fields = FieldsQuery(DailyReadings)
+
+# Fields the local lectionary index can answer without fetching any text
+REFERENCE_FIELDS = {"reference", "citation"}
+REFERENCE_READINGS = {"first_reading", "responsorial_psalm", "second_reading", "gospel"}
+
+
+def references_only(fields: Dict[str, Any]) -> bool:
+    """Whether a projection asks for nothing but dates and reading references."""
+    for name, subfields in fields.items():
+        if name == "date":
+            continue
+        if name not in REFERENCE_READINGS or subfields is ... or not set(subfields) <= REFERENCE_FIELDS:
+            return False
+    return True
 
 
 @router.get("/today", response_model=ReadingsResponse)
 async def get_today_readings(
+    fields: Optional[Dict[str, Any]] = Depends(readings_fields),
+    today: date = Depends(get_today),
+    manager: DataSourceManager = Depends(get_data_manager)
+):
+    """
+    Get Mass readings for today.
+    
+    Pass `?tz=` (or an X-Timezone header) with an IANA time zone, e.g.
+    'America/Chicago', for the local date; the server's date is used otherwise.
+    """
+    return await get_readings_for_date(today, manager, fields)
+
+
+@router.post("/batch", response_model=ReadingsBatchResponse)
+async def get_readings_batch(
+    request: BatchDatesRequest,
+    fields: Optional[Dict[str, Any]] = Depends(readings_fields),
+    manager: DataSourceManager = Depends(get_data_manager)
+):
+    """
+    Get Mass readings for many dates in one request.
+    
+    Readings are resolved concurrently and returned in the order requested.
+    At most BATCH_MAX_FETCHES dates are fetched from the upstream source;
+    dates left without readings because of that are listed in `not_fetched`.
+    """
+    try:
+        budget = FetchBudget(settings.BATCH_MAX_FETCHES)
+        readings = await manager.get_daily_readings_many(request.dates, budget)
+        
+        response = ReadingsBatchResponse(
+            readings=[readings[d] or unavailable_readings(d) for d in request.dates],
+            not_fetched=[d.isoformat() for d in sorted(budget.skipped)],
+            source_attribution=READINGS_ATTRIBUTION
+        )
+        if fields is None:
+            return response
+        return projected_response(response, {
+            "readings": {"__all__": fields},
+            "not_fetched": ...,
+            "success": ...,
+            "source_attribution": ...,
+        })
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error retrieving readings: {str(e)}"
+        )
+
+
+@router.get("/passage", response_model=PassageResponse)
+async def get_readings_for_passage(
+    ref: str = Query(..., description="Scripture reference, e.g. 'Jn 6:51-58' or 'John 6'"),
+    start: Optional[str] = Query(None, description="First date to include (YYYY-MM-DD)"),
+    end: Optional[str] = Query(None, description="Last date to include (YYYY-MM-DD)"),
     manager: DataSourceManager = Depends(get_data_manager)
 ):
-    """Get Mass readings for today."""
-    today = date.today()
-    return await get_readings_for_date(today, manager)
+    """
+    Find the dates whose readings include a passage.
+    
+    Any local reading overlapping the reference matches, so 'John 6' finds
+    every reading from that chapter. Only compiled and stored readings are
+    searched.
+    """
+    try:
+        passages = parse_reference(ref)
+    except ScriptureReferenceError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        start_date = datetime.strptime(start, "%Y-%m-%d").date() if start else None
+        end_date = datetime.strptime(end, "%Y-%m-%d").date() if end else None
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid date format. Use YYYY-MM-DD (e.g., 2024-12-25)"
+        )
+    
+    try:
+        index = await manager.get_scripture_index()
+        matches = index.find(passages, start_date, end_date)
+        return PassageResponse(
+            passages=[str(passage) for passage in passages],
+            readings=[
+                PassageReading(date=match.date.isoformat(), part=match.part, reference=match.reference)
+                for match in matches
+            ],
+            source_attribution=READINGS_ATTRIBUTION
+        )
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error searching readings: {str(e)}"
+        )
 
 
 @router.get("/{date_str}", response_model=ReadingsResponse)
 async def get_readings_for_date_endpoint(
     date_str: str,
+    response: Response,
+    fields: Optional[Dict[str, Any]] = Depends(readings_fields),
     manager: DataSourceManager = Depends(get_data_manager)
 ):
     """
     Get Mass readings for a specific date.
     
     Date format: YYYY-MM-DD (e.g., 2024-12-25)
+    Use `?fields=gospel.reference,first_reading.reference` to return only some fields;
+    references of major Sundays and solemnities are then answered without any
+    upstream request.
     """
     try:
         target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        return await get_readings_for_date(target_date, manager)
+        return await get_readings_for_date(target_date, manager, fields, response)
     except ValueError:
         raise HTTPException(
             status_code=400,
@@ -49,31 +183,71 @@ async def get_readings_for_date_endpoint(
         )
 
 
+def unavailable_readings(target_date: date) -> DailyReadings:
+    """Create a basic readings object with just the date."""
+    return DailyReadings(
+        date=target_date,
+        source="No readings available for this date",
+        last_updated=datetime.utcnow()
+    )
+
+
+def compiled_readings_response(data: memoryview, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Wrap readings JSON sliced from the compiled corpus in the response envelope."""
+    with data:
+        content = b"".join((b'{"readings":', data, COMPILED_ENVELOPE_TAIL))
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
 async def get_readings_for_date(
     target_date: date,
-    manager: DataSourceManager
-) -> ReadingsResponse:
-    """Get Mass readings for a specific date."""
+    manager: DataSourceManager,
+    fields: Optional[Dict[str, Any]] = None,
+    response: Optional[Response] = None
+):
+    """
+    Get Mass readings for a specific date.
+    
+    When a response is given, readings found for a past date are marked as
+    publicly cacheable. Readings in the compiled corpus are sent as stored,
+    without being parsed and re-encoded, and requests for references only
+    are answered from the local lectionary index when it covers the date.
+    """
     try:
-        readings = await manager.get_daily_readings(target_date)
+        cacheable = response is not None and target_date < date.today()
         
-        if not readings:
-            # Create a basic readings object with just the date
-            from ..models.liturgical import DailyReadings
-            readings = DailyReadings(
-                date=target_date,
-                source="No readings available for this date",
-                last_updated=datetime.utcnow()
-            )
+        if fields is None:
+            compiled = manager.get_compiled_readings_json(target_date)
+            if compiled is not None:
+                headers = {"Cache-Control": cache_control(settings.READINGS_CACHE_TIME)} if cacheable else None
+                return compiled_readings_response(compiled, headers)
         
-        return ReadingsResponse(
-            readings=readings,
-            source_attribution=(
-                "Readings sourced from USCCB (United States Conference of Catholic Bishops) "
-                "and other official Catholic sources. Used in accordance with fair use "
-                "and educational purposes. For commercial use, please ensure proper licensing."
-            )
+        readings = None
+        if fields is not None and references_only(fields):
+            readings = manager.get_reading_references(target_date)
+            if readings is not None:
+                # References are fixed by the lectionary, whatever the date
+                cacheable = response is not None
+        if readings is None:
+            readings = await manager.get_daily_readings(target_date)
+        
+        headers = {}
+        if cacheable and readings is not None:
+            headers["Cache-Control"] = cache_control(settings.READINGS_CACHE_TIME)
+        
+        readings_response = ReadingsResponse(
+            readings=readings or unavailable_readings(target_date),
+            source_attribution=READINGS_ATTRIBUTION
         )
+        if fields is None:
+            if response is not None:
+                response.headers.update(headers)
+            return readings_response
+        return projected_response(readings_response, {
+            "readings": fields,
+            "success": ...,
+            "source_attribution": ...,
+        }, headers)
     
     except Exception as e:
         raise HTTPException(
@@ -86,56 +260,71 @@ async def get_readings_for_date(
 async def get_readings_range(
     start_date: str,
     end_date: str,
+    request: Request,
+    format: Optional[str] = Query(
+        None,
+        description="Use 'ndjson' to stream one JSON object per day as soon as it is resolved"
+    ),
+    fields: Optional[Dict[str, Any]] = Depends(readings_fields),
     manager: DataSourceManager = Depends(get_data_manager)
 ):
     """
     Get Mass readings for a date range.
     
     Date format: YYYY-MM-DD (e.g., 2024-12-25)
-    Limited to 31 days maximum.
+    Limited to 31 days maximum, or about a year when streamed as NDJSON
+    (`?format=ndjson` or `Accept: application/x-ndjson`). A stream ends with
+    a status line if some dates were not fetched.
     """
     try:
         start = datetime.strptime(start_date, "%Y-%m-%d").date()
         end = datetime.strptime(end_date, "%Y-%m-%d").date()
-        
-        # Limit range to prevent abuse
-        if (end - start).days > 31:
-            raise HTTPException(
-                status_code=400,
-                detail="Date range cannot exceed 31 days"
-            )
-        
-        if start > end:
-            raise HTTPException(
-                status_code=400,
-                detail="Start date must be before or equal to end date"
-            )
-        
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid date format. Use YYYY-MM-DD (e.g., 2024-12-25)"
+        )
+    
+    stream = format == "ndjson" or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+    max_days = settings.READINGS_STREAM_MAX_DAYS if stream else settings.READINGS_RANGE_MAX_DAYS
+    
+    # Limit range to prevent abuse
+    if (end - start).days > max_days:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range cannot exceed {max_days} days"
+            + ("" if stream else f" ({settings.READINGS_STREAM_MAX_DAYS} with format=ndjson)")
+        )
+    
+    if start > end:
+        raise HTTPException(
+            status_code=400,
+            detail="Start date must be before or equal to end date"
+        )
+    
+    if stream:
+        return StreamingResponse(
+            stream_readings_range(start, end, manager, fields),
+            media_type=NDJSON_MEDIA_TYPE
+        )
+    
+    try:
         readings_list = []
-        current_date = start
-        
-        while current_date <= end:
-            readings = await manager.get_daily_readings(current_date)
+        async for _, readings in manager.iter_daily_readings(start, end):
             if readings:
                 readings_list.append(readings)
-            current_date = current_date + timedelta(days=1)
         
         return {
             "success": True,
             "start_date": start_date,
             "end_date": end_date,
-            "readings": [reading.dict() for reading in readings_list],
+            "readings": [reading.dict(include=fields) for reading in readings_list],
             "source_attribution": (
                 "Readings sourced from USCCB and other official Catholic sources. "
                 "Used in accordance with fair use and educational purposes."
             )
         }
     
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid date format. Use YYYY-MM-DD (e.g., 2024-12-25)"
-        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -143,7 +332,35 @@ async def get_readings_range(
         )
 
 
+async def stream_readings_range(
+    start: date,
+    end: date,
+    manager: DataSourceManager,
+    fields: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[bytes]:
+    """
+    Yield one NDJSON line per day that has readings, in date order.
+    
+    A stream fetches at most READINGS_STREAM_MAX_FETCHES dates from the
+    network; later dates are only served when stored locally. If that left
+    any dates without readings, a final status line lists them, e.g.
+    {"status": "incomplete", "not_fetched": ["2025-06-01", ...]}, so the
+    client can ask for them again later.
+    """
+    budget = FetchBudget(settings.READINGS_STREAM_MAX_FETCHES)
+    async for _, readings in manager.iter_daily_readings(start, end, budget):
+        if readings:
+            yield readings.json(include=fields).encode("utf-8") + b"\n"
+    
+    if budget.skipped:
+        yield json.dumps({
+            "status": "incomplete",
+            "detail": "Upstream fetch limit reached; request these dates again later",
+            "not_fetched": [d.isoformat() for d in sorted(budget.skipped)],
+        }).encode("utf-8") + b"\n"
+
+
 @router.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
-    await data_manager.close()
\ No newline at end of file
+    await close_shared_manager()
\ No newline at end of file
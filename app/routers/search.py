@@ -0,0 +1,82 @@
+"""
+Search endpoint over prayers and local readings.
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import Optional
+
+from ..core.config import settings
+from ..models.responses import SearchResponse, SearchResult
+from ..services.data_sources import DataSourceManager, close_shared_manager, get_shared_manager
+from ..services.search import SearchIndex
+
+router = APIRouter()
+
+SEARCH_KINDS = {"prayer", "reading"}
+
+
+async def get_data_manager():
+    """Dependency to get the data source manager shared by all routers."""
+    return get_shared_manager()
+
+
+async def get_search_index(manager: DataSourceManager = Depends(get_data_manager)) -> SearchIndex:
+    """The manager's search index over the prayers and its local readings."""
+    return await manager.get_search_index()
+
+
+@router.on_event("startup")
+async def startup_event():
+    """Build the index before the first request."""
+    await get_shared_manager().get_search_index()
+
+
+@router.on_event("shutdown")
+async def shutdown_event():
+    """Clean up resources on shutdown."""
+    await close_shared_manager()
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, description="Words to search for; all must match"),
+    kind: Optional[str] = Query(None, description="Only return 'prayer' or 'reading' matches"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, description="Results per page"),
+    index: SearchIndex = Depends(get_search_index)
+):
+    """
+    Search prayers and cached readings.
+    
+    Results are ranked by relevance (BM25). Compiled and stored readings are
+    searchable, and others once they have been fetched; each reading of a
+    day is a separate result with its date, part and reference.
+    """
+    if kind is not None and kind not in SEARCH_KINDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown kind: {kind}. Available: {', '.join(sorted(SEARCH_KINDS))}"
+        )
+    if page_size > settings.SEARCH_MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"page_size cannot exceed {settings.SEARCH_MAX_PAGE_SIZE}"
+        )
+    
+    total, hits = index.search(q, kind, offset=(page - 1) * page_size, limit=page_size)
+    return SearchResponse(
+        query=q,
+        total=total,
+        page=page,
+        page_size=page_size,
+        results=[
+            SearchResult(
+                kind=document.kind,
+                title=document.title,
+                excerpt=document.excerpt,
+                score=round(score, 4),
+                **document.payload
+            )
+            for document, score in hits
+        ]
+    )
@@ -0,0 +1,116 @@
+"""
+Compressed on-disk archive of raw upstream pages.
+
+Pages are stored once per distinct content (named by their SHA-256 digest)
+and referenced by source and date, so improved parsers can rebuild parsed
+readings from the archive without fetching anything again.
+
+Layout::
+
+    <root>/objects/ab/abcdef....html.zst   (or .html.gz without zstandard)
+    <root>/refs/<source>/<YYYY-MM-DD>     (digest of the page for that date)
+"""
+
+import gzip
+import hashlib
+import os
+import tempfile
+from datetime import date, datetime
+from typing import List, Optional
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency; gzip is always available
+    zstandard = None
+
+from ..core.config import settings
+
+
+class HTMLArchive:
+    """Content-addressed, compressed store of raw HTML keyed by source and date."""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or settings.ARCHIVE_DIR
+
+    def put(self, source: str, target_date: date, html: str) -> str:
+        """Archive a page and point the (source, date) reference at it."""
+        raw = html.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+
+        if self._find_object(digest) is None:
+            if zstandard is not None:
+                path = self._object_path(digest, ".zst")
+                data = zstandard.ZstdCompressor(level=10).compress(raw)
+            else:
+                path = self._object_path(digest, ".gz")
+                data = gzip.compress(raw, compresslevel=9)
+            self._write_atomic(path, data)
+
+        self._write_atomic(self._ref_path(source, target_date), digest.encode("ascii"))
+        return digest
+
+    def get(self, source: str, target_date: date) -> Optional[str]:
+        """Return the archived page for a source and date, if any."""
+        try:
+            with open(self._ref_path(source, target_date), "rb") as f:
+                digest = f.read().decode("ascii").strip()
+        except FileNotFoundError:
+            return None
+
+        path = self._find_object(digest)
+        if path is None:
+            return None
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if path.endswith(".zst"):
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read " + path)
+            raw = zstandard.ZstdDecompressor().decompress(data)
+        else:
+            raw = gzip.decompress(data)
+        return raw.decode("utf-8")
+
+    def archived_at(self, source: str, target_date: date) -> Optional[datetime]:
+        """When the page for a source and date was last fetched and archived (UTC), if it was."""
+        try:
+            mtime = os.path.getmtime(self._ref_path(source, target_date))
+        except FileNotFoundError:
+            return None
+        return datetime.utcfromtimestamp(mtime)
+
+    def dates(self, source: str) -> List[date]:
+        """List the dates archived for a source, in order."""
+        ref_dir = os.path.join(self.root, "refs", source)
+        if not os.path.isdir(ref_dir):
+            return []
+        return sorted(date.fromisoformat(name) for name in os.listdir(ref_dir) if not name.startswith("."))
+
+    def _object_path(self, digest: str, extension: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], digest + ".html" + extension)
+
+    def _ref_path(self, source: str, target_date: date) -> str:
+        return os.path.join(self.root, "refs", source, target_date.isoformat())
+
+    def _find_object(self, digest: str) -> Optional[str]:
+        for extension in (".zst", ".gz"):
+            path = self._object_path(digest, extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        """Write a file so readers never observe a partial object."""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -0,0 +1,236 @@
+"""
+Offline batch jobs over the readings archive and store.
+
+These jobs are run from the command line (see app/cli.py), never from
+request handlers.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from ..core.rate_limit import RateLimiter
+from ..models.liturgical import DailyReadings
+from .archive import HTMLArchive
+from .data_sources import DataSourceManager, USCCBDataSource
+from .storage import ReadingsStore
+
+logger = logging.getLogger(__name__)
+
+
+def _reparse_one(job: Tuple[str, str]) -> Tuple[str, Optional[str], Optional[str], Optional[str]]:
+    """
+    Re-parse one archived page in a worker process.
+
+    Returns (date, readings JSON or None, time the page was fetched, error
+    message or None).
+    """
+    archive_root, date_str = job
+    try:
+        target_date = date.fromisoformat(date_str)
+        archive = HTMLArchive(archive_root)
+        html = archive.get(USCCBDataSource.ARCHIVE_SOURCE, target_date)
+        if html is None:
+            return date_str, None, None, None
+        fetched_at = archive.archived_at(USCCBDataSource.ARCHIVE_SOURCE, target_date)
+        readings = USCCBDataSource().parse_readings_page(html, target_date)
+        return date_str, readings.json() if readings else None, fetched_at.isoformat(), None
+    except Exception as e:
+        return date_str, None, None, str(e)
+
+
+def reparse_archive(
+    archive: HTMLArchive,
+    store: ReadingsStore,
+    workers: Optional[int] = None,
+    batch_size: int = 500,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> Dict[str, Any]:
+    """
+    Rebuild parsed readings from archived USCCB pages, without network access.
+
+    Pages are parsed in parallel across CPU cores and written to the store in
+    batches. Each entry keeps the time its page was originally fetched, so
+    re-parsing does not make old pages look fresh. Returns counts of parsed,
+    empty and failed pages.
+    """
+    dates = [
+        d for d in archive.dates(USCCBDataSource.ARCHIVE_SOURCE)
+        if (start is None or d >= start) and (end is None or d <= end)
+    ]
+    jobs = [(archive.root, d.isoformat()) for d in dates]
+    workers = workers or os.cpu_count() or 1
+
+    stats = {"pages": len(jobs), "parsed": 0, "empty": 0, "errors": 0}
+    batch = []
+
+    def flush():
+        if batch:
+            store.put_many(batch)
+            batch.clear()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        for date_str, data, fetched_at, error in executor.map(_reparse_one, jobs, chunksize=chunksize):
+            if error is not None:
+                logger.error(f"Error re-parsing archived page for {date_str}: {error}")
+                stats["errors"] += 1
+                continue
+
+            if data is None:
+                stats["empty"] += 1
+                continue
+
+            batch.append({
+                "readings": DailyReadings.parse_raw(data),
+                "fetched_at": datetime.fromisoformat(fetched_at),
+            })
+            stats["parsed"] += 1
+            if len(batch) >= batch_size:
+                flush()
+
+    flush()
+    return stats
+
+
+def _load_checkpoint(path: str, start: date, end: date) -> Tuple[date, List[date]]:
+    """Return (next date, failed dates) from a checkpoint for the same range."""
+    try:
+        with open(path) as f:
+            checkpoint = json.load(f)
+    except FileNotFoundError:
+        return start, []
+
+    if checkpoint.get("start") != start.isoformat() or checkpoint.get("end") != end.isoformat():
+        logger.warning(f"Ignoring checkpoint {path}: it is for a different date range")
+        return start, []
+
+    return (
+        date.fromisoformat(checkpoint["next"]),
+        [date.fromisoformat(d) for d in checkpoint.get("failed", [])],
+    )
+
+
+def _save_checkpoint(path: str, start: date, end: date, next_date: date, failed: List[date]):
+    """Atomically record backfill progress."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "next": next_date.isoformat(),
+            "failed": [d.isoformat() for d in sorted(failed)],
+        }, f)
+    os.replace(tmp_path, path)
+
+
+async def backfill_readings(
+    manager: DataSourceManager,
+    start: date,
+    end: date,
+    checkpoint_path: str,
+    concurrency: int = 4,
+    rate: float = 2.0,
+    batch_size: int = 50,
+    skip_existing: bool = True,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch readings for every date in [start, end] into the persistent store.
+
+    Requests run with bounded concurrency and are throttled to `rate` per
+    second. Results are written in batches; after each batch the checkpoint
+    records the first date not yet safely stored, plus dates that failed, so
+    a restarted backfill resumes where the last one stopped and retries
+    failures. Returns counts and throughput.
+    """
+    next_date, retry = _load_checkpoint(checkpoint_path, start, end)
+    dates = sorted(set(retry).union(
+        next_date + timedelta(days=i) for i in range((end - next_date).days + 1)
+    ))
+    if skip_existing:
+        existing = set(manager.store.dates())
+        dates = [d for d in dates if d not in existing]
+
+    limiter = RateLimiter(requests_per_minute=rate * 60, burst=concurrency, max_clients=1)
+    queue: asyncio.Queue = asyncio.Queue()
+    for d in dates:
+        queue.put_nowait(d)
+
+    stats = {"dates": len(dates), "fetched": 0, "empty": 0, "errors": 0}
+    remaining = set(dates)  # dates not yet finished, or finished but not yet stored
+    finished: set = set()  # finished dates waiting for the next flush
+    batch: List[Dict[str, Any]] = []
+    failed: List[date] = []
+    low_water = next_date
+    started = time.monotonic()
+
+    def report():
+        elapsed = time.monotonic() - started
+        done = stats["fetched"] + stats["empty"] + stats["errors"]
+        stats["elapsed"] = round(elapsed, 3)
+        stats["dates_per_second"] = round(done / elapsed, 3) if elapsed > 0 else 0.0
+        if progress:
+            progress(dict(stats))
+
+    def flush():
+        nonlocal low_water
+        if batch:
+            manager.store.put_many(batch)
+            batch.clear()
+        remaining.difference_update(finished)
+        finished.clear()
+
+        # Only advance past dates whose results are durable
+        while low_water <= end and low_water not in remaining:
+            low_water += timedelta(days=1)
+        # Retried dates from an earlier run lie before low_water; keep the
+        # unfinished ones in the checkpoint until they are stored
+        carried = {d for d in remaining if d < low_water}
+        _save_checkpoint(checkpoint_path, start, end, low_water, sorted(carried.union(failed)))
+        report()
+
+    async def worker():
+        while True:
+            try:
+                target_date = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            wait = limiter.acquire("upstream")
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = limiter.acquire("upstream")
+
+            try:
+                entry = await manager.usccb.fetch_readings(target_date, raise_errors=True)
+            except Exception:
+                stats["errors"] += 1
+                failed.append(target_date)
+                entry = None
+            else:
+                if entry:
+                    stats["fetched"] += 1
+                    batch.append({
+                        "readings": entry.readings,
+                        "etag": entry.etag,
+                        "last_modified": entry.last_modified,
+                        "fetched_at": entry.fetched_at,
+                    })
+                else:
+                    stats["empty"] += 1
+
+            finished.add(target_date)
+            if len(batch) >= batch_size:
+                flush()
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    flush()
+    return stats
@@ -0,0 +1,174 @@
+"""
+Columnar exports of liturgical days for analytics.
+
+Years are built straight from the calendar's year tables into Arrow record
+batches, one batch per year, and written as an Arrow IPC stream or as a
+Parquet file with one row group per year. Only one year is held in memory at
+a time, so decades can be exported with bounded memory.
+
+Requires the optional `pyarrow` package, which is imported on first use
+since it is slow to import and most workers never export.
+"""
+
+from datetime import date
+from typing import Iterator, Optional
+
+from .lectionary import lectionary_citations, lectionary_number
+from .liturgical_calendar import get_calendar
+
+COLUMNAR_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+# Set on first use by columnar_available()
+pa = None
+pq = None
+
+
+def columnar_available() -> bool:
+    """Whether the optional pyarrow package is installed; imports it on first call."""
+    global pa, pq
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:  # Optional dependency; columnar exports are unavailable without it
+            return False
+        pa, pq = pyarrow, pyarrow.parquet
+    return True
+
+
+def calendar_schema() -> "pa.Schema":
+    """Schema of the exported liturgical days."""
+    if not columnar_available():
+        raise RuntimeError("Columnar exports require the optional pyarrow package")
+    return pa.schema([
+        ("date", pa.date32()),
+        ("weekday", pa.string()),
+        ("season", pa.string()),
+        ("season_week", pa.int8()),
+        ("color", pa.string()),
+        ("sunday_cycle", pa.string()),
+        ("weekday_cycle", pa.string()),
+        ("psalter_week", pa.int8()),
+        ("celebration", pa.string()),
+        ("rank", pa.string()),
+        ("celebrations", pa.list_(pa.string())),
+        ("lectionary_number", pa.int16()),
+        ("first_reading", pa.string()),
+        ("responsorial_psalm", pa.string()),
+        ("second_reading", pa.string()),
+        ("gospel", pa.string()),
+    ])
+
+
+def year_batch(year: int, region: Optional[str] = None) -> "pa.RecordBatch":
+    """Build the record batch of every day of a year."""
+    columns = {name: [] for name in calendar_schema().names}
+    for target_date, day in get_calendar(year, region).iter_days():
+        primary = day.celebrations[0] if day.celebrations else None
+        citations = lectionary_citations(target_date, region)
+        columns["date"].append(target_date)
+        columns["weekday"].append(target_date.strftime("%A"))
+        columns["season"].append(day.season.value)
+        columns["season_week"].append(day.season_week)
+        columns["color"].append(day.color.value)
+        columns["sunday_cycle"].append(day.sunday_cycle)
+        columns["weekday_cycle"].append(day.weekday_cycle)
+        columns["psalter_week"].append(day.psalter_week)
+        columns["celebration"].append(primary.name if primary else None)
+        columns["rank"].append(primary.rank.value if primary else None)
+        columns["celebrations"].append([c.name for c in day.celebrations])
+        columns["lectionary_number"].append(lectionary_number(target_date, region))
+        columns["first_reading"].append(citations.first_reading if citations else None)
+        columns["responsorial_psalm"].append(citations.responsorial_psalm if citations else None)
+        columns["second_reading"].append(citations.second_reading if citations else None)
+        columns["gospel"].append(citations.gospel if citations else None)
+
+    schema = calendar_schema()
+    return pa.RecordBatch.from_arrays(
+        [pa.array(columns[field.name], type=field.type) for field in schema],
+        schema=schema
+    )
+
+
+class _ChunkSink:
+    """Write-only file collecting what a writer produces until it is drained."""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _open_writer(sink, export_format: str):
+    """Open an Arrow IPC stream or Parquet writer on a sink."""
+    if export_format == "arrow":
+        return pa.ipc.new_stream(sink, calendar_schema())
+    if export_format == "parquet":
+        return pq.ParquetWriter(sink, calendar_schema(), compression="zstd")
+    raise ValueError(f"Unknown columnar format: {export_format}")
+
+
+def iter_columnar(
+    start_year: int,
+    end_year: int,
+    export_format: str = "arrow",
+    region: Optional[str] = None
+) -> Iterator[bytes]:
+    """
+    Yield an export of the years [start_year, end_year] in pieces.
+
+    Each year is built, written and released before the next one, so the
+    bytes of one year are yielded as soon as they are encoded.
+    """
+    if not columnar_available():
+        raise RuntimeError("Columnar exports require the optional pyarrow package")
+
+    sink = _ChunkSink()
+    writer = _open_writer(pa.PythonFile(sink, mode="w"), export_format)
+    try:
+        for year in range(start_year, end_year + 1):
+            writer.write_batch(year_batch(year, region))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def write_columnar(
+    path: str,
+    start_year: int,
+    end_year: int,
+    export_format: str = "parquet",
+    region: Optional[str] = None
+) -> int:
+    """Write an export of the years [start_year, end_year] to a file; returns the bytes written."""
+    written = 0
+    with open(path, "wb") as f:
+        for chunk in iter_columnar(start_year, end_year, export_format, region):
+            f.write(chunk)
+            written += len(chunk)
+    return written
@@ -0,0 +1,139 @@
+"""
+Compiled, memory-mapped readings corpus.
+
+Readings for a date never change once published, so the persistent store can
+be compiled into a single read-only file (`python -m app.cli build-corpus`):
+
+    header   magic "CMRC", format version, entry count
+    index    one (date ordinal, offset, length) record per date, sorted by date
+    blobs    the readings of each date as UTF-8 JSON
+
+The service memory-maps the file and slices readings straight out of it.
+Every worker on a host shares the same pages through the OS cache, and a cold
+start needs neither the network nor a database query for compiled dates.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from datetime import date
+from typing import Iterable, Iterator, Optional, Tuple
+
+from ..models.liturgical import DailyReadings
+
+MAGIC = b"CMRC"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHI")  # magic, version, reserved, entry count
+_ENTRY = struct.Struct("<IQI")  # date ordinal, blob offset, blob length
+
+
+def write_corpus(path: str, entries: Iterable[Tuple[date, str]]) -> int:
+    """
+    Compile (date, readings JSON) pairs into a corpus file.
+
+    The file is written next to its destination and moved into place, so a
+    running service never sees a partially written corpus. Returns the
+    number of dates written.
+    """
+    blobs = sorted((target_date.toordinal(), data.encode("utf-8")) for target_date, data in entries)
+
+    offset = _HEADER.size + _ENTRY.size * len(blobs)
+    index = bytearray()
+    for ordinal, blob in blobs:
+        index += _ENTRY.pack(ordinal, offset, len(blob))
+        offset += len(blob)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(blobs)))
+        f.write(index)
+        for _, blob in blobs:
+            f.write(blob)
+    os.replace(temporary, path)
+    return len(blobs)
+
+
+class ReadingsCorpus:
+    """Read-only view of a compiled corpus file, mapped on first use."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._ordinals: Optional[array] = None
+
+    def _open(self):
+        """Map the file and load the date column of its index."""
+        f = open(self.path, "rb")
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            f.close()
+            raise
+
+        magic, version, _, count = _HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC or version != VERSION:
+            mapped.close()
+            f.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} readings corpus")
+
+        ordinals = array("I")
+        for position in range(count):
+            ordinals.append(_ENTRY.unpack_from(mapped, _HEADER.size + position * _ENTRY.size)[0])
+
+        self._file, self._map, self._ordinals = f, mapped, ordinals
+
+    def _position(self, target_date: date) -> Optional[int]:
+        """Index position of a date, if it is in the corpus."""
+        if self._map is None:
+            self._open()
+        ordinal = target_date.toordinal()
+        position = bisect_left(self._ordinals, ordinal)
+        if position < len(self._ordinals) and self._ordinals[position] == ordinal:
+            return position
+        return None
+
+    def get_json(self, target_date: date) -> Optional[memoryview]:
+        """The readings for a date as UTF-8 JSON, sliced from the map without copying."""
+        position = self._position(target_date)
+        if position is None:
+            return None
+        _, offset, length = _ENTRY.unpack_from(self._map, _HEADER.size + position * _ENTRY.size)
+        return memoryview(self._map)[offset:offset + length]
+
+    def get(self, target_date: date) -> Optional[DailyReadings]:
+        """The readings for a date, if compiled."""
+        data = self.get_json(target_date)
+        if data is None:
+            return None
+        with data:
+            return DailyReadings.parse_raw(bytes(data))
+
+    def iter_json(self) -> Iterator[Tuple[date, bytes]]:
+        """Yield (date, readings JSON) for every compiled date, in date order."""
+        if self._map is None:
+            self._open()
+        for position, ordinal in enumerate(self._ordinals):
+            _, offset, length = _ENTRY.unpack_from(self._map, _HEADER.size + position * _ENTRY.size)
+            yield date.fromordinal(ordinal), self._map[offset:offset + length]
+
+    def __len__(self) -> int:
+        if self._map is None:
+            self._open()
+        return len(self._ordinals)
+
+    def close(self):
+        """Unmap the file."""
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # Slices are still referenced; the map is released with them
+                pass
+            self._file.close()
+            self._map = self._file = self._ordinals = None
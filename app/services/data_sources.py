@@ -5,34 +5,110 @@ This module implements ethical scraping practices with proper attribution
 and respect for copyright and usage policies.
 """
 
-import httpx
-from bs4 import BeautifulSoup
 from datetime import datetime, date, timedelta
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, AsyncIterator, Iterator, Tuple, Union
+from dataclasses import dataclass
+from collections import defaultdict, deque
 import asyncio
 import logging
+import os
 from urllib.parse import urljoin, quote
 
 from ..core.config import settings
 from ..models.liturgical import Reading, Psalm, DailyReadings, LiturgicalDay
-from .liturgical_calendar import LiturgicalCalendar
+from ..models.compact import CompactReadings
+from .liturgical_calendar import get_calendar
+from .storage import DocumentStore, ReadingsStore
+from .archive import HTMLArchive
+from .corpus import ReadingsCorpus
+from .scripture import ScriptureIndex
+from .prayer_catalog import get_prayer_catalog
+from .search import SearchIndex
+from .lectionary import lectionary_readings
+
+if TYPE_CHECKING:
+    import httpx
+    from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
 
+# The scraping stack (httpx, BeautifulSoup) is slow to import and only needed
+# when a lookup misses every local cache, so it is imported on first use
+def _httpx():
+    """The httpx module, imported on first use."""
+    import httpx
+    return httpx
+
+
+def _parse_html(html: str) -> "BeautifulSoup":
+    """Parse an HTML page, importing BeautifulSoup on first use."""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, 'html.parser')
+
+
+@dataclass(slots=True)
+class ReadingsCacheEntry:
+    """
+    Cached readings together with the upstream HTTP validators.
+    
+    The readings are held in their compact form; `readings` builds the
+    Pydantic model when a response needs it.
+    """
+    compact: CompactReadings
+    fetched_at: datetime
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    
+    @classmethod
+    def from_readings(
+        cls,
+        readings: DailyReadings,
+        fetched_at: datetime,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> "ReadingsCacheEntry":
+        """Create an entry from parsed readings."""
+        return cls(CompactReadings.from_model(readings), fetched_at, etag, last_modified)
+    
+    @property
+    def readings(self) -> DailyReadings:
+        """The cached readings as a response model."""
+        return self.compact.to_model()
+    
+    def is_fresh(self, now: datetime) -> bool:
+        """Whether the entry can be served without revalidation."""
+        return (now - self.fetched_at).total_seconds() < settings.READINGS_CACHE_TIME
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers for revalidating this entry with the source."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
 class USCCBDataSource:
     """
     Data source for USCCB (United States Conference of Catholic Bishops).
     
     Note: This implementation respects USCCB's usage policies and provides
     proper attribution. For commercial use, additional licensing may be required.
+    
+    When an HTMLArchive is given, every downloaded page is archived so it can
+    be re-parsed later without fetching it again.
     """
     
-    def __init__(self):
+    ARCHIVE_SOURCE = "usccb"
+    
+    def __init__(self, archive: Optional[HTMLArchive] = None):
         self.base_url = settings.USCCB_BASE_URL
         self.session = None
+        self.archive = archive
     
-    async def _get_session(self) -> httpx.AsyncClient:
+    async def _get_session(self) -> "httpx.AsyncClient":
         """Get or create HTTP session with proper headers."""
         if self.session is None:
             headers = {
@@ -42,7 +118,7 @@ class USCCBDataSource:
                 'Accept-Encoding': 'gzip, deflate',
                 'Connection': 'keep-alive',
             }
-            self.session = httpx.AsyncClient(
+            self.session = _httpx().AsyncClient(
                 headers=headers,
                 timeout=settings.REQUEST_TIMEOUT,
                 follow_redirects=True
@@ -61,6 +137,24 @@ class USCCBDataSource:
         
         Note: This respects USCCB's copyright policies and provides proper attribution.
         """
+        entry = await self.fetch_readings(target_date)
+        return entry.readings if entry else None
+    
+    async def fetch_readings(
+        self,
+        target_date: date,
+        cached: Optional["ReadingsCacheEntry"] = None,
+        raise_errors: bool = False
+    ) -> Optional["ReadingsCacheEntry"]:
+        """
+        Fetch readings for a date, revalidating a previously cached entry.
+        
+        When a cached entry is given its ETag/Last-Modified validators are sent
+        with the request. On 304 Not Modified the page is neither downloaded
+        nor parsed again; the cached entry is returned with renewed freshness.
+        
+        Errors are logged and None is returned, unless raise_errors is set.
+        """
         try:
             session = await self._get_session()
             
@@ -68,33 +162,69 @@ class USCCBDataSource:
             date_str = target_date.strftime("%m/%d/%Y")
             url = f"{self.base_url}/bible/readings/{quote(date_str)}.cfm"
             
+            headers = cached.conditional_headers() if cached else {}
+            
             logger.info(f"Fetching readings from USCCB for {target_date}: {url}")
             
-            response = await session.get(url)
+            response = await session.get(url, headers=headers)
+            
+            if response.status_code == 304 and cached:
+                cached.fetched_at = datetime.utcnow()
+                return cached
+            
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            if self.archive is not None:
+                await self._archive_page(target_date, response.text)
             
-            # Parse the readings - this is a simplified parser
-            # In practice, you'd need more robust parsing
-            readings_data = self._parse_usccb_readings(soup, target_date)
+            readings = self.parse_readings_page(response.text, target_date)
             
-            if readings_data:
-                return DailyReadings(
-                    date=target_date,
-                    **readings_data,
-                    source="USCCB - United States Conference of Catholic Bishops",
-                    last_updated=datetime.utcnow()
+            if readings:
+                return ReadingsCacheEntry.from_readings(
+                    readings=readings,
+                    fetched_at=datetime.utcnow(),
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
                 )
             
-        except httpx.HTTPError as e:
+        except _httpx().HTTPError as e:
             logger.error(f"HTTP error fetching USCCB readings: {e}")
+            if raise_errors:
+                raise
         except Exception as e:
             logger.error(f"Error parsing USCCB readings: {e}")
+            if raise_errors:
+                raise
         
         return None
     
-    def _parse_usccb_readings(self, soup: BeautifulSoup, target_date: date) -> Optional[Dict[str, Any]]:
+    async def _archive_page(self, target_date: date, html: str):
+        """Archive a raw page off the event loop; failures never block readings."""
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.archive.put, self.ARCHIVE_SOURCE, target_date, html)
+        except Exception as e:
+            logger.error(f"Error archiving USCCB page for {target_date}: {e}")
+    
+    def parse_readings_page(self, html: str, target_date: date) -> Optional[DailyReadings]:
+        """Parse a raw USCCB readings page into DailyReadings."""
+        soup = _parse_html(html)
+        
+        # Parse the readings - this is a simplified parser
+        # In practice, you'd need more robust parsing
+        readings_data = self._parse_usccb_readings(soup, target_date)
+        
+        if not readings_data:
+            return None
+        
+        return DailyReadings(
+            date=target_date,
+            **readings_data,
+            source="USCCB - United States Conference of Catholic Bishops",
+            last_updated=datetime.utcnow()
+        )
+    
+    def _parse_usccb_readings(self, soup: "BeautifulSoup", target_date: date) -> Optional[Dict[str, Any]]:
         """
         Parse USCCB readings page.
         
@@ -170,19 +300,30 @@ class USCCBDataSource:
         return None
 
 
+# Vatican liturgical documents summarised by VaticanDataSource (these are examples)
+VATICAN_DOCUMENT_URLS = [
+    "/roman_curia/congregations/ccdds/documents/rc_con_ccdds_doc_20030317_ordinamento-messale_en.html",
+    "/holy_father/benedict_xvi/motu_proprio/documents/hf_ben-xvi_motu-proprio_20070707_summorum-pontificum_en.html"
+]
+
+
 class VaticanDataSource:
     """
     Data source for Vatican official sources.
     
     This implementation respects Vatican usage policies and provides
-    proper attribution for all content.
+    proper attribution for all content. Parsed documents are kept in memory
+    and in a persistent DocumentStore, and are revalidated with conditional
+    requests once they are older than DOCUMENTS_CACHE_TIME.
     """
     
-    def __init__(self):
+    def __init__(self, store: Optional[DocumentStore] = None):
         self.base_url = settings.VATICAN_BASE_URL
         self.session = None
+        self.store = store or DocumentStore()
+        self._documents: Dict[str, Dict[str, Any]] = {}
     
-    async def _get_session(self) -> httpx.AsyncClient:
+    async def _get_session(self) -> "httpx.AsyncClient":
         """Get or create HTTP session with proper headers."""
         if self.session is None:
             headers = {
@@ -190,7 +331,7 @@ class VaticanDataSource:
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
             }
-            self.session = httpx.AsyncClient(
+            self.session = _httpx().AsyncClient(
                 headers=headers,
                 timeout=settings.REQUEST_TIMEOUT,
                 follow_redirects=True
@@ -202,106 +343,440 @@ class VaticanDataSource:
         if self.session:
             await self.session.aclose()
             self.session = None
+        self.store.close()
     
     async def get_liturgical_documents(self) -> List[Dict[str, Any]]:
         """
         Retrieve liturgical documents from Vatican sources.
         
         This method fetches publicly available liturgical documents
-        and provides proper attribution.
+        concurrently and provides proper attribution.
         """
-        documents = []
+        urls = [urljoin(self.base_url, doc_url) for doc_url in VATICAN_DOCUMENT_URLS]
+        
+        try:
+            results = await asyncio.gather(*(self._get_document(url) for url in urls))
+        except Exception as e:
+            logger.error(f"Error fetching Vatican documents: {e}")
+            return []
+        
+        return [
+            {
+                'title': document['title'],
+                'url': document['url'],
+                'content': document['content'],
+                'source': document['source'],
+            }
+            for document in results if document
+        ]
+    
+    async def _get_document(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return a document summary, revalidating the cached copy when stale."""
+        cached = self._documents.get(url)
+        if cached is None:
+            cached = await asyncio.to_thread(self.store.get, url)
+            if cached:
+                self._documents[url] = cached
+        
+        now = datetime.utcnow()
+        if cached and (now - cached['fetched_at']).total_seconds() < settings.DOCUMENTS_CACHE_TIME:
+            return cached
+        
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
         
         try:
             session = await self._get_session()
+            response = await session.get(url, headers=headers)
             
-            # Vatican liturgical documents URLs (these are examples)
-            document_urls = [
-                "/roman_curia/congregations/ccdds/documents/rc_con_ccdds_doc_20030317_ordinamento-messale_en.html",
-                "/holy_father/benedict_xvi/motu_proprio/documents/hf_ben-xvi_motu-proprio_20070707_summorum-pontificum_en.html"
-            ]
+            if response.status_code == 304 and cached:
+                cached['fetched_at'] = now
+                await asyncio.to_thread(self.store.touch, url, now)
+                return cached
             
-            for doc_url in document_urls:
-                url = urljoin(self.base_url, doc_url)
-                
-                try:
-                    response = await session.get(url)
-                    response.raise_for_status()
-                    
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # Extract document information
-                    title_elem = soup.find(['h1', 'h2', 'title'])
-                    content_elem = soup.find(['div', 'article'], class_=['content', 'document'])
-                    
-                    if title_elem and content_elem:
-                        documents.append({
-                            'title': title_elem.get_text().strip(),
-                            'url': url,
-                            'content': content_elem.get_text().strip()[:1000] + "...",  # Truncated
-                            'source': "Vatican Official Website"
-                        })
-                
-                except httpx.HTTPError as e:
-                    logger.error(f"Error fetching Vatican document {url}: {e}")
-                    continue
-        
-        except Exception as e:
-            logger.error(f"Error fetching Vatican documents: {e}")
+            response.raise_for_status()
+            
+            soup = _parse_html(response.text)
+            
+            # Extract document information
+            title_elem = soup.find(['h1', 'h2', 'title'])
+            content_elem = soup.find(['div', 'article'], class_=['content', 'document'])
+            
+            if not (title_elem and content_elem):
+                return cached
+            
+            document = {
+                'title': title_elem.get_text().strip(),
+                'url': url,
+                'content': content_elem.get_text().strip()[:1000] + "...",  # Truncated
+                'source': "Vatican Official Website",
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'fetched_at': now,
+            }
+            await asyncio.to_thread(self.store.put, document)
+            self._documents[url] = document
+            return document
         
-        return documents
+        except _httpx().HTTPError as e:
+            logger.error(f"Error fetching Vatican document {url}: {e}")
+            # Serve the stale copy rather than nothing
+            return cached
+
+
+class FetchBudget:
+    """
+    Upstream fetches one request may still trigger.
+    
+    Shared by the lookups of a batch or range, so a single request cannot
+    turn into hundreds of calls to the upstream site. Dates left without
+    readings because the budget ran out are collected in `skipped`, so
+    responses can tell them apart from dates that have no readings.
+    """
+    
+    def __init__(self, limit: int):
+        self.remaining = limit
+        self.skipped: List[date] = []
+    
+    def take(self) -> bool:
+        """Use one fetch if any are left."""
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
 
 
 class DataSourceManager:
     """
     Manager for all data sources with caching and fallback logic.
+    
+    Readings are looked up in memory, then in the compiled corpus (if one
+    has been built), then in the persistent ReadingsStore, and only then
+    fetched from the network (and written through to the store).
     """
     
-    def __init__(self):
-        self.usccb = USCCBDataSource()
+    def __init__(
+        self,
+        store: Optional[ReadingsStore] = None,
+        archive: Optional[HTMLArchive] = None,
+        corpus: Optional[ReadingsCorpus] = None
+    ):
+        if archive is None and settings.ARCHIVE_ENABLED:
+            archive = HTMLArchive()
+        if corpus is None and settings.READINGS_CORPUS_PATH and os.path.exists(settings.READINGS_CORPUS_PATH):
+            corpus = ReadingsCorpus(settings.READINGS_CORPUS_PATH)
+        self.usccb = USCCBDataSource(archive=archive)
         self.vatican = VaticanDataSource()
-        self._cache: Dict[str, Any] = {}
+        self.store = store or ReadingsStore()
+        self.corpus = corpus
+        self._cache: Dict[str, ReadingsCacheEntry] = {}
+        self._scripture_index: Optional[ScriptureIndex] = None
+        self._search_index: Optional[SearchIndex] = None
+        self._index_lock = asyncio.Lock()
+        self._index_building = False
+        self._pending_readings: List[DailyReadings] = []
     
     async def close(self):
         """Close all data source sessions."""
         await self.usccb.close()
         await self.vatican.close()
+        self.store.close()
+        if self.corpus is not None:
+            self.corpus.close()
     
-    async def get_daily_readings(self, target_date: date) -> Optional[DailyReadings]:
+    def get_compiled_readings_json(self, target_date: date) -> Optional[memoryview]:
+        """
+        Readings for a date as JSON straight from the compiled corpus.
+        
+        Returns None when no corpus is loaded or the date is not in it.
+        """
+        if self.corpus is None:
+            return None
+        return self.corpus.get_json(target_date)
+    
+    async def get_liturgical_documents(self) -> List[Dict[str, Any]]:
+        """Get summaries of official Vatican liturgical documents."""
+        return await self.vatican.get_liturgical_documents()
+    
+    def get_reading_references(self, target_date: date) -> Optional[DailyReadings]:
+        """
+        Readings of a date with references only, answered from the local lectionary index.
+        
+        Returns None for dates the index does not cover.
+        """
+        return lectionary_readings(target_date)
+    
+    def _local_readings_json(self) -> Iterator[Tuple[date, Union[str, bytes]]]:
+        """(date, readings JSON) of every compiled and stored date; stored copies come last."""
+        if self.corpus is not None:
+            yield from self.corpus.iter_json()
+        yield from self.store.iter_json()
+    
+    def _build_search_index(self) -> SearchIndex:
+        """Index the catalog prayers and all local readings."""
+        index = SearchIndex()
+        index.add_prayers(get_prayer_catalog().variants())
+        for _, data in self._local_readings_json():
+            index.add_readings(DailyReadings.parse_raw(data))
+        return index
+    
+    async def _get_index(self, name: str, build):
+        """
+        Return the index held in attribute `name`, building it on first use.
+        
+        The build reads every local date, so it runs in a worker thread and
+        the event loop keeps serving other requests. Readings stored while
+        it runs are queued and added once it finishes.
+        """
+        async with self._index_lock:
+            index = getattr(self, name)
+            if index is None:
+                self._index_building = True
+                try:
+                    index = await asyncio.to_thread(build)
+                finally:
+                    self._index_building = False
+                for readings in self._pending_readings:
+                    index.add_readings(readings)
+                self._pending_readings.clear()
+                setattr(self, name, index)
+            return index
+    
+    async def get_search_index(self) -> SearchIndex:
+        """
+        Full-text index of the prayers and all compiled and stored readings.
+        
+        Built on first use, then kept up to date as new readings are stored.
+        """
+        return await self._get_index("_search_index", self._build_search_index)
+    
+    def _index_readings(self, readings: DailyReadings):
+        """Add newly stored readings to the built indexes, or queue them for one being built."""
+        if self._search_index is not None:
+            self._search_index.add_readings(readings)
+        if self._scripture_index is not None:
+            self._scripture_index.add_readings(readings)
+        if self._index_building:
+            self._pending_readings.append(readings)
+    
+    def _build_scripture_index(self) -> ScriptureIndex:
+        """Index the scripture references of all local readings."""
+        index = ScriptureIndex()
+        for target_date, data in self._local_readings_json():
+            index.add_json(target_date, data)
+        return index
+    
+    async def get_scripture_index(self) -> ScriptureIndex:
+        """
+        Index of the scripture references of all compiled and stored readings.
+        
+        Built on first use, then kept up to date as new readings are stored.
+        """
+        return await self._get_index("_scripture_index", self._build_scripture_index)
+    
+    async def get_daily_readings(
+        self,
+        target_date: date,
+        budget: Optional[FetchBudget] = None
+    ) -> Optional[DailyReadings]:
         """
         Get daily readings with fallback logic and caching.
+        
+        With a budget, the network is only used while the budget lasts;
+        after that only local copies (possibly stale) are returned.
         """
         cache_key = f"readings_{target_date.isoformat()}"
+        now = datetime.utcnow()
         
-        # Check cache first
-        if cache_key in self._cache:
-            cached_data, timestamp = self._cache[cache_key]
-            if (datetime.utcnow() - timestamp).seconds < settings.READINGS_CACHE_TIME:
-                return cached_data
+        # Check cache first, then the compiled corpus and the persistent store
+        cached = self._cache.get(cache_key)
+        if cached is None and self.corpus is not None:
+            compiled = self.corpus.get(target_date)
+            if compiled:
+                return compiled
+        if cached is None:
+            stored = await asyncio.to_thread(self.store.get, target_date)
+            if stored:
+                cached = ReadingsCacheEntry.from_readings(**stored)
+                self._cache[cache_key] = cached
+                self._index_readings(stored['readings'])
+        if cached and cached.is_fresh(now):
+            return cached.readings
+        if budget is not None and not budget.take():
+            if cached:
+                return cached.readings
+            budget.skipped.append(target_date)
+            return None
         
-        # Try USCCB first
-        readings = await self.usccb.get_daily_readings(target_date)
+        # Try USCCB first, revalidating any stale cached copy
+        entry = await self.usccb.fetch_readings(target_date, cached=cached)
         
-        if readings:
+        if entry:
             # Cache the result
-            self._cache[cache_key] = (readings, datetime.utcnow())
+            self._cache[cache_key] = entry
+            readings = entry.readings
+            if entry is cached:
+                await asyncio.to_thread(self.store.touch, target_date, entry.fetched_at)
+            else:
+                await asyncio.to_thread(self.store.put, {
+                    'readings': readings,
+                    'etag': entry.etag,
+                    'last_modified': entry.last_modified,
+                    'fetched_at': entry.fetched_at,
+                })
+                self._index_readings(readings)
             return readings
         
+        if cached:
+            # Serve the stale copy rather than nothing
+            return cached.readings
+        
         # TODO: Add fallback sources
         logger.warning(f"No readings found for {target_date}")
         return None
     
-    async def get_liturgical_day(self, target_date: date) -> LiturgicalDay:
+    async def get_liturgical_day(
+        self,
+        target_date: date,
+        include_readings: bool = False,
+        region: Optional[str] = None
+    ) -> LiturgicalDay:
         """
-        Get complete liturgical day information combining calendar and readings.
+        Get liturgical day information, optionally combined with readings.
+        
+        Without readings this is a purely local calendar computation; readings
+        may need a network round trip and are only fetched when requested.
+        The day follows the calendar of the given region, or the universal
+        calendar.
         """
         # Calculate liturgical calendar information
-        calendar = LiturgicalCalendar(target_date.year)
+        calendar = get_calendar(target_date.year, region)
         liturgical_day = calendar.get_liturgical_day(target_date)
         
         # Add readings from data sources
-        readings = await self.get_daily_readings(target_date)
-        if readings:
-            liturgical_day.readings = readings
+        if include_readings:
+            readings = await self.get_daily_readings(target_date)
+            if readings:
+                liturgical_day.readings = readings
+        
+        return liturgical_day
+    
+    async def get_daily_readings_many(
+        self,
+        dates: List[date],
+        budget: Optional[FetchBudget] = None
+    ) -> Dict[date, Optional[DailyReadings]]:
+        """
+        Get readings for many dates, resolving them concurrently.
+        
+        At most BATCH_CONCURRENCY lookups run at once; duplicate dates are
+        looked up once. With a budget, dates beyond it are only looked up
+        locally; those without a local copy get None and are recorded in
+        `budget.skipped`.
+        """
+        semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+        
+        async def lookup(target_date: date):
+            async with semaphore:
+                return target_date, await self.get_daily_readings(target_date, budget)
+        
+        results = await asyncio.gather(*(lookup(d) for d in dict.fromkeys(dates)))
+        return dict(results)
+    
+    async def iter_daily_readings(
+        self,
+        start: date,
+        end: date,
+        budget: Optional[FetchBudget] = None
+    ) -> AsyncIterator[Tuple[date, Optional[DailyReadings]]]:
+        """
+        Yield (date, readings) for each date in [start, end], in order.
+        
+        Up to BATCH_CONCURRENCY lookups run ahead of the consumer, so each
+        day is yielded as soon as it and all earlier days are resolved while
+        memory stays bounded regardless of the range length. With a budget,
+        dates beyond it are yielded with local copies only (or None, and
+        recorded in `budget.skipped`).
+        """
+        window: deque = deque()
+        next_date = start
+        
+        def schedule():
+            nonlocal next_date
+            while next_date <= end and len(window) < settings.BATCH_CONCURRENCY:
+                window.append((next_date, asyncio.ensure_future(self.get_daily_readings(next_date, budget))))
+                next_date += timedelta(days=1)
+        
+        try:
+            schedule()
+            while window:
+                target_date, task = window.popleft()
+                readings = await task
+                schedule()
+                yield target_date, readings
+        finally:
+            # The consumer may stop early (e.g. the client disconnected)
+            for _, task in window:
+                task.cancel()
+    
+    async def get_liturgical_days(
+        self,
+        dates: List[date],
+        include_readings: bool = False,
+        region: Optional[str] = None,
+        budget: Optional[FetchBudget] = None
+    ) -> List[LiturgicalDay]:
+        """
+        Get liturgical days for many dates, in the order given.
+        
+        Dates are grouped by year so each year's calendar is computed once.
+        When requested, readings for all dates are fetched concurrently,
+        within the fetch budget, if one is given.
+        """
+        by_year: Dict[int, List[date]] = defaultdict(list)
+        for target_date in dict.fromkeys(dates):
+            by_year[target_date.year].append(target_date)
         
-        return liturgical_day
\ No newline at end of file
+        days: Dict[date, LiturgicalDay] = {}
+        for year, year_dates in by_year.items():
+            calendar = get_calendar(year, region)
+            for target_date in year_dates:
+                days[target_date] = calendar.get_liturgical_day(target_date)
+        
+        if not include_readings:
+            return [days[d] for d in dates]
+        
+        readings = await self.get_daily_readings_many(list(days), budget)
+        for target_date, day_readings in readings.items():
+            if day_readings:
+                days[target_date].readings = day_readings
+        
+        return [days[d] for d in dates]
+
+
+_shared_manager: Optional[DataSourceManager] = None
+
+
+def get_shared_manager() -> DataSourceManager:
+    """
+    The data source manager shared by all routers, created on first use.
+    
+    Nothing is opened while the application is imported, and every router
+    reads and warms the same caches.
+    """
+    global _shared_manager
+    if _shared_manager is None:
+        _shared_manager = DataSourceManager()
+    return _shared_manager
+
+
+async def close_shared_manager():
+    """Close the shared manager, if it was ever created."""
+    global _shared_manager
+    if _shared_manager is not None:
+        manager, _shared_manager = _shared_manager, None
+        await manager.close()
@@ -0,0 +1,177 @@
+"""
+Calendar exports for calendar subscriptions and bulk downloads.
+
+Exports are generated by streaming through a year table one day at a time.
+The finished bytes are cached per (format, year, region) together with an
+ETag, so calendar clients polling a subscription are served the same blob,
+or a 304, without anything being regenerated.
+"""
+
+import csv
+import hashlib
+import io
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from ..models.compact import CompactDay
+from .liturgical_calendar import get_calendar
+from .regions import REGIONS, UNIVERSAL
+
+ICS_PRODID = "-//Catholic Missal API//Liturgical Calendar//EN"
+ICS_UID_DOMAIN = "catholic-missal-api"
+ICS_MAX_LINE = 75  # Octets per line before folding (RFC 5545, 3.1)
+
+CSV_COLUMNS = (
+    "date", "weekday", "season", "season_week", "color", "sunday_cycle",
+    "weekday_cycle", "psalter_week", "celebration", "rank", "other_celebrations",
+)
+
+
+@dataclass(frozen=True)
+class ExportBlob:
+    """A finished export with its validator."""
+    body: bytes
+    etag: str
+    media_type: str
+
+
+def _ics_escape(text: str) -> str:
+    """Escape a TEXT value."""
+    return (
+        text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+    )
+
+
+def _ics_line(line: str) -> str:
+    """Fold a content line to 75 octets, without splitting UTF-8 sequences."""
+    if len(line.encode("utf-8")) <= ICS_MAX_LINE:
+        return line + "\r\n"
+
+    parts = []
+    current = ""
+    size = 0
+    limit = ICS_MAX_LINE
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > limit:
+            parts.append(current)
+            current, size = "", 0
+            limit = ICS_MAX_LINE - 1  # Continuation lines start with a space
+        current += char
+        size += width
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _day_summary(target_date: date, day: CompactDay) -> Optional[str]:
+    """Title of a day's event, or None for weekdays without a celebration."""
+    if day.celebrations:
+        return day.celebrations[0].name
+    if target_date.weekday() == 6:
+        if day.season_week:
+            return f"Sunday, {day.season.value} Week {day.season_week}"
+        return f"Sunday, {day.season.value}"
+    return None
+
+
+def iter_ics(year: int, region: Optional[str] = None) -> Iterator[str]:
+    """
+    Yield an iCalendar document for a year, a few lines at a time.
+
+    Each celebration and Sunday is an all-day event; other weekdays are left
+    out so subscribed calendars stay readable.
+    """
+    calendar = get_calendar(year, region)
+    code = region or UNIVERSAL
+    name = REGIONS[region].name if region else "General Roman Calendar"
+
+    yield "".join(_ics_line(line) for line in (
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{ICS_PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_ics_escape(f'Liturgical Calendar {year} ({name})')}",
+    ))
+
+    # A fixed stamp keeps the document, and so its ETag, stable between runs
+    stamp = f"{year:04d}0101T000000Z"
+    for target_date, day in calendar.iter_days():
+        summary = _day_summary(target_date, day)
+        if summary is None:
+            continue
+
+        details = [day.season.value, day.color.value.title()]
+        if day.celebrations:
+            details.insert(0, day.celebrations[0].rank.value)
+            if day.celebrations[0].description:
+                details.append(day.celebrations[0].description)
+
+        yield "".join(_ics_line(line) for line in (
+            "BEGIN:VEVENT",
+            f"UID:{target_date.isoformat()}-{code}@{ICS_UID_DOMAIN}",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{target_date.strftime('%Y%m%d')}",
+            f"DTEND;VALUE=DATE:{(target_date + timedelta(days=1)).strftime('%Y%m%d')}",
+            f"SUMMARY:{_ics_escape(summary)}",
+            f"DESCRIPTION:{_ics_escape(' - '.join(details))}",
+            f"CATEGORIES:{_ics_escape(day.celebrations[0].rank.value if day.celebrations else 'Sunday')}",
+            "TRANSP:TRANSPARENT",
+            "END:VEVENT",
+        ))
+
+    yield _ics_line("END:VCALENDAR")
+
+
+def iter_csv(year: int, region: Optional[str] = None) -> Iterator[str]:
+    """Yield a CSV table of every day of a year, one row at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\r\n")
+
+    def row(values) -> str:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(values)
+        return buffer.getvalue()
+
+    yield row(CSV_COLUMNS)
+    for target_date, day in get_calendar(year, region).iter_days():
+        primary = day.celebrations[0] if day.celebrations else None
+        yield row((
+            target_date.isoformat(),
+            target_date.strftime("%A"),
+            day.season.value,
+            day.season_week or "",
+            day.color.value,
+            day.sunday_cycle or "",
+            day.weekday_cycle or "",
+            day.psalter_week or "",
+            primary.name if primary else "",
+            primary.rank.value if primary else "",
+            "; ".join(c.name for c in day.celebrations[1:]),
+        ))
+
+
+EXPORT_FORMATS: Dict[str, Tuple[Callable[[int, Optional[str]], Iterator[str]], str]] = {
+    "ics": (iter_ics, "text/calendar; charset=utf-8"),
+    "csv": (iter_csv, "text/csv; charset=utf-8"),
+}
+
+
+def export_year(export_format: str, year: int, region: Optional[str] = None) -> ExportBlob:
+    """
+    Get the finished export of a year in a format ("ics" or "csv").
+
+    Raises KeyError for unknown formats or regions.
+    """
+    return _export_year(export_format, year, None if region == UNIVERSAL else region)
+
+
+@lru_cache(maxsize=64)
+def _export_year(export_format: str, year: int, region: Optional[str]) -> ExportBlob:
+    generate, media_type = EXPORT_FORMATS[export_format]
+    body = "".join(generate(year, region)).encode("utf-8")
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    return ExportBlob(body, etag, media_type)
@@ -0,0 +1,202 @@
+"""
+Lectionary index: liturgical day → lectionary number → reading citations.
+
+The readings of a Mass follow from the liturgical day, the Sunday cycle
+(A/B/C) and the weekday cycle (I/II), so their references can be answered
+locally without contacting an upstream source. Lectionary numbers follow the
+Lectionary for Mass used in the dioceses of the United States.
+
+The index is partial: numbers are known for the Sundays of every season and
+for the solemnities of the General Roman Calendar, and citations are included
+for the major Sundays and solemnities only. Anything else is left to the
+network sources.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple, Union
+
+from ..models.liturgical import LiturgicalSeason, Reading, Psalm, DailyReadings
+from .liturgical_calendar import get_calendar
+
+LECTIONARY_SOURCE = "Lectionary for Mass"
+LECTIONARY_INDEX_SOURCE = "Catholic Missal API - Lectionary Index"
+
+
+@dataclass(frozen=True, slots=True)
+class LectionaryCitations:
+    """Citations of the readings of one Mass."""
+    first_reading: str
+    responsorial_psalm: str
+    second_reading: Optional[str]
+    gospel: str
+
+
+# Celebrations with their own readings, by name; tuples are indexed by Sunday cycle A/B/C
+CELEBRATION_NUMBERS: Dict[str, Union[int, Tuple[int, int, int]]] = {
+    "Nativity of the Lord": 16,  # Mass during the Day
+    "Mary, Mother of God": 18,
+    "Epiphany of the Lord": 20,
+    "Palm Sunday": 38,
+    "Holy Thursday": 39,  # Mass of the Lord's Supper
+    "Good Friday": 40,
+    "Holy Saturday": 41,  # Easter Vigil
+    "Easter Sunday": 42,
+    "Ascension of the Lord": 58,
+    "Pentecost": 63,  # Mass during the Day
+    "Trinity Sunday": (164, 165, 166),
+    "Corpus Christi": (167, 168, 169),
+    "Our Lord Jesus Christ, King of the Universe": (160, 161, 162),
+    "Saint Joseph": 543,
+    "Annunciation of the Lord": 545,
+    "Assumption of the Blessed Virgin Mary": 622,  # Mass during the Day
+    "All Saints": 667,
+    "Immaculate Conception": 689,
+}
+
+# Number of the cycle A reading of the first Sunday counted in each season
+SEASON_SUNDAY_NUMBERS = {
+    LiturgicalSeason.ADVENT: (1, 1),  # (first week, number)
+    LiturgicalSeason.LENT: (1, 22),
+    LiturgicalSeason.EASTER: (2, 43),
+    LiturgicalSeason.ORDINARY_TIME: (2, 64),
+}
+
+# Citations keyed by (lectionary number, Sunday cycle); cycle None applies to every cycle
+CITATIONS: Dict[Tuple[int, Optional[str]], LectionaryCitations] = {
+    (1, "A"): LectionaryCitations("Isaiah 2:1-5", "Psalm 122:1-2, 3-4, 4-5, 6-7, 8-9",
+                                  "Romans 13:11-14", "Matthew 24:37-44"),
+    (2, "B"): LectionaryCitations("Isaiah 63:16b-17, 19b; 64:2-7", "Psalm 80:2-3, 15-16, 18-19",
+                                  "1 Corinthians 1:3-9", "Mark 13:33-37"),
+    (3, "C"): LectionaryCitations("Jeremiah 33:14-16", "Psalm 25:4-5, 8-9, 10, 14",
+                                  "1 Thessalonians 3:12—4:2", "Luke 21:25-28, 34-36"),
+    (16, None): LectionaryCitations("Isaiah 52:7-10", "Psalm 98:1, 2-3, 3-4, 5-6",
+                                    "Hebrews 1:1-6", "John 1:1-18"),
+    (18, None): LectionaryCitations("Numbers 6:22-27", "Psalm 67:2-3, 5, 6, 8",
+                                    "Galatians 4:4-7", "Luke 2:16-21"),
+    (20, None): LectionaryCitations("Isaiah 60:1-6", "Psalm 72:1-2, 7-8, 10-11, 12-13",
+                                    "Ephesians 3:2-3a, 5-6", "Matthew 2:1-12"),
+    (22, "A"): LectionaryCitations("Genesis 2:7-9; 3:1-7", "Psalm 51:3-4, 5-6, 12-13, 17",
+                                   "Romans 5:12-19", "Matthew 4:1-11"),
+    (23, "B"): LectionaryCitations("Genesis 9:8-15", "Psalm 25:4-5, 6-7, 8-9",
+                                   "1 Peter 3:18-22", "Mark 1:12-15"),
+    (24, "C"): LectionaryCitations("Deuteronomy 26:4-10", "Psalm 91:1-2, 10-11, 12-13, 14-15",
+                                   "Romans 10:8-13", "Luke 4:1-13"),
+    (38, "A"): LectionaryCitations("Isaiah 50:4-7", "Psalm 22:8-9, 17-18, 19-20, 23-24",
+                                   "Philippians 2:6-11", "Matthew 26:14—27:66"),
+    (38, "B"): LectionaryCitations("Isaiah 50:4-7", "Psalm 22:8-9, 17-18, 19-20, 23-24",
+                                   "Philippians 2:6-11", "Mark 14:1—15:47"),
+    (38, "C"): LectionaryCitations("Isaiah 50:4-7", "Psalm 22:8-9, 17-18, 19-20, 23-24",
+                                   "Philippians 2:6-11", "Luke 22:14—23:56"),
+    (39, None): LectionaryCitations("Exodus 12:1-8, 11-14", "Psalm 116:12-13, 15-16bc, 17-18",
+                                    "1 Corinthians 11:23-26", "John 13:1-15"),
+    (40, None): LectionaryCitations("Isaiah 52:13—53:12", "Psalm 31:2, 6, 12-13, 15-16, 17, 25",
+                                    "Hebrews 4:14-16; 5:7-9", "John 18:1—19:42"),
+    (42, None): LectionaryCitations("Acts 10:34a, 37-43", "Psalm 118:1-2, 16-17, 22-23",
+                                    "Colossians 3:1-4", "John 20:1-9"),
+    (43, "A"): LectionaryCitations("Acts 2:42-47", "Psalm 118:2-4, 13-15, 22-24",
+                                   "1 Peter 1:3-9", "John 20:19-31"),
+    (44, "B"): LectionaryCitations("Acts 4:32-35", "Psalm 118:2-4, 13-15, 22-24",
+                                   "1 John 5:1-6", "John 20:19-31"),
+    (45, "C"): LectionaryCitations("Acts 5:12-16", "Psalm 118:2-4, 13-15, 22-24",
+                                   "Revelation 1:9-11a, 12-13, 17-19", "John 20:19-31"),
+    (58, "A"): LectionaryCitations("Acts 1:1-11", "Psalm 47:2-3, 6-7, 8-9",
+                                   "Ephesians 1:17-23", "Matthew 28:16-20"),
+    (58, "B"): LectionaryCitations("Acts 1:1-11", "Psalm 47:2-3, 6-7, 8-9",
+                                   "Ephesians 4:1-13", "Mark 16:15-20"),
+    (58, "C"): LectionaryCitations("Acts 1:1-11", "Psalm 47:2-3, 6-7, 8-9",
+                                   "Hebrews 9:24-28; 10:19-23", "Luke 24:46-53"),
+    (63, None): LectionaryCitations("Acts 2:1-11", "Psalm 104:1, 24, 29-30, 31, 34",
+                                    "1 Corinthians 12:3b-7, 12-13", "John 20:19-23"),
+    (160, "A"): LectionaryCitations("Ezekiel 34:11-12, 15-17", "Psalm 23:1-2, 2-3, 5-6",
+                                    "1 Corinthians 15:20-26, 28", "Matthew 25:31-46"),
+    (161, "B"): LectionaryCitations("Daniel 7:13-14", "Psalm 93:1, 1-2, 5",
+                                    "Revelation 1:5-8", "John 18:33b-37"),
+    (162, "C"): LectionaryCitations("2 Samuel 5:1-3", "Psalm 122:1-2, 3-4, 4-5",
+                                    "Colossians 1:12-20", "Luke 23:35-43"),
+    (164, "A"): LectionaryCitations("Exodus 34:4b-6, 8-9", "Daniel 3:52, 53, 54, 55, 56",
+                                    "2 Corinthians 13:11-13", "John 3:16-18"),
+    (165, "B"): LectionaryCitations("Deuteronomy 4:32-34, 39-40", "Psalm 33:4-5, 6, 9, 18-19, 20, 22",
+                                    "Romans 8:14-17", "Matthew 28:16-20"),
+    (166, "C"): LectionaryCitations("Proverbs 8:22-31", "Psalm 8:4-5, 6-7, 8-9",
+                                    "Romans 5:1-5", "John 16:12-15"),
+    (167, "A"): LectionaryCitations("Deuteronomy 8:2-3, 14b-16a", "Psalm 147:12-13, 14-15, 19-20",
+                                    "1 Corinthians 10:16-17", "John 6:51-58"),
+    (168, "B"): LectionaryCitations("Exodus 24:3-8", "Psalm 116:12-13, 15-16, 17-18",
+                                    "Hebrews 9:11-15", "Mark 14:12-16, 22-26"),
+    (169, "C"): LectionaryCitations("Genesis 14:18-20", "Psalm 110:1, 2, 3, 4",
+                                    "1 Corinthians 11:23-26", "Luke 9:11b-17"),
+    (543, None): LectionaryCitations("2 Samuel 7:4-5a, 12-14a, 16", "Psalm 89:2-3, 4-5, 27 and 29",
+                                     "Romans 4:13, 16-18, 22", "Matthew 1:16, 18-21, 24a"),
+    (545, None): LectionaryCitations("Isaiah 7:10-14; 8:10", "Psalm 40:7-8a, 8b-9, 10, 11",
+                                     "Hebrews 10:4-10", "Luke 1:26-38"),
+    (622, None): LectionaryCitations("Revelation 11:19a; 12:1-6a, 10ab", "Psalm 45:10, 11, 12, 16",
+                                     "1 Corinthians 15:20-27", "Luke 1:39-56"),
+    (667, None): LectionaryCitations("Revelation 7:2-4, 9-14", "Psalm 24:1bc-2, 3-4ab, 5-6",
+                                     "1 John 3:1-3", "Matthew 5:1-12a"),
+    (689, None): LectionaryCitations("Genesis 3:9-15, 20", "Psalm 98:1, 2-3ab, 3cd-4",
+                                     "Ephesians 1:3-6, 11-12", "Luke 1:26-38"),
+}
+
+
+def lectionary_number(target_date: date, region: Optional[str] = None) -> Optional[int]:
+    """
+    The lectionary number of the Mass of a date, if known.
+
+    Celebrations with their own readings take precedence; otherwise Sundays
+    are numbered by season, week and Sunday cycle. Weekdays are not indexed.
+    """
+    day = get_calendar(target_date.year, region).get_compact_day(target_date)
+    cycle = "ABC".index(day.sunday_cycle)
+
+    if day.celebrations:
+        number = CELEBRATION_NUMBERS.get(day.celebrations[0].name)
+        if number is not None:
+            return number[cycle] if isinstance(number, tuple) else number
+
+    if target_date.weekday() != 6 or day.season not in SEASON_SUNDAY_NUMBERS or day.season_week is None:
+        return None
+
+    first_week, first_number = SEASON_SUNDAY_NUMBERS[day.season]
+    offset = day.season_week - first_week
+    if offset < 0 or (day.season == LiturgicalSeason.ORDINARY_TIME and day.season_week > 34):
+        return None
+    number = first_number + 3 * offset + cycle
+    if day.season == LiturgicalSeason.EASTER and day.season_week == 7:
+        number += 1  # The Ascension (58) comes before the Seventh Sunday of Easter
+    return number
+
+
+def lectionary_citations(target_date: date, region: Optional[str] = None) -> Optional[LectionaryCitations]:
+    """The reading citations of the Mass of a date, if they are in the index."""
+    number = lectionary_number(target_date, region)
+    if number is None:
+        return None
+    cycle = get_calendar(target_date.year, region).get_compact_day(target_date).sunday_cycle
+    return CITATIONS.get((number, cycle)) or CITATIONS.get((number, None))
+
+
+def lectionary_readings(target_date: date) -> Optional[DailyReadings]:
+    """
+    Readings of a date with references only, from the local index.
+
+    Returns None when the date's citations are not indexed.
+    """
+    citations = lectionary_citations(target_date)
+    if citations is None:
+        return None
+
+    def reading(reference: Optional[str]) -> Optional[Reading]:
+        if reference is None:
+            return None
+        return Reading(reference=reference, citation=reference, source=LECTIONARY_SOURCE)
+
+    return DailyReadings(
+        date=target_date,
+        first_reading=reading(citations.first_reading),
+        responsorial_psalm=Psalm(reference=citations.responsorial_psalm, source=LECTIONARY_SOURCE),
+        second_reading=reading(citations.second_reading),
+        gospel=reading(citations.gospel),
+        source=LECTIONARY_INDEX_SOURCE,
+        last_updated=datetime.utcnow(),
+    )
@@ -5,23 +5,193 @@ This module calculates the Roman Catholic liturgical calendar,
 including movable feasts, seasons, and liturgical colors.
 """
 
+from collections.abc import Sequence
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 import calendar
 
 from ..models.liturgical import (
     LiturgicalSeason, LiturgicalRank, LiturgicalColor, 
     Celebration, LiturgicalDay
 )
+from ..models.compact import CompactCelebration, CompactDay
+from .precedence import day_precedence, resolve_year
+from .regions import UNIVERSAL, ResolvedRegion, resolve_region
+
+CALENDAR_SOURCE = "Catholic Missal API - Liturgical Calendar Calculator"
+
+# Major fixed celebrations keyed by (month, day)
+FIXED_CELEBRATIONS: Dict[Tuple[int, int], CompactCelebration] = {
+    (1, 1): CompactCelebration(
+        name="Mary, Mother of God",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="Solemnity of Mary, Mother of God"
+    ),
+    (1, 6): CompactCelebration(
+        name="Epiphany of the Lord",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="Epiphany of the Lord",
+        precedence=2
+    ),
+    (3, 19): CompactCelebration(
+        name="Saint Joseph",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="Saint Joseph, Spouse of the Blessed Virgin Mary"
+    ),
+    (3, 25): CompactCelebration(
+        name="Annunciation of the Lord",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="Annunciation of the Lord"
+    ),
+    (8, 15): CompactCelebration(
+        name="Assumption of the Blessed Virgin Mary",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="Assumption of the Blessed Virgin Mary"
+    ),
+    (11, 1): CompactCelebration(
+        name="All Saints",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="All Saints"
+    ),
+    (12, 8): CompactCelebration(
+        name="Immaculate Conception",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="Immaculate Conception of the Blessed Virgin Mary"
+    ),
+    (12, 25): CompactCelebration(
+        name="Nativity of the Lord",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="Christmas - Nativity of the Lord",
+        precedence=2
+    ),
+}
+
+# Movable celebrations as (days from Easter, celebration)
+MOVABLE_CELEBRATIONS: List[Tuple[int, CompactCelebration]] = [
+    (-7, CompactCelebration(
+        name="Palm Sunday",
+        rank=LiturgicalRank.SUNDAY,
+        color=LiturgicalColor.RED,
+        description="Palm Sunday of the Passion of the Lord",
+        precedence=2
+    )),
+    (-3, CompactCelebration(
+        name="Holy Thursday",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="Holy Thursday - Mass of the Lord's Supper",
+        precedence=1
+    )),
+    (-2, CompactCelebration(
+        name="Good Friday",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.RED,
+        description="Good Friday of the Passion of the Lord",
+        precedence=1
+    )),
+    (-1, CompactCelebration(
+        name="Holy Saturday",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="Holy Saturday - Easter Vigil",
+        precedence=1
+    )),
+    (0, CompactCelebration(
+        name="Easter Sunday",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="Easter Sunday - Resurrection of the Lord",
+        precedence=1
+    )),
+    (49, CompactCelebration(
+        name="Pentecost",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.RED,
+        description="Pentecost Sunday",
+        precedence=2
+    )),
+    (56, CompactCelebration(
+        name="Trinity Sunday",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="Most Holy Trinity"
+    )),
+    (63, CompactCelebration(
+        name="Corpus Christi",
+        rank=LiturgicalRank.SOLEMNITY,
+        color=LiturgicalColor.WHITE,
+        description="Most Holy Body and Blood of Christ"
+    )),
+]
+
+# Placed 39 days after Easter, or on the Seventh Sunday of Easter where it is moved
+ASCENSION = CompactCelebration(
+    name="Ascension of the Lord",
+    rank=LiturgicalRank.SOLEMNITY,
+    color=LiturgicalColor.WHITE,
+    description="Ascension of the Lord",
+    precedence=2
+)
+
+# Last Sunday in Ordinary Time, the Sunday before Advent
+CHRIST_THE_KING = CompactCelebration(
+    name="Our Lord Jesus Christ, King of the Universe",
+    rank=LiturgicalRank.SOLEMNITY,
+    color=LiturgicalColor.WHITE,
+    description="Solemnity of Our Lord Jesus Christ, King of the Universe"
+)
+
+
+class LayeredYearTable(Sequence):
+    """
+    A regional year table stored as its differences from a shared base table.
+    
+    Days the region leaves unchanged are read from the base table, so the
+    universal data is held in memory only once.
+    """
+    
+    __slots__ = ("base", "overrides")
+    
+    def __init__(self, base: Sequence, table: List[CompactDay]):
+        self.base = base
+        self.overrides: Dict[int, CompactDay] = {
+            index: day for index, day in enumerate(table) if day != base[index]
+        }
+    
+    def __getitem__(self, index: int) -> CompactDay:
+        day = self.overrides.get(index)
+        return day if day is not None else self.base[index]
+    
+    def __len__(self) -> int:
+        return len(self.base)
 
 
 class LiturgicalCalendar:
-    """Roman Catholic liturgical calendar calculator."""
+    """
+    Roman Catholic liturgical calendar calculator.
     
-    def __init__(self, year: int):
+    Without a region this is the General Roman Calendar. With one, the
+    region's overlay (see regions.py) is applied on top of it.
+    """
+    
+    def __init__(self, year: int, region: Optional[str] = None):
         self.year = year
+        self.region: Optional[ResolvedRegion] = (
+            resolve_region(region) if region not in (None, UNIVERSAL) else None
+        )
         self._easter_date = None
         self._advent_start = None
+        self._anchors: Optional[Dict[str, date]] = None
+        self._year_table: Optional[Sequence] = None
         
     @property
     def easter_date(self) -> date:
@@ -61,89 +231,173 @@ class LiturgicalCalendar:
         if self._advent_start is None:
             # First Sunday of Advent is 4 Sundays before Christmas
             christmas = date(self.year, 12, 25)
-            days_to_sunday = (christmas.weekday() + 1) % 7
+            # When Christmas is a Sunday, the Fourth Sunday of Advent is a week earlier
+            days_to_sunday = (christmas.weekday() + 1) % 7 or 7
             fourth_sunday_before = christmas - timedelta(days=days_to_sunday + 21)
             self._advent_start = fourth_sunday_before
         return self._advent_start
     
+    @property
+    def anchors(self) -> Dict[str, date]:
+        """
+        Key dates of the year that seasons and weeks are counted from.
+        
+        Computed once per calendar, so season and week lookups are plain
+        date comparisons and subtractions.
+        """
+        if self._anchors is None:
+            easter = self.easter_date
+            advent_start = self.advent_start
+            ascension_offset = 42 if self.region and self.region.ascension_on_sunday else 39
+            self._anchors = {
+                "epiphany": self._get_epiphany(),
+                "baptism_of_the_lord": self._get_baptism_of_lord(),
+                "ash_wednesday": easter - timedelta(days=46),
+                "palm_sunday": easter - timedelta(days=7),
+                "holy_thursday": easter - timedelta(days=3),
+                "good_friday": easter - timedelta(days=2),
+                "holy_saturday": easter - timedelta(days=1),
+                "easter": easter,
+                "ascension": easter + timedelta(days=ascension_offset),
+                "pentecost": easter + timedelta(days=49),
+                "christ_the_king": advent_start - timedelta(days=7),
+                "advent_start": advent_start,
+                "christmas": date(self.year, 12, 25),
+            }
+        return self._anchors
+    
     def get_liturgical_season(self, target_date: date) -> Tuple[LiturgicalSeason, Optional[int]]:
         """
         Determine the liturgical season and week for a given date.
         Returns (season, week_number).
         """
-        easter = self.easter_date
+        anchors = self.anchors
+        easter = anchors["easter"]
         
         # Christmas Season (Dec 25 - Baptism of the Lord)
-        christmas = date(target_date.year, 12, 25)
+        christmas = anchors["christmas"]
         if target_date >= christmas:
             # Check if we're still in Christmas season of this year
-            next_year_calendar = LiturgicalCalendar(target_date.year + 1)
-            baptism_of_lord = next_year_calendar._get_baptism_of_lord()
+            baptism_of_lord = get_calendar(target_date.year + 1, self.region_code).anchors["baptism_of_the_lord"]
             if target_date <= baptism_of_lord:
                 return LiturgicalSeason.CHRISTMAS, None
         
         # Check previous year's Christmas season
         if target_date.month == 1:
-            baptism_of_lord = self._get_baptism_of_lord()
-            if target_date <= baptism_of_lord:
+            if target_date <= anchors["baptism_of_the_lord"]:
                 return LiturgicalSeason.CHRISTMAS, None
         
         # Advent (First Sunday of Advent - Dec 24)
-        advent_start = self.advent_start
+        advent_start = anchors["advent_start"]
         if target_date >= advent_start and target_date < christmas:
             week = ((target_date - advent_start).days // 7) + 1
             return LiturgicalSeason.ADVENT, week
         
-        # Lent (Ash Wednesday - Holy Saturday)
-        ash_wednesday = easter - timedelta(days=46)
-        holy_saturday = easter - timedelta(days=1)
-        if ash_wednesday <= target_date <= holy_saturday:
-            week = ((target_date - ash_wednesday).days // 7) + 1
-            return LiturgicalSeason.LENT, week
-        
         # Easter Triduum (Holy Thursday - Easter Sunday)
-        holy_thursday = easter - timedelta(days=3)
-        if holy_thursday <= target_date <= easter:
+        if anchors["holy_thursday"] <= target_date <= easter:
             return LiturgicalSeason.EASTER_TRIDUUM, None
         
+        # Lent (Ash Wednesday - Wednesday of Holy Week)
+        ash_wednesday = anchors["ash_wednesday"]
+        if ash_wednesday <= target_date < anchors["holy_thursday"]:
+            week = ((target_date - ash_wednesday).days // 7) + 1
+            return LiturgicalSeason.LENT, week
+        
         # Easter Season (Easter Sunday - Pentecost)
-        pentecost = easter + timedelta(days=49)
-        if easter < target_date <= pentecost:
+        if easter < target_date <= anchors["pentecost"]:
             week = ((target_date - easter).days // 7) + 1
             return LiturgicalSeason.EASTER, week
         
         # Ordinary Time
         return LiturgicalSeason.ORDINARY_TIME, self._get_ordinary_time_week(target_date)
     
+    def get_liturgical_year(self, target_date: date) -> int:
+        """
+        The liturgical year a date belongs to, named after the civil year it ends in.
+        
+        A liturgical year begins on the First Sunday of Advent.
+        """
+        if target_date >= get_calendar(target_date.year).advent_start:
+            return target_date.year + 1
+        return target_date.year
+    
+    def get_sunday_cycle(self, target_date: date) -> str:
+        """The Sunday lectionary cycle (A, B or C) for a date."""
+        return "CAB"[self.get_liturgical_year(target_date) % 3]
+    
+    def get_weekday_cycle(self, target_date: date) -> str:
+        """The weekday lectionary cycle (I or II) for a date."""
+        return "I" if self.get_liturgical_year(target_date) % 2 else "II"
+    
+    def get_psalter_week(
+        self,
+        target_date: date,
+        season: LiturgicalSeason,
+        week: Optional[int]
+    ) -> Optional[int]:
+        """
+        The Liturgy of the Hours psalter week (1-4) for a date.
+        
+        The four-week psalter follows the weeks of each season, restarting
+        with week I on the First Sunday of Advent, the First Sunday of Lent,
+        Easter Sunday and the first week of Ordinary Time. The days from Ash
+        Wednesday to the following Saturday use week IV. The Christmas season
+        and the Triduum have no psalter week here.
+        """
+        if season == LiturgicalSeason.LENT:
+            first_sunday = self.easter_date - timedelta(days=42)
+            if target_date < first_sunday:
+                return 4
+            week = (target_date - first_sunday).days // 7 + 1
+        if season in (LiturgicalSeason.CHRISTMAS, LiturgicalSeason.EASTER_TRIDUUM) or week is None:
+            return None
+        return (week - 1) % 4 + 1
+    
+    @property
+    def region_code(self) -> Optional[str]:
+        """Code of the calendar's region, or None for the General Roman Calendar."""
+        return self.region.code if self.region else None
+    
+    def _get_epiphany(self) -> date:
+        """
+        Calculate the Epiphany of the Lord.
+        
+        January 6, or the Sunday between January 2 and 8 where it is moved to Sunday.
+        """
+        if self.region and self.region.epiphany_on_sunday:
+            january_2 = date(self.year, 1, 2)
+            return january_2 + timedelta(days=(6 - january_2.weekday()) % 7)
+        return date(self.year, 1, 6)
+    
     def _get_baptism_of_lord(self) -> date:
         """Calculate the Feast of the Baptism of the Lord."""
-        # First Sunday after January 6 (Epiphany)
-        epiphany = date(self.year, 1, 6)
+        epiphany = self._get_epiphany()
+        if epiphany.weekday() == 6 and epiphany.day >= 7:
+            # An Epiphany moved to January 7 or 8 is followed by the Baptism on Monday
+            return epiphany + timedelta(days=1)
+        # First Sunday after the Epiphany
         days_to_sunday = (6 - epiphany.weekday()) % 7
         if days_to_sunday == 0:
             days_to_sunday = 7
         return epiphany + timedelta(days=days_to_sunday)
     
     def _get_ordinary_time_week(self, target_date: date) -> int:
-        """Calculate the week number in Ordinary Time."""
-        # This is a simplified calculation
-        # In practice, this requires more complex logic
-        baptism_of_lord = self._get_baptism_of_lord()
-        ash_wednesday = self.easter_date - timedelta(days=46)
-        pentecost = self.easter_date + timedelta(days=49)
-        
-        if target_date > baptism_of_lord and target_date < ash_wednesday:
-            # First part of Ordinary Time
-            days_since_baptism = (target_date - baptism_of_lord).days
-            return (days_since_baptism // 7) + 1
-        elif target_date > pentecost:
-            # Second part of Ordinary Time
-            days_since_pentecost = (target_date - pentecost).days
-            # Add the weeks from the first part of Ordinary Time
-            first_part_weeks = ((ash_wednesday - baptism_of_lord).days // 7)
-            return first_part_weeks + (days_since_pentecost // 7) + 1
+        """
+        Calculate the week number in Ordinary Time.
         
-        return 1
+        The first part counts from the Sunday on or before the Baptism of
+        the Lord: week 1 begins the next day, even where the Baptism itself
+        is kept on a Monday. After Pentecost, weeks are counted back from
+        Christ the King, which begins the 34th and last week, so the weeks
+        omitted in a short year are the ones skipped at Pentecost.
+        """
+        anchors = self.anchors
+        if target_date > anchors["pentecost"]:
+            week_start = target_date - timedelta(days=(target_date.weekday() + 1) % 7)
+            return 34 - (anchors["christ_the_king"] - week_start).days // 7
+        baptism = anchors["baptism_of_the_lord"]
+        week_zero = baptism - timedelta(days=(baptism.weekday() + 1) % 7)
+        return max((target_date - week_zero).days // 7 + 1, 1)
     
     def get_liturgical_color(self, target_date: date, celebrations: List[Celebration]) -> LiturgicalColor:
         """Determine the liturgical color for a given date."""
@@ -168,168 +422,125 @@ class LiturgicalCalendar:
     
     def get_fixed_celebrations(self, target_date: date) -> List[Celebration]:
         """Get fixed date celebrations (saints' days, etc.)."""
-        celebrations = []
-        month, day = target_date.month, target_date.day
-        
-        # Major fixed celebrations
-        fixed_celebrations = {
-            (1, 1): Celebration(
-                name="Mary, Mother of God",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Solemnity of Mary, Mother of God"
-            ),
-            (1, 6): Celebration(
-                name="Epiphany of the Lord",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Epiphany of the Lord"
-            ),
-            (3, 19): Celebration(
-                name="Saint Joseph",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Saint Joseph, Spouse of the Blessed Virgin Mary"
-            ),
-            (3, 25): Celebration(
-                name="Annunciation of the Lord",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Annunciation of the Lord"
-            ),
-            (8, 15): Celebration(
-                name="Assumption of the Blessed Virgin Mary",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Assumption of the Blessed Virgin Mary"
-            ),
-            (11, 1): Celebration(
-                name="All Saints",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="All Saints"
-            ),
-            (12, 8): Celebration(
-                name="Immaculate Conception",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Immaculate Conception of the Blessed Virgin Mary"
-            ),
-            (12, 25): Celebration(
-                name="Nativity of the Lord",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Christmas - Nativity of the Lord"
-            ),
-        }
-        
-        if (month, day) in fixed_celebrations:
-            celebrations.append(fixed_celebrations[(month, day)])
+        return [c.to_model() for c in self._fixed_celebrations().get(target_date, [])]
+    
+    def _fixed_celebrations(self) -> Dict[date, List[CompactCelebration]]:
+        """Fixed celebrations of this year, with the region's proper ones, keyed by date."""
+        celebrations: Dict[date, List[CompactCelebration]] = {}
+        fixed = dict(FIXED_CELEBRATIONS)
+        if self.region:
+            for key, celebration in self.region.proper_celebrations.items():
+                celebrations.setdefault(date(self.year, *key), []).append(celebration)
         
+        epiphany = fixed.pop((1, 6))
+        celebrations.setdefault(self.anchors["epiphany"], []).insert(0, epiphany)
+        for (month, day), celebration in fixed.items():
+            celebrations.setdefault(date(self.year, month, day), []).insert(0, celebration)
         return celebrations
     
     def get_movable_celebrations(self, target_date: date) -> List[Celebration]:
-        """Get movable celebrations based on Easter date."""
-        celebrations = []
+        """Get movable celebrations based on the Easter and Advent dates."""
+        celebration = self._movable_celebrations().get(target_date)
+        return [celebration.to_model()] if celebration else []
+    
+    def _movable_celebrations(self) -> Dict[date, CompactCelebration]:
+        """Movable celebrations of this year keyed by date."""
         easter = self.easter_date
-        
-        # Calculate movable feasts
-        movable_feasts = {
-            easter - timedelta(days=7): Celebration(
-                name="Palm Sunday",
-                rank=LiturgicalRank.SUNDAY,
-                color=LiturgicalColor.RED,
-                description="Palm Sunday of the Passion of the Lord"
-            ),
-            easter - timedelta(days=3): Celebration(
-                name="Holy Thursday",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Holy Thursday - Mass of the Lord's Supper"
-            ),
-            easter - timedelta(days=2): Celebration(
-                name="Good Friday",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.RED,
-                description="Good Friday of the Passion of the Lord"
-            ),
-            easter - timedelta(days=1): Celebration(
-                name="Holy Saturday",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Holy Saturday - Easter Vigil"
-            ),
-            easter: Celebration(
-                name="Easter Sunday",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Easter Sunday - Resurrection of the Lord"
-            ),
-            easter + timedelta(days=39): Celebration(
-                name="Ascension of the Lord",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Ascension of the Lord"
-            ),
-            easter + timedelta(days=49): Celebration(
-                name="Pentecost",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.RED,
-                description="Pentecost Sunday"
-            ),
-            easter + timedelta(days=56): Celebration(
-                name="Trinity Sunday",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Most Holy Trinity"
-            ),
-            easter + timedelta(days=63): Celebration(
-                name="Corpus Christi",
-                rank=LiturgicalRank.SOLEMNITY,
-                color=LiturgicalColor.WHITE,
-                description="Most Holy Body and Blood of Christ"
-            ),
+        celebrations = {
+            easter + timedelta(days=offset): celebration
+            for offset, celebration in MOVABLE_CELEBRATIONS
         }
-        
-        if target_date in movable_feasts:
-            celebrations.append(movable_feasts[target_date])
-        
+        celebrations[self.anchors["ascension"]] = ASCENSION
+        celebrations[self.anchors["christ_the_king"]] = CHRIST_THE_KING
         return celebrations
     
-    def get_liturgical_day(self, target_date: date) -> LiturgicalDay:
-        """Get complete liturgical information for a specific date."""
-        season, week = self.get_liturgical_season(target_date)
+    @property
+    def year_table(self) -> Sequence:
+        """
+        Compact liturgical information for every day of the year.
+        
+        Built once per calendar and indexed by day of the year (0 = January 1).
+        A regional calendar keeps only the days that differ from the shared
+        universal table of the same year.
+        """
+        if self._year_table is None:
+            table = self._build_year_table()
+            if self.region:
+                table = LayeredYearTable(get_calendar(self.year).year_table, table)
+            self._year_table = table
+        return self._year_table
+    
+    def _build_year_table(self) -> List[CompactDay]:
+        """
+        Compute the liturgical information for each day of the year.
         
-        # Get all celebrations for this date
-        celebrations = []
-        celebrations.extend(self.get_fixed_celebrations(target_date))
-        celebrations.extend(self.get_movable_celebrations(target_date))
+        Celebrations are placed on their own dates first; collisions are then
+        resolved for the whole year by the precedence engine, which transfers
+        impeded solemnities and orders each day's celebrations.
+        """
+        anchors = self.anchors
+        fixed = self._fixed_celebrations()
+        movable = self._movable_celebrations()
         
-        # Determine primary celebration
-        primary_celebration = None
-        if celebrations:
-            # Sort by rank priority (Solemnity > Feast > Memorial > etc.)
-            rank_priority = {
-                LiturgicalRank.SOLEMNITY: 1,
-                LiturgicalRank.FEAST: 2,
-                LiturgicalRank.MEMORIAL: 3,
-                LiturgicalRank.OPTIONAL_MEMORIAL: 4,
-                LiturgicalRank.SUNDAY: 5,
-                LiturgicalRank.WEEKDAY: 6
-            }
-            celebrations.sort(key=lambda c: rank_priority.get(c.rank, 10))
-            primary_celebration = celebrations[0]
+        days = []
+        placed: Dict[date, List[CompactCelebration]] = {}
+        day_ranks: Dict[date, int] = {}
+        current = date(self.year, 1, 1)
+        while current.year == self.year:
+            season, week = self.get_liturgical_season(current)
+            days.append((current, season, week))
+            day_ranks[current] = day_precedence(current, season, anchors)
+            
+            if current in fixed:
+                placed.setdefault(current, []).extend(fixed[current])
+            if current in movable:
+                placed.setdefault(current, []).append(movable[current])
+            current += timedelta(days=1)
         
-        # Determine liturgical color
-        color = self.get_liturgical_color(target_date, celebrations)
+        resolved = resolve_year(placed, day_ranks, anchors)
         
-        return LiturgicalDay(
-            date=target_date,
-            season=season,
-            season_week=week,
-            weekday=target_date.strftime("%A"),
-            celebrations=celebrations,
-            primary_celebration=primary_celebration,
-            color=color,
-            source="Catholic Missal API - Liturgical Calendar Calculator"
-        )
\ No newline at end of file
+        table = []
+        for current, season, week in days:
+            celebrations = resolved.get(current, ())
+            table.append(CompactDay(
+                season=season,
+                season_week=week,
+                celebrations=celebrations,
+                color=self.get_liturgical_color(current, list(celebrations)),
+                sunday_cycle=self.get_sunday_cycle(current),
+                weekday_cycle=self.get_weekday_cycle(current),
+                psalter_week=self.get_psalter_week(current, season, week),
+            ))
+        return table
+    
+    def get_compact_day(self, target_date: date) -> CompactDay:
+        """Get the year table entry for a date."""
+        if target_date.year != self.year:
+            return get_calendar(target_date.year, self.region_code).get_compact_day(target_date)
+        return self.year_table[target_date.timetuple().tm_yday - 1]
+    
+    def get_liturgical_day(self, target_date: date) -> LiturgicalDay:
+        """Get complete liturgical information for a specific date."""
+        return self.get_compact_day(target_date).to_model(target_date, CALENDAR_SOURCE)
+    
+    def iter_days(self) -> Iterator[Tuple[date, CompactDay]]:
+        """Yield (date, year table entry) for every day of the year, in order."""
+        first = date(self.year, 1, 1)
+        table = self.year_table
+        for index in range(len(table)):
+            yield first + timedelta(days=index), table[index]
+
+
+def get_calendar(year: int, region: Optional[str] = None) -> LiturgicalCalendar:
+    """
+    Get the shared calendar for a year and region, so its computed dates are reused.
+    
+    Each region's year is cached separately; regional year tables share the
+    universal table of the same year.
+    """
+    return _get_calendar(year, None if region == UNIVERSAL else region)
+
+
+@lru_cache(maxsize=256)
+def _get_calendar(year: int, region: Optional[str]) -> LiturgicalCalendar:
+    return LiturgicalCalendar(year, region)
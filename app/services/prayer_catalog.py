@@ -0,0 +1,143 @@
+"""
+Prayer catalog.
+
+Prayers are kept in a data file shipped with the package
+(app/data/prayers.json), each with its text in one or more languages. The
+catalog is loaded once and indexed by (category, language), (season,
+language) and (name, language), so every lookup is a dictionary access and
+adding languages adds no per-request work. A prayer missing from a language
+is served in English.
+"""
+
+import json
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..models.liturgical import LiturgicalSeason, Prayer
+
+CATALOG_PATH = Path(__file__).resolve().parent.parent / "data" / "prayers.json"
+
+DEFAULT_LANGUAGE = "en"
+
+# Catalog season of each liturgical season; Ordinary Time has no seasonal prayers
+SEASON_KEYS = {
+    LiturgicalSeason.ADVENT: "advent",
+    LiturgicalSeason.CHRISTMAS: "christmas",
+    LiturgicalSeason.LENT: "lent",
+    LiturgicalSeason.EASTER_TRIDUUM: "lent",
+    LiturgicalSeason.EASTER: "easter",
+}
+
+
+def season_key(season: LiturgicalSeason, target_date: date) -> Optional[str]:
+    """The catalog season for a day; Easter Sunday, which ends the Triduum, gets Easter prayers."""
+    if season == LiturgicalSeason.EASTER_TRIDUUM and target_date.weekday() == 6:
+        return "easter"
+    return SEASON_KEYS.get(season)
+
+
+def negotiate_language(accept_language: Optional[str], available: Tuple[str, ...]) -> str:
+    """Pick the best available language from an Accept-Language header."""
+    ranked = []
+    for position, part in enumerate((accept_language or "").split(",")):
+        tag, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if tag and quality > 0:
+            ranked.append((-quality, position, tag.strip().lower()))
+
+    for _, _, tag in sorted(ranked):
+        if tag == "*":
+            return DEFAULT_LANGUAGE
+        for candidate in (tag, tag.split("-")[0]):
+            if candidate in available:
+                return candidate
+    return DEFAULT_LANGUAGE
+
+
+class PrayerCatalog:
+    """Prayers indexed by category, season and name for each language."""
+
+    def __init__(self, path: Path = CATALOG_PATH):
+        entries = json.loads(Path(path).read_text(encoding="utf-8"))["prayers"]
+
+        languages = {DEFAULT_LANGUAGE}
+        for entry in entries:
+            languages.update(entry["texts"])
+        self.languages: Tuple[str, ...] = tuple(sorted(languages))
+
+        self._entries = entries
+        self._by_category: Dict[Tuple[str, str], List[Prayer]] = {}
+        self._by_season: Dict[Tuple[str, str], List[Prayer]] = {}
+        self._by_name: Dict[Tuple[str, str], Prayer] = {}
+        self._keys: Dict[str, str] = {}
+
+        for entry in entries:
+            self._keys[entry["key"]] = entry["key"]
+            for variant in entry["texts"].values():
+                self._keys[variant["name"].lower()] = entry["key"]
+
+            for language in self.languages:
+                prayer = self._prayer(entry, language)
+                self._by_name[(entry["key"], language)] = prayer
+                for category in entry.get("categories", ()):
+                    self._by_category.setdefault((category, language), []).append(prayer)
+                for season in entry.get("seasons", ()):
+                    self._by_season.setdefault((season, language), []).append(prayer)
+
+        self.categories: Tuple[str, ...] = tuple(dict.fromkeys(c for c, _ in self._by_category))
+        self.seasons: Tuple[str, ...] = tuple(dict.fromkeys(s for s, _ in self._by_season))
+        self.keys: Tuple[str, ...] = tuple(entry["key"] for entry in entries)
+
+    @staticmethod
+    def _prayer(entry: dict, language: str) -> Prayer:
+        if language not in entry["texts"]:
+            language = DEFAULT_LANGUAGE
+        variant = entry["texts"][language]
+        return Prayer(
+            name=variant["name"],
+            category=entry["category"],
+            text=variant["text"],
+            source=entry["source"],
+            language=language,
+            copyright_notice=entry.get("copyright_notice"),
+        )
+
+    def negotiate(self, accept_language: Optional[str]) -> str:
+        """Pick the catalog language that best matches an Accept-Language header."""
+        return negotiate_language(accept_language, self.languages)
+
+    def category(self, category: str, language: str = DEFAULT_LANGUAGE) -> Optional[List[Prayer]]:
+        """Prayers of a category (e.g. 'common', 'marian'), or None if unknown."""
+        return self._by_category.get((category, language))
+
+    def season(self, season: str, language: str = DEFAULT_LANGUAGE) -> Optional[List[Prayer]]:
+        """Prayers of a liturgical season (e.g. 'advent'), or None if unknown."""
+        return self._by_season.get((season, language))
+
+    def key(self, name: str) -> Optional[str]:
+        """The key of a prayer given its key or its name in any language, or None if unknown."""
+        return self._keys.get(name.lower())
+
+    def named(self, name: str, language: str = DEFAULT_LANGUAGE) -> Optional[Prayer]:
+        """A prayer by key (e.g. 'hail-mary') or by its name in any language."""
+        key = self.key(name)
+        return self._by_name.get((key, language)) if key else None
+
+    def variants(self) -> Iterator[Prayer]:
+        """Every prayer in every language it is written in."""
+        for entry in self._entries:
+            for language in entry["texts"]:
+                yield self._prayer(entry, language)
+
+
+@lru_cache(maxsize=1)
+def get_prayer_catalog() -> PrayerCatalog:
+    """The catalog of prayers, loaded once per process."""
+    return PrayerCatalog()
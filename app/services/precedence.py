@@ -0,0 +1,165 @@
+"""
+Precedence of liturgical days and transfer of impeded solemnities.
+
+Follows the Table of Liturgical Days (Universal Norms on the Liturgical Year
+and the Calendar, 59-60), in which a lower number takes precedence:
+
+     1  Paschal Triduum
+     2  Christmas, Epiphany, Ascension, Pentecost; Sundays of Advent, Lent
+        and Easter; Ash Wednesday; weekdays of Holy Week; the Easter Octave
+     3  Solemnities of the General Calendar
+     4  Proper solemnities
+     5  Feasts of the Lord
+     6  Sundays of the Christmas season and of Ordinary Time
+     7  Feasts of the General Calendar
+     8  Proper feasts
+     9  Advent weekdays from December 17; the Christmas Octave; Lent weekdays
+    10  Obligatory memorials
+    11  Proper obligatory memorials
+    12  Optional memorials
+    13  Other weekdays
+
+The calendar resolves a whole year at once when it builds its year table, so
+requests only ever read the stored result.
+"""
+
+from dataclasses import replace
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+from ..models.liturgical import LiturgicalSeason, LiturgicalRank
+from ..models.compact import CompactCelebration
+
+# Precedence of celebrations by rank, unless a celebration sets its own
+RANK_PRECEDENCE = {
+    LiturgicalRank.SOLEMNITY: 3,
+    LiturgicalRank.SUNDAY: 6,
+    LiturgicalRank.FEAST: 7,
+    LiturgicalRank.MEMORIAL: 10,
+    LiturgicalRank.OPTIONAL_MEMORIAL: 12,
+    LiturgicalRank.WEEKDAY: 13,
+}
+
+# Days of this precedence or higher cannot take a transferred solemnity
+TRANSFER_BARRIER = 8
+
+
+def celebration_precedence(celebration: CompactCelebration) -> int:
+    """Precedence of a celebration in the Table of Liturgical Days."""
+    if celebration.precedence is not None:
+        return celebration.precedence
+    return RANK_PRECEDENCE.get(celebration.rank, 13)
+
+
+def day_precedence(target_date: date, season: LiturgicalSeason, anchors: Dict[str, date]) -> int:
+    """Precedence of a day of a season, before any celebration is placed on it."""
+    if season == LiturgicalSeason.EASTER_TRIDUUM:
+        return 1
+
+    easter = anchors["easter"]
+    sunday = target_date.weekday() == 6
+    if sunday and season in (LiturgicalSeason.ADVENT, LiturgicalSeason.LENT, LiturgicalSeason.EASTER):
+        return 2
+    if target_date == anchors["ash_wednesday"]:
+        return 2
+    if anchors["palm_sunday"] < target_date < anchors["holy_thursday"]:
+        return 2  # Weekdays of Holy Week
+    if easter < target_date <= easter + timedelta(days=7):
+        return 2  # Easter Octave
+    if sunday:
+        return 6
+    if season == LiturgicalSeason.ADVENT and target_date.month == 12 and target_date.day >= 17:
+        return 9
+    if target_date.month == 12 and target_date.day > 25:
+        return 9  # Christmas Octave
+    if season == LiturgicalSeason.LENT:
+        return 9
+    return 13
+
+
+def resolve_year(
+    placed: Dict[date, List[CompactCelebration]],
+    day_ranks: Dict[date, int],
+    anchors: Dict[str, date]
+) -> Dict[date, Tuple[CompactCelebration, ...]]:
+    """
+    Resolve collisions for a year of celebrations placed on their own dates.
+
+    A solemnity outranked by the day it falls on, or by another celebration
+    on that day, is transferred:
+
+    - the Annunciation, from Holy Week or the Easter Octave, to the Monday
+      after the Second Sunday of Easter;
+    - Saint Joseph, from Holy Week, to the Saturday before Palm Sunday;
+    - any other, to the next day after its own.
+
+    Impeded solemnities are transferred in order of precedence, and each
+    goes to the first of those days (or a later one) not already occupied
+    by a day or celebration of precedence 1-8, so no two share a day.
+
+    Lesser celebrations that are outranked are omitted for the year rather
+    than transferred. Returns the celebrations of each day ordered by
+    precedence.
+    """
+    resolved: Dict[date, List[CompactCelebration]] = {d: list(c) for d, c in placed.items()}
+    impeded: List[Tuple[date, CompactCelebration]] = []
+
+    for target_date in sorted(resolved):
+        celebrations = sorted(resolved[target_date], key=celebration_precedence)
+        best = day_ranks.get(target_date, 13)
+        kept = []
+        for celebration in celebrations:
+            precedence = celebration_precedence(celebration)
+            if precedence > best:
+                if celebration.rank == LiturgicalRank.SOLEMNITY:
+                    impeded.append((target_date, celebration))
+                continue
+            kept.append(celebration)
+            best = min(best, precedence)
+        resolved[target_date] = kept
+
+    impeded.sort(key=lambda item: (celebration_precedence(item[1]), item[0]))
+    for original, celebration in impeded:
+        target_date = _transfer_date(original, celebration, resolved, day_ranks, anchors)
+        moved = replace(
+            celebration,
+            description=f"{celebration.description or celebration.name} "
+                        f"(transferred from {original.strftime('%B')} {original.day})"
+        )
+        resolved.setdefault(target_date, []).append(moved)
+
+    return {
+        target_date: tuple(sorted(celebrations, key=celebration_precedence))
+        for target_date, celebrations in resolved.items()
+        if celebrations
+    }
+
+
+def _occupied(target_date: date, resolved: Dict[date, List[CompactCelebration]], day_ranks: Dict[date, int]) -> bool:
+    """Whether a day already has a day or celebration of precedence 1-8."""
+    if day_ranks.get(target_date, 13) <= TRANSFER_BARRIER:
+        return True
+    return any(celebration_precedence(c) <= TRANSFER_BARRIER for c in resolved.get(target_date, ()))
+
+
+def _transfer_date(
+    original: date,
+    celebration: CompactCelebration,
+    resolved: Dict[date, List[CompactCelebration]],
+    day_ranks: Dict[date, int],
+    anchors: Dict[str, date]
+) -> date:
+    """The day an impeded solemnity is transferred to."""
+    holy_week = anchors["palm_sunday"] <= original <= anchors["easter"]
+    easter_octave = anchors["easter"] < original <= anchors["easter"] + timedelta(days=7)
+
+    if celebration.name == "Annunciation of the Lord" and (holy_week or easter_octave):
+        target_date = anchors["easter"] + timedelta(days=8)
+    elif celebration.name == "Saint Joseph" and holy_week:
+        target_date = anchors["palm_sunday"] - timedelta(days=1)
+    else:
+        target_date = original + timedelta(days=1)
+
+    while _occupied(target_date, resolved, day_ranks):
+        target_date += timedelta(days=1)
+    return target_date
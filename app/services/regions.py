@@ -0,0 +1,142 @@
+"""
+Regional calendar overlays.
+
+The universal calendar is computed once per year and shared. A region only
+describes how it differs: proper celebrations, and whether the Epiphany and
+the Ascension are moved to Sunday. Overlays may name a parent, so a diocese
+can build on its national calendar.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from ..models.liturgical import LiturgicalRank, LiturgicalColor
+from ..models.compact import CompactCelebration
+
+UNIVERSAL = "universal"
+
+
+@dataclass(frozen=True)
+class RegionOverlay:
+    """Differences of a regional calendar from its parent."""
+    code: str
+    name: str
+    parent: Optional[str] = None
+    epiphany_on_sunday: Optional[bool] = None  # None inherits from the parent
+    ascension_on_sunday: Optional[bool] = None
+    proper_celebrations: Dict[Tuple[int, int], CompactCelebration] = field(default_factory=dict)
+
+
+REGIONS: Dict[str, RegionOverlay] = {
+    "us": RegionOverlay(
+        code="us",
+        name="United States of America",
+        epiphany_on_sunday=True,
+        ascension_on_sunday=True,  # As in most ecclesiastical provinces
+        proper_celebrations={
+            (1, 4): CompactCelebration(
+                name="Saint Elizabeth Ann Seton",
+                rank=LiturgicalRank.MEMORIAL,
+                color=LiturgicalColor.WHITE,
+                description="Saint Elizabeth Ann Seton, Religious",
+                precedence=11
+            ),
+            (1, 5): CompactCelebration(
+                name="Saint John Neumann",
+                rank=LiturgicalRank.MEMORIAL,
+                color=LiturgicalColor.WHITE,
+                description="Saint John Neumann, Bishop",
+                precedence=11
+            ),
+            (9, 9): CompactCelebration(
+                name="Saint Peter Claver",
+                rank=LiturgicalRank.MEMORIAL,
+                color=LiturgicalColor.WHITE,
+                description="Saint Peter Claver, Priest",
+                precedence=11
+            ),
+            (11, 13): CompactCelebration(
+                name="Saint Frances Xavier Cabrini",
+                rank=LiturgicalRank.MEMORIAL,
+                color=LiturgicalColor.WHITE,
+                description="Saint Frances Xavier Cabrini, Virgin",
+                precedence=11
+            ),
+            (12, 12): CompactCelebration(
+                name="Our Lady of Guadalupe",
+                rank=LiturgicalRank.FEAST,
+                color=LiturgicalColor.WHITE,
+                description="Our Lady of Guadalupe, Patroness of the Americas",
+                precedence=8
+            ),
+        },
+    ),
+    "ca": RegionOverlay(
+        code="ca",
+        name="Canada",
+        epiphany_on_sunday=True,
+        ascension_on_sunday=True,
+        proper_celebrations={
+            (9, 26): CompactCelebration(
+                name="Saints John de Brébeuf, Isaac Jogues and Companions",
+                rank=LiturgicalRank.FEAST,
+                color=LiturgicalColor.RED,
+                description="Saints John de Brébeuf, Isaac Jogues, Priests, and Companions, Martyrs",
+                precedence=8
+            ),
+        },
+    ),
+    "ie": RegionOverlay(
+        code="ie",
+        name="Ireland",
+        proper_celebrations={
+            (2, 1): CompactCelebration(
+                name="Saint Brigid",
+                rank=LiturgicalRank.FEAST,
+                color=LiturgicalColor.WHITE,
+                description="Saint Brigid, Virgin, Secondary Patron of Ireland",
+                precedence=8
+            ),
+            (3, 17): CompactCelebration(
+                name="Saint Patrick",
+                rank=LiturgicalRank.SOLEMNITY,
+                color=LiturgicalColor.WHITE,
+                description="Saint Patrick, Bishop, Principal Patron of Ireland",
+                precedence=4
+            ),
+        },
+    ),
+}
+
+
+@dataclass(frozen=True)
+class ResolvedRegion:
+    """A region with its parents' overlays merged in."""
+    code: str
+    epiphany_on_sunday: bool
+    ascension_on_sunday: bool
+    proper_celebrations: Dict[Tuple[int, int], CompactCelebration]
+
+
+def resolve_region(code: str) -> ResolvedRegion:
+    """
+    Merge a region's overlay with those of its parents.
+
+    Raises KeyError for unknown regions.
+    """
+    chain = []
+    while code is not None:
+        overlay = REGIONS[code]
+        chain.append(overlay)
+        code = overlay.parent
+
+    epiphany_on_sunday = ascension_on_sunday = False
+    proper_celebrations: Dict[Tuple[int, int], CompactCelebration] = {}
+    for overlay in reversed(chain):
+        if overlay.epiphany_on_sunday is not None:
+            epiphany_on_sunday = overlay.epiphany_on_sunday
+        if overlay.ascension_on_sunday is not None:
+            ascension_on_sunday = overlay.ascension_on_sunday
+        proper_celebrations.update(overlay.proper_celebrations)
+
+    return ResolvedRegion(chain[0].code, epiphany_on_sunday, ascension_on_sunday, proper_celebrations)
@@ -0,0 +1,308 @@
+"""
+Scripture references: parsing, normalization and an interval index.
+
+References such as "Jn 6:51-58", "John 6:51-58" or "Mark 14:1—15:47" are
+parsed into ranges over a book, with positions encoded as
+chapter * 1000 + verse so a range is a plain integer interval. The index
+keeps, per book, the ranges of stored readings sorted by start, and answers
+"which dates read a passage overlapping this one" with a bisection rather
+than by looking at every date.
+"""
+
+import json
+import re
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..models.liturgical import DailyReadings
+
+# Canonical book names (as in the Lectionary for Mass) and their abbreviations
+BOOKS: Tuple[Tuple[str, ...], ...] = (
+    ("Genesis", "Gn", "Gen"),
+    ("Exodus", "Ex", "Exod"),
+    ("Leviticus", "Lv", "Lev"),
+    ("Numbers", "Nm", "Num"),
+    ("Deuteronomy", "Dt", "Deut"),
+    ("Joshua", "Jos", "Josh"),
+    ("Judges", "Jgs", "Judg"),
+    ("Ruth", "Ru"),
+    ("1 Samuel", "1 Sm", "1 Sam"),
+    ("2 Samuel", "2 Sm", "2 Sam"),
+    ("1 Kings", "1 Kgs"),
+    ("2 Kings", "2 Kgs"),
+    ("1 Chronicles", "1 Chr", "1 Chron"),
+    ("2 Chronicles", "2 Chr", "2 Chron"),
+    ("Ezra", "Ezr"),
+    ("Nehemiah", "Neh"),
+    ("Tobit", "Tb", "Tob"),
+    ("Judith", "Jdt"),
+    ("Esther", "Est", "Esth"),
+    ("1 Maccabees", "1 Mc", "1 Macc"),
+    ("2 Maccabees", "2 Mc", "2 Macc"),
+    ("Job", "Jb"),
+    ("Psalms", "Psalm", "Ps", "Pss"),
+    ("Proverbs", "Prv", "Prov"),
+    ("Ecclesiastes", "Eccl", "Qoheleth"),
+    ("Song of Songs", "Sg", "Song", "Song of Solomon"),
+    ("Wisdom", "Wis"),
+    ("Sirach", "Sir", "Ecclesiasticus"),
+    ("Isaiah", "Is", "Isa"),
+    ("Jeremiah", "Jer"),
+    ("Lamentations", "Lam"),
+    ("Baruch", "Bar"),
+    ("Ezekiel", "Ez", "Ezek"),
+    ("Daniel", "Dn", "Dan"),
+    ("Hosea", "Hos"),
+    ("Joel", "Jl"),
+    ("Amos", "Am"),
+    ("Obadiah", "Ob", "Obad"),
+    ("Jonah", "Jon"),
+    ("Micah", "Mi", "Mic"),
+    ("Nahum", "Na", "Nah"),
+    ("Habakkuk", "Hb", "Hab"),
+    ("Zephaniah", "Zep", "Zeph"),
+    ("Haggai", "Hg", "Hag"),
+    ("Zechariah", "Zec", "Zech"),
+    ("Malachi", "Mal"),
+    ("Matthew", "Mt", "Matt"),
+    ("Mark", "Mk"),
+    ("Luke", "Lk"),
+    ("John", "Jn"),
+    ("Acts", "Acts of the Apostles"),
+    ("Romans", "Rom"),
+    ("1 Corinthians", "1 Cor"),
+    ("2 Corinthians", "2 Cor"),
+    ("Galatians", "Gal"),
+    ("Ephesians", "Eph"),
+    ("Philippians", "Phil"),
+    ("Colossians", "Col"),
+    ("1 Thessalonians", "1 Thes", "1 Thess"),
+    ("2 Thessalonians", "2 Thes", "2 Thess"),
+    ("1 Timothy", "1 Tm", "1 Tim"),
+    ("2 Timothy", "2 Tm", "2 Tim"),
+    ("Titus", "Ti", "Tit"),
+    ("Philemon", "Phlm"),
+    ("Hebrews", "Heb"),
+    ("James", "Jas"),
+    ("1 Peter", "1 Pt", "1 Pet"),
+    ("2 Peter", "2 Pt", "2 Pet"),
+    ("1 John", "1 Jn"),
+    ("2 John", "2 Jn"),
+    ("3 John", "3 Jn"),
+    ("Jude",),
+    ("Revelation", "Rv", "Rev", "Apocalypse"),
+)
+
+READING_PARTS = ("first_reading", "responsorial_psalm", "second_reading", "gospel")
+
+# Verses per chapter never reach this, so chapter * VERSE_SPAN + verse orders positions
+VERSE_SPAN = 1000
+
+_DASHES = re.compile(r"\s*[-–—]\s*")
+_BOOK = re.compile(r"^\s*([1-3]\s*|(?:iii|ii|i)\s+)?([a-z][a-z .]*?)\.?\s*(?=\d)")
+_ROMAN = {"i": "1", "ii": "2", "iii": "3"}
+
+
+def _book_key(text: str) -> str:
+    return re.sub(r"[\s.]", "", text.lower())
+
+
+BOOK_NAMES: Dict[str, str] = {
+    _book_key(alias): names[0] for names in BOOKS for alias in names
+}
+
+
+class ScriptureReferenceError(ValueError):
+    """A scripture reference that cannot be parsed."""
+
+
+@dataclass(frozen=True, slots=True)
+class ScriptureRange:
+    """A contiguous passage of one book, as [start, end] positions."""
+    book: str
+    start: int
+    end: int
+
+    def overlaps(self, other: "ScriptureRange") -> bool:
+        return self.book == other.book and self.start <= other.end and other.start <= self.end
+
+    def __str__(self) -> str:
+        (start_chapter, start_verse), (end_chapter, end_verse) = (
+            divmod(self.start, VERSE_SPAN), divmod(self.end, VERSE_SPAN)
+        )
+        if start_verse == 0 and end_verse == VERSE_SPAN - 1:
+            chapters = str(start_chapter) if start_chapter == end_chapter else f"{start_chapter}-{end_chapter}"
+            return f"{self.book} {chapters}"
+        if start_chapter == end_chapter:
+            verses = str(start_verse) if start_verse == end_verse else f"{start_verse}-{end_verse}"
+            return f"{self.book} {start_chapter}:{verses}"
+        return f"{self.book} {start_chapter}:{start_verse}-{end_chapter}:{end_verse}"
+
+
+def _number(text: str) -> int:
+    """A chapter or verse number, ignoring part-verse letters (e.g. '12b')."""
+    match = re.match(r"\d+", text.strip())
+    if match is None:
+        raise ScriptureReferenceError(f"Expected a number, got '{text.strip()}'")
+    return int(match.group())
+
+
+def parse_reference(reference: str) -> List[ScriptureRange]:
+    """
+    Parse a reference into ranges, e.g. "Jn 1:1-5, 9-14" into two ranges.
+
+    Handles abbreviations, chapter-only references ("Ps 23"), ranges across
+    chapters ("Mk 14:1—15:47"), lists separated by commas and semicolons,
+    alternatives joined by "or", and part-verse letters. Raises
+    ScriptureReferenceError when the reference cannot be parsed.
+    """
+    ranges: List[ScriptureRange] = []
+    book: Optional[str] = None
+
+    for part in re.split(r";|\bor\b", reference):
+        part = part.strip()
+        if not part:
+            continue
+
+        match = _BOOK.match(part.lower())
+        if match:
+            number = match.group(1)
+            number = _ROMAN.get(number.strip(), number.strip()) if number else ""
+            key = number + _book_key(match.group(2))
+            if key not in BOOK_NAMES:
+                raise ScriptureReferenceError(f"Unknown book in '{reference}'")
+            book = BOOK_NAMES[key]
+            part = part[match.end():]
+        if book is None:
+            raise ScriptureReferenceError(f"No book in '{reference}'")
+
+        chapter: Optional[int] = None
+        for piece in part.split(","):
+            piece = piece.strip()
+            if not piece:
+                continue
+            first, _, last = (p.strip() for p in _DASHES.sub("-", piece).partition("-"))
+
+            if ":" in first:
+                chapter_text, verse_text = first.split(":", 1)
+                chapter = _number(chapter_text)
+                start = chapter * VERSE_SPAN + _number(verse_text)
+            elif chapter is not None:
+                start = chapter * VERSE_SPAN + _number(first)
+            else:
+                # Whole chapters, e.g. "Ps 23" or "Ps 23-24"
+                start_chapter = _number(first)
+                end_chapter = _number(last) if last else start_chapter
+                ranges.append(ScriptureRange(
+                    book, start_chapter * VERSE_SPAN, end_chapter * VERSE_SPAN + VERSE_SPAN - 1
+                ))
+                continue
+
+            if not last:
+                end = start
+            elif ":" in last:
+                chapter_text, verse_text = last.split(":", 1)
+                chapter = _number(chapter_text)
+                end = chapter * VERSE_SPAN + _number(verse_text)
+            else:
+                end = chapter * VERSE_SPAN + _number(last)
+            if end < start:
+                raise ScriptureReferenceError(f"Range ends before it starts in '{reference}'")
+            ranges.append(ScriptureRange(book, start, end))
+
+    if not ranges:
+        raise ScriptureReferenceError(f"No passage in '{reference}'")
+    return ranges
+
+
+@dataclass(frozen=True, slots=True)
+class PassageMatch:
+    """A reading of a date whose passage overlaps a query."""
+    date: date
+    part: str
+    reference: str
+
+
+class ScriptureIndex:
+    """
+    Interval index over the scripture references of stored readings.
+
+    Per book, ranges are kept sorted by start together with the longest
+    range seen, so overlaps with [start, end] are found by bisecting to
+    start - longest and reading forward to end.
+    """
+
+    def __init__(self):
+        self._starts: Dict[str, List[int]] = defaultdict(list)
+        self._entries: Dict[str, List[Tuple[int, int, date, str, str]]] = defaultdict(list)
+        self._longest: Dict[str, int] = defaultdict(int)
+        self._by_date: Dict[date, List[Tuple[str, Tuple[int, int, date, str, str]]]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._by_date)
+
+    def add(self, target_date: date, part: str, reference: str):
+        """Index one reading; references that cannot be parsed are skipped."""
+        try:
+            ranges = parse_reference(reference)
+        except ScriptureReferenceError:
+            return
+        for passage in ranges:
+            entry = (passage.start, passage.end, target_date, part, reference)
+            index = bisect_right(self._starts[passage.book], passage.start)
+            self._starts[passage.book].insert(index, passage.start)
+            self._entries[passage.book].insert(index, entry)
+            self._longest[passage.book] = max(self._longest[passage.book], passage.end - passage.start)
+            self._by_date[target_date].append((passage.book, entry))
+
+    def remove_date(self, target_date: date):
+        """Drop every reading of a date."""
+        for book, entry in self._by_date.pop(target_date, ()):
+            starts, entries = self._starts[book], self._entries[book]
+            index = bisect_left(starts, entry[0])
+            while entries[index] != entry:
+                index += 1
+            del starts[index]
+            del entries[index]
+
+    def add_readings(self, readings: DailyReadings):
+        """Index the references of a day's readings, replacing any earlier ones."""
+        self.remove_date(readings.date)
+        for part in READING_PARTS:
+            reading = getattr(readings, part)
+            if reading is not None:
+                self.add(readings.date, part, reading.reference)
+
+    def add_json(self, target_date: date, data: str):
+        """Index stored readings JSON without building the full model."""
+        self.remove_date(target_date)
+        readings = json.loads(data)
+        for part in READING_PARTS:
+            reading = readings.get(part)
+            if reading and reading.get("reference"):
+                self.add(target_date, part, reading["reference"])
+
+    def find(
+        self,
+        passages: Iterable[ScriptureRange],
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> List[PassageMatch]:
+        """Readings overlapping any of the passages, between optional dates, in date order."""
+        found = {}
+        for passage in passages:
+            starts, entries = self._starts.get(passage.book), self._entries.get(passage.book)
+            if not starts:
+                continue
+            first = bisect_left(starts, passage.start - self._longest[passage.book])
+            last = bisect_right(starts, passage.end)
+            for entry_start, entry_end, target_date, part, reference in entries[first:last]:
+                if entry_end < passage.start:
+                    continue
+                if (start and target_date < start) or (end and target_date > end):
+                    continue
+                found[(target_date, part)] = PassageMatch(target_date, part, reference)
+        return [found[key] for key in sorted(found, key=lambda key: (key[0], READING_PARTS.index(key[1])))]
@@ -0,0 +1,177 @@
+"""
+In-process full-text search over prayers and cached readings.
+
+An inverted index maps each term to the documents containing it, so a query
+only visits the documents listed under its terms, starting from the rarest,
+and never scans every object. Results are ranked with BM25. Each data source
+manager owns one index, built from the prayer catalog and its local readings
+and updated as readings are fetched and refreshed.
+"""
+
+import math
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..models.liturgical import DailyReadings, Prayer
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+EXCERPT_LENGTH = 160
+
+READING_PARTS = {
+    "first_reading": "First Reading",
+    "responsorial_psalm": "Responsorial Psalm",
+    "second_reading": "Second Reading",
+    "gospel": "Gospel",
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase terms, ignoring accents and punctuation."""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return _TOKEN.findall(text)
+
+
+@dataclass(slots=True)
+class SearchDocument:
+    """An indexed document, with what a search result shows of it."""
+    doc_id: str
+    kind: str
+    title: str
+    excerpt: str
+    length: int
+    terms: Tuple[str, ...]
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+class SearchIndex:
+    """Inverted index with BM25 ranking and incremental updates."""
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._documents: Dict[str, SearchDocument] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._documents
+
+    def add(self, doc_id: str, kind: str, title: str, text: str, payload: Optional[Dict[str, Any]] = None):
+        """
+        Add a document, replacing any previous version with the same id.
+
+        Title terms are counted twice so they rank above passing mentions.
+        """
+        self.remove(doc_id)
+        terms = tokenize(title) * 2 + tokenize(text)
+        counts: Dict[str, int] = defaultdict(int)
+        for term in terms:
+            counts[term] += 1
+        for term, count in counts.items():
+            self._postings[term][doc_id] = count
+
+        excerpt = " ".join(text.split())
+        if len(excerpt) > EXCERPT_LENGTH:
+            excerpt = excerpt[:EXCERPT_LENGTH].rsplit(" ", 1)[0] + "..."
+        self._documents[doc_id] = SearchDocument(
+            doc_id, kind, title, excerpt, len(terms), tuple(counts), payload or {}
+        )
+        self._total_length += len(terms)
+
+    def remove(self, doc_id: str):
+        """Remove a document, if indexed."""
+        document = self._documents.pop(doc_id, None)
+        if document is None:
+            return
+        self._total_length -= document.length
+        for term in document.terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+
+    def search(
+        self,
+        query: str,
+        kind: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 20
+    ) -> Tuple[int, List[Tuple[SearchDocument, float]]]:
+        """
+        Find documents containing every term of a query.
+
+        Returns the total number of matches and one page of (document, score)
+        pairs, best first.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return 0, []
+        postings = [self._postings.get(term) for term in terms]
+        if not all(postings):
+            return 0, []
+
+        # Intersect from the rarest term, so the work is bounded by its postings
+        order = sorted(range(len(terms)), key=lambda i: len(postings[i]))
+        candidates = [
+            doc_id for doc_id in postings[order[0]]
+            if kind is None or self._documents[doc_id].kind == kind
+        ]
+        for i in order[1:]:
+            candidates = [doc_id for doc_id in candidates if doc_id in postings[i]]
+
+        count = len(self._documents)
+        average = self._total_length / count
+        idf = [math.log(1 + (count - len(p) + 0.5) / (len(p) + 0.5)) for p in postings]
+
+        scored = []
+        for doc_id in candidates:
+            document = self._documents[doc_id]
+            norm = K1 * (1 - B + B * document.length / average)
+            score = 0.0
+            for i, term_postings in enumerate(postings):
+                frequency = term_postings[doc_id]
+                score += idf[i] * frequency * (K1 + 1) / (frequency + norm)
+            scored.append((document, score))
+
+        scored.sort(key=lambda hit: (-hit[1], hit[0].doc_id))
+        return len(scored), scored[offset:offset + limit]
+
+    def add_prayers(self, prayers: Iterable[Prayer]):
+        """Index prayers, one document per prayer and language."""
+        for prayer in prayers:
+            self.add(
+                f"prayer:{prayer.language}:{prayer.name}",
+                "prayer",
+                prayer.name,
+                f"{prayer.category}. {prayer.text}",
+                {"name": prayer.name, "category": prayer.category, "language": prayer.language}
+            )
+
+    def add_readings(self, readings: DailyReadings):
+        """Index the readings of a date, one document per reading."""
+        for part, label in READING_PARTS.items():
+            reading = getattr(readings, part)
+            if reading is None:
+                self.remove(f"reading:{readings.date.isoformat()}:{part}")
+                continue
+            if part == "responsorial_psalm":
+                text = " ".join(filter(None, [reading.refrain, *(reading.verses or [])]))
+            else:
+                text = reading.text or reading.short_text or ""
+            self.add(
+                f"reading:{readings.date.isoformat()}:{part}",
+                "reading",
+                f"{label} {reading.reference}",
+                text,
+                {"date": readings.date.isoformat(), "part": part, "reference": reading.reference}
+            )
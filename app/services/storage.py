@@ -0,0 +1,190 @@
+"""
+Persistent storage for cached liturgical data.
+
+Uses the SQLite database configured by DATABASE_URL so cached content
+survives restarts and can be shared by several workers on one host.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, date
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
+
+from ..core.config import settings
+from ..models.liturgical import DailyReadings
+
+
+def database_path(url: Optional[str] = None) -> str:
+    """Convert a sqlite:/// DATABASE_URL into a filesystem path."""
+    url = url or settings.DATABASE_URL or "sqlite:///:memory:"
+    if not url.startswith("sqlite:///"):
+        raise ValueError(f"Only sqlite:/// database URLs are supported, got '{url}'")
+    return url[len("sqlite:///"):] or ":memory:"
+
+
+class SQLiteStore:
+    """Base class for small SQLite-backed stores with a lazily opened connection."""
+
+    SCHEMA = ""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or database_path()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open the database on first use and make sure the schema exists."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class DocumentStore(SQLiteStore):
+    """Parsed Vatican document summaries keyed by URL, with HTTP validators."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS documents (
+            url TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            source TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at TEXT NOT NULL
+        );
+    """
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the stored document for a URL, if any."""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM documents WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        document = dict(row)
+        document["fetched_at"] = datetime.fromisoformat(document["fetched_at"])
+        return document
+
+    def put(self, document: Dict[str, Any]):
+        """Insert or replace a document."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO documents "
+                "(url, title, content, source, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    document["url"],
+                    document["title"],
+                    document["content"],
+                    document["source"],
+                    document.get("etag"),
+                    document.get("last_modified"),
+                    document["fetched_at"].isoformat(),
+                ),
+            )
+
+    def touch(self, url: str, fetched_at: datetime):
+        """Mark a document as revalidated without changing its content."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE documents SET fetched_at = ? WHERE url = ?",
+                (fetched_at.isoformat(), url),
+            )
+
+
+class ReadingsStore(SQLiteStore):
+    """Parsed daily readings keyed by date, with the upstream HTTP validators."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS readings (
+            date TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at TEXT NOT NULL
+        );
+    """
+
+    def get(self, target_date: date) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored entry for a date, if any.
+
+        The entry has the keys readings, etag, last_modified and fetched_at.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT * FROM readings WHERE date = ?", (target_date.isoformat(),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "readings": DailyReadings.parse_raw(row["data"]),
+            "etag": row["etag"],
+            "last_modified": row["last_modified"],
+            "fetched_at": datetime.fromisoformat(row["fetched_at"]),
+        }
+
+    def put_many(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or update entries in a single transaction.
+
+        Validators missing from an entry keep their stored values, so
+        re-parsed readings can be written without losing them.
+        """
+        rows = [
+            (
+                entry["readings"].date.isoformat(),
+                entry["readings"].json(),
+                entry.get("etag"),
+                entry.get("last_modified"),
+                entry["fetched_at"].isoformat(),
+            )
+            for entry in entries
+        ]
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO readings (date, data, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(date) DO UPDATE SET "
+                "data = excluded.data, "
+                "etag = COALESCE(excluded.etag, readings.etag), "
+                "last_modified = COALESCE(excluded.last_modified, readings.last_modified), "
+                "fetched_at = excluded.fetched_at",
+                rows,
+            )
+        return len(rows)
+
+    def put(self, entry: Dict[str, Any]):
+        """Insert or update a single entry."""
+        self.put_many([entry])
+
+    def touch(self, target_date: date, fetched_at: datetime):
+        """Mark an entry as revalidated without changing its content."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE readings SET fetched_at = ? WHERE date = ?",
+                (fetched_at.isoformat(), target_date.isoformat()),
+            )
+
+    def iter_json(self) -> Iterator[Tuple[date, str]]:
+        """Yield (date, readings JSON) for every stored entry, in date order."""
+        with self._lock:
+            rows = self.conn.execute("SELECT date, data FROM readings ORDER BY date").fetchall()
+        for row in rows:
+            yield date.fromisoformat(row["date"]), row["data"]
+
+    def dates(self) -> List[date]:
+        """List the stored dates, in order."""
+        with self._lock:
+            rows = self.conn.execute("SELECT date FROM readings ORDER BY date").fetchall()
+        return [date.fromisoformat(row["date"]) for row in rows]
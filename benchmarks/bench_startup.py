@@ -0,0 +1,71 @@
+"""
+Startup benchmark: time to import the application and serve a first request.
+
+Each run uses a fresh interpreter, as a newly scaled-up worker would. Run
+from the repository root:
+
+    python benchmarks/bench_startup.py [--runs 10] > bench_output.txt
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "all routers": None,
+    "calendar only": '["calendar"]',
+}
+
+STARTUP = """
+import json, time
+start = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+client = TestClient(app.main.app)
+client_ready = time.perf_counter()
+response = client.get("/api/v1/calendar/2024-12-25")
+assert response.status_code == 200, response.text
+served = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "first_request": served - client_ready,
+}))
+"""
+
+
+def run_once(routers):
+    env = {**os.environ, "RATE_LIMIT_ENABLED": "false"}
+    if routers is not None:
+        env["API_ROUTERS"] = routers
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters per scenario")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<16} {'import (ms)':>24} {'first request (ms)':>24}")
+    for name, routers in SCENARIOS.items():
+        runs = [run_once(routers) for _ in range(args.runs)]
+        imports = [run["import"] * 1000 for run in runs]
+        requests = [run["first_request"] * 1000 for run in runs]
+        print(
+            f"{name:<16} "
+            f"{statistics.median(imports):>11.1f} (min {min(imports):>6.1f}) "
+            f"{statistics.median(requests):>11.1f} (min {min(requests):>6.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
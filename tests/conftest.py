@@ -0,0 +1,46 @@
+"""
+Shared fixtures for API tests.
+"""
+
+import os
+
+# Tests exercise endpoints far faster than any real client would, and each
+# test uses its own data manager, so responses must not be shared between tests
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("COMPRESSION_ENABLED", "false")
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import calendar, readings, documents, search
+from tests.test_data_sources import READINGS_HTML, make_manager, mock_session
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """A data source manager with temporary storage and a mocked USCCB site."""
+    manager = make_manager(tmp_path)
+    manager.requested = []
+
+    def handler(request):
+        manager.requested.append(request.url.path)
+        return httpx.Response(200, text=READINGS_HTML)
+
+    manager.usccb.session = mock_session(handler)
+    return manager
+
+
+@pytest.fixture
+def client(manager):
+    """A test client whose routers all use the `manager` fixture."""
+    async def get_manager():
+        return manager
+
+    for module in (calendar, readings, documents, search):
+        app.dependency_overrides[module.get_data_manager] = get_manager
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,225 @@
+"""
+Tests for API endpoints (upstream sources are mocked).
+"""
+
+import json
+from datetime import date, timedelta
+
+from app.core.config import settings
+
+
+class TestCalendarEndpoints:
+    """Test single-date calendar lookups."""
+
+    def test_calendar_is_local_by_default(self, client, manager):
+        """Test a plain calendar lookup makes no upstream request."""
+        response = client.get("/api/v1/calendar/2024-12-25")
+
+        assert response.status_code == 200
+        day = response.json()["liturgical_day"]
+        assert day["season"] == "Christmas"
+        assert day["readings"] is None
+        assert manager.requested == []
+
+    def test_calendar_include_readings(self, client, manager):
+        """Test readings are added when asked for."""
+        response = client.get("/api/v1/calendar/2024-12-25?include=readings")
+
+        assert response.json()["liturgical_day"]["readings"]["gospel"]["reference"] == "Luke 2:1-14"
+        assert len(manager.requested) == 1
+
+    def test_calendar_unknown_include(self, client):
+        """Test unknown include options are rejected."""
+        assert client.get("/api/v1/calendar/2024-12-25?include=saints").status_code == 400
+
+    def test_season_key_dates(self, client):
+        """Test key dates of a liturgical year, including Christ the King."""
+        response = client.get("/api/v1/calendar/season/2024")
+
+        assert response.json()["data"] == {
+            "year": 2024,
+            "epiphany": "2024-01-06",
+            "easter": "2024-03-31",
+            "advent_start": "2024-12-01",
+            "ash_wednesday": "2024-02-14",
+            "palm_sunday": "2024-03-24",
+            "good_friday": "2024-03-29",
+            "ascension": "2024-05-09",
+            "pentecost": "2024-05-19",
+            "christ_the_king": "2024-11-24",
+        }
+
+
+class TestBatchEndpoints:
+    """Test batch date lookups."""
+
+    def test_calendar_batch(self, client):
+        """Test calendar batch returns days in request order across years."""
+        dates = ["2025-12-25", "2024-03-31", "2024-12-25"]
+        response = client.post("/api/v1/calendar/batch?include=readings", json={"dates": dates})
+
+        assert response.status_code == 200
+        days = response.json()["liturgical_days"]
+        assert [d["date"] for d in days] == dates
+        assert days[1]["primary_celebration"]["name"] == "Easter Sunday"
+        assert days[0]["readings"]["gospel"]["reference"] == "Luke 2:1-14"
+
+    def test_calendar_batch_without_readings(self, client, manager):
+        """Test calendar batch is computed locally unless readings are included."""
+        response = client.post("/api/v1/calendar/batch", json={"dates": ["2024-12-25"]})
+
+        assert response.json()["liturgical_days"][0]["readings"] is None
+        assert manager.requested == []
+
+    def test_readings_batch_deduplicates(self, client, manager):
+        """Test duplicate dates are fetched once but returned for each request."""
+        dates = ["2024-12-25", "2024-12-24", "2024-12-25"]
+        response = client.post("/api/v1/readings/batch", json={"dates": dates})
+
+        assert response.status_code == 200
+        assert [r["date"] for r in response.json()["readings"]] == dates
+        assert len(manager.requested) == 2
+
+    def test_batch_fetches_capped(self, client, manager, monkeypatch):
+        """Test one batch triggers at most BATCH_MAX_FETCHES upstream requests."""
+        monkeypatch.setattr(settings, "BATCH_MAX_FETCHES", 3)
+        dates = [f"2024-11-{d:02d}" for d in range(1, 11)]
+
+        body = client.post("/api/v1/readings/batch", json={"dates": dates}).json()
+        assert len(manager.requested) == 3
+        fetched = [r["date"] for r in body["readings"] if r["gospel"] is not None]
+        assert len(fetched) == 3
+        assert sorted(fetched + body["not_fetched"]) == dates
+
+        dates = [f"2024-10-{d:02d}" for d in range(1, 11)]
+        body = client.post("/api/v1/calendar/batch?include=readings", json={"dates": dates}).json()
+        assert len(manager.requested) == 6
+        fetched = [d["date"] for d in body["liturgical_days"] if d["readings"] is not None]
+        assert len(fetched) == 3
+        assert sorted(fetched + body["not_fetched"]) == dates
+
+    def test_batch_reports_nothing_skipped(self, client, manager):
+        """Test batches within the fetch limit report no skipped dates, even for fields."""
+        response = client.post("/api/v1/readings/batch?fields=date", json={"dates": ["2024-12-25"]})
+
+        assert response.json()["not_fetched"] == []
+
+    def test_batch_validation(self, client):
+        """Test invalid and empty batches are rejected."""
+        assert client.post("/api/v1/readings/batch", json={"dates": []}).status_code == 422
+        assert client.post("/api/v1/calendar/batch", json={"dates": ["2024-13-01"]}).status_code == 422
+
+
+class TestReadingsRange:
+    """Test buffered and streamed readings ranges."""
+
+    def test_buffered_range(self, client):
+        """Test the JSON range returns every day in order."""
+        response = client.get("/api/v1/readings/range/2024-12-20/2024-12-26")
+
+        assert response.status_code == 200
+        dates = [r["date"] for r in response.json()["readings"]]
+        assert dates == [f"2024-12-{d}" for d in range(20, 27)]
+
+    def test_buffered_range_limit(self, client):
+        """Test long ranges are rejected unless streamed."""
+        response = client.get("/api/v1/readings/range/2024-01-01/2024-03-01")
+        assert response.status_code == 400
+
+    def test_buffered_range_not_capped(self, client, manager):
+        """Test a cold 31-day range fetches and returns every day."""
+        response = client.get("/api/v1/readings/range/2024-11-01/2024-12-01")
+
+        assert len(response.json()["readings"]) == 31
+        assert len(manager.requested) == 31
+
+    def test_streamed_range(self, client):
+        """Test NDJSON streaming allows a whole season, one line per day."""
+        response = client.get("/api/v1/readings/range/2025-03-05/2025-06-08?format=ndjson")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = response.text.splitlines()
+        assert len(lines) == 96
+        assert '"date": "2025-03-05"' in lines[0]
+        assert '"date": "2025-06-08"' in lines[-1]
+
+    def test_streamed_range_reports_unfetched_dates(self, client, manager):
+        """Test a stream past READINGS_STREAM_MAX_FETCHES ends with the dates it did not fetch."""
+        client.get("/api/v1/readings/2025-03-20")
+        response = client.get("/api/v1/readings/range/2025-01-01/2025-06-30?format=ndjson")
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        *days, status = lines
+        assert len(manager.requested) == 1 + settings.READINGS_STREAM_MAX_FETCHES
+        assert len(days) == 1 + settings.READINGS_STREAM_MAX_FETCHES
+        assert status["status"] == "incomplete"
+        assert len(status["not_fetched"]) == 181 - len(days)
+        assert sorted([day["date"] for day in days] + status["not_fetched"]) == [
+            (date(2025, 1, 1) + timedelta(days=i)).isoformat() for i in range(181)
+        ]
+
+    def test_streamed_range_accept_header(self, client):
+        """Test streaming can be requested with the Accept header."""
+        response = client.get(
+            "/api/v1/readings/range/2024-12-24/2024-12-25",
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert len(response.text.splitlines()) == 2
+
+    def test_invalid_range(self, client):
+        """Test invalid dates and reversed ranges are rejected."""
+        assert client.get("/api/v1/readings/range/2024-12-25/nope").status_code == 400
+        assert client.get("/api/v1/readings/range/2024-12-25/2024-12-01").status_code == 400
+
+
+class TestFieldProjection:
+    """Test ?fields= sparse fieldsets."""
+
+    def test_calendar_fields(self, client, manager):
+        """Test only requested calendar fields are returned."""
+        response = client.get("/api/v1/calendar/2024-12-25?fields=season,color,primary_celebration.name")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["liturgical_day"] == {
+            "season": "Christmas",
+            "color": "White",
+            "primary_celebration": {"name": "Nativity of the Lord"},
+        }
+        assert body["success"] is True
+        assert manager.requested == []
+
+    def test_calendar_fields_imply_readings(self, client):
+        """Test asking for a readings field fetches readings."""
+        response = client.get("/api/v1/calendar/2024-12-25?fields=season,readings.gospel.reference")
+
+        assert response.json()["liturgical_day"] == {
+            "season": "Christmas",
+            "readings": {"gospel": {"reference": "Luke 2:1-14"}},
+        }
+
+    def test_list_fields(self, client):
+        """Test projections apply to each element of lists."""
+        response = client.post(
+            "/api/v1/calendar/batch?fields=date,celebrations.name",
+            json={"dates": ["2024-12-25", "2024-06-15"]},
+        )
+
+        assert response.json()["liturgical_days"] == [
+            {"date": "2024-12-25", "celebrations": [{"name": "Nativity of the Lord"}]},
+            {"date": "2024-06-15", "celebrations": []},
+        ]
+
+    def test_readings_fields(self, client):
+        """Test readings endpoints support projections, including streams."""
+        response = client.get("/api/v1/readings/2024-12-24?fields=gospel.reference")
+        assert response.json()["readings"] == {"gospel": {"reference": "Luke 2:1-14"}}
+
+        response = client.get("/api/v1/readings/range/2024-12-24/2024-12-25?format=ndjson&fields=date")
+        assert response.text.splitlines() == ['{"date": "2024-12-24"}', '{"date": "2024-12-25"}']
+
+    def test_unknown_fields(self, client):
+        """Test unknown field paths are rejected."""
+        assert client.get("/api/v1/calendar/2024-12-25?fields=season.name").status_code == 400
+        assert client.get("/api/v1/readings/2024-12-25?fields=homily").status_code == 400
@@ -0,0 +1,96 @@
+"""
+Tests for the raw page archive and offline re-parsing.
+"""
+
+import asyncio
+import calendar
+import os
+import httpx
+from datetime import date, datetime
+
+from app.services.archive import HTMLArchive
+from app.services.batch import reparse_archive
+from app.services.data_sources import USCCBDataSource
+from app.services.storage import ReadingsStore
+from tests.test_data_sources import READINGS_HTML, mock_session
+
+
+def count_objects(archive: HTMLArchive) -> int:
+    """Count stored page objects."""
+    return sum(len(files) for _, _, files in os.walk(os.path.join(archive.root, "objects")))
+
+
+class TestHTMLArchive:
+    """Test the content-addressed archive."""
+
+    def test_round_trip(self, tmp_path):
+        """Test an archived page can be read back."""
+        archive = HTMLArchive(str(tmp_path))
+        archive.put("usccb", date(2024, 12, 25), READINGS_HTML)
+
+        assert archive.get("usccb", date(2024, 12, 25)) == READINGS_HTML
+        assert archive.get("usccb", date(2024, 12, 26)) is None
+        assert archive.dates("usccb") == [date(2024, 12, 25)]
+
+    def test_identical_pages_stored_once(self, tmp_path):
+        """Test identical content is stored once and compressed."""
+        archive = HTMLArchive(str(tmp_path))
+        archive.put("usccb", date(2024, 12, 25), READINGS_HTML)
+        archive.put("usccb", date(2025, 12, 25), READINGS_HTML)
+
+        assert count_objects(archive) == 1
+        assert archive.dates("usccb") == [date(2024, 12, 25), date(2025, 12, 25)]
+
+    def test_fetched_pages_are_archived(self, tmp_path):
+        """Test the USCCB source archives pages it downloads."""
+        archive = HTMLArchive(str(tmp_path))
+        source = USCCBDataSource(archive=archive)
+        source.session = mock_session(lambda request: httpx.Response(200, text=READINGS_HTML))
+
+        asyncio.run(source.fetch_readings(date(2024, 12, 25)))
+
+        assert archive.get("usccb", date(2024, 12, 25)) == READINGS_HTML
+
+
+class TestReparseArchive:
+    """Test rebuilding readings from the archive."""
+
+    def test_reparse_writes_store(self, tmp_path):
+        """Test archived pages are parsed into the readings store."""
+        archive = HTMLArchive(str(tmp_path / "archive"))
+        archive.put("usccb", date(2024, 12, 24), READINGS_HTML)
+        archive.put("usccb", date(2024, 12, 25), READINGS_HTML)
+        archive.put("usccb", date(2024, 12, 26), "<html><body>No readings</body></html>")
+        store = ReadingsStore(str(tmp_path / "readings.db"))
+
+        stats = reparse_archive(archive, store, workers=2, batch_size=1)
+
+        assert stats == {"pages": 3, "parsed": 2, "empty": 1, "errors": 0}
+        assert store.dates() == [date(2024, 12, 24), date(2024, 12, 25)]
+        assert store.get(date(2024, 12, 25))["readings"].gospel.reference == "Luke 2:1-14"
+
+    def test_reparse_keeps_validators(self, tmp_path):
+        """Test re-parsing does not discard stored HTTP validators."""
+        archive = HTMLArchive(str(tmp_path / "archive"))
+        archive.put("usccb", date(2024, 12, 25), READINGS_HTML)
+        store = ReadingsStore(str(tmp_path / "readings.db"))
+
+        parsed = USCCBDataSource().parse_readings_page(READINGS_HTML, date(2024, 12, 25))
+        store.put({"readings": parsed, "etag": '"abc"', "fetched_at": parsed.last_updated})
+
+        reparse_archive(archive, store, workers=1)
+
+        assert store.get(date(2024, 12, 25))["etag"] == '"abc"'
+
+    def test_reparse_keeps_fetch_time(self, tmp_path):
+        """Test re-parsed readings keep the time their page was fetched."""
+        archive = HTMLArchive(str(tmp_path / "archive"))
+        archive.put("usccb", date(2024, 12, 25), READINGS_HTML)
+        fetched_at = datetime(2024, 12, 1, 6, 30)
+        timestamp = calendar.timegm(fetched_at.timetuple())
+        os.utime(archive._ref_path("usccb", date(2024, 12, 25)), (timestamp, timestamp))
+        store = ReadingsStore(str(tmp_path / "readings.db"))
+
+        reparse_archive(archive, store, workers=1)
+
+        assert store.get(date(2024, 12, 25))["fetched_at"] == fetched_at
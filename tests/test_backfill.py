@@ -0,0 +1,113 @@
+"""
+Tests for the resumable readings backfill.
+"""
+
+import asyncio
+import json
+import httpx
+import pytest
+from datetime import date
+
+from app.services.batch import backfill_readings, _save_checkpoint
+from tests.test_data_sources import READINGS_HTML, make_manager, mock_session
+
+
+def readings_handler(requested, failing=()):
+    """Answer readings requests, failing for the given MM/DD/YYYY dates."""
+    def handler(request):
+        path = request.url.path
+        requested.append(path)
+        if any(f in path for f in failing):
+            return httpx.Response(500)
+        return httpx.Response(200, text=READINGS_HTML)
+    return handler
+
+
+def run_backfill(manager, tmp_path, start, end, **kwargs):
+    """Run a fast backfill with a checkpoint under tmp_path."""
+    return asyncio.run(backfill_readings(
+        manager, start, end,
+        checkpoint_path=str(tmp_path / "checkpoint.json"),
+        rate=1000.0,
+        **kwargs
+    ))
+
+
+class TestBackfill:
+    """Test backfilling readings into the store."""
+
+    def test_backfill_range(self, tmp_path):
+        """Test every date in the range is fetched and stored."""
+        manager = make_manager(tmp_path)
+        requested = []
+        manager.usccb.session = mock_session(readings_handler(requested))
+
+        stats = run_backfill(manager, tmp_path, date(2024, 12, 1), date(2024, 12, 10), batch_size=3)
+
+        assert stats["fetched"] == 10 and stats["errors"] == 0
+        assert stats["dates_per_second"] > 0
+        assert len(manager.store.dates()) == 10
+        checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+        assert checkpoint["next"] == "2024-12-11"
+        assert checkpoint["failed"] == []
+
+    def test_failures_are_recorded_and_retried(self, tmp_path):
+        """Test failed dates are checkpointed and retried on the next run."""
+        manager = make_manager(tmp_path)
+        requested = []
+        manager.usccb.session = mock_session(readings_handler(requested, failing=["12/05/2024"]))
+
+        stats = run_backfill(manager, tmp_path, date(2024, 12, 1), date(2024, 12, 10))
+
+        assert stats["errors"] == 1
+        checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+        assert checkpoint["failed"] == ["2024-12-05"]
+
+        requested.clear()
+        manager.usccb.session = mock_session(readings_handler(requested))
+        stats = run_backfill(manager, tmp_path, date(2024, 12, 1), date(2024, 12, 10))
+
+        assert stats["dates"] == 1 and stats["fetched"] == 1
+        assert len(requested) == 1
+        assert len(manager.store.dates()) == 10
+
+    def test_resumes_from_checkpoint(self, tmp_path):
+        """Test a restarted backfill skips dates before the checkpoint."""
+        manager = make_manager(tmp_path)
+        requested = []
+        manager.usccb.session = mock_session(readings_handler(requested))
+        _save_checkpoint(
+            str(tmp_path / "checkpoint.json"), date(2024, 12, 1), date(2024, 12, 10),
+            date(2024, 12, 8), [],
+        )
+
+        stats = run_backfill(manager, tmp_path, date(2024, 12, 1), date(2024, 12, 10))
+
+        assert stats["dates"] == 3
+        assert manager.store.dates() == [date(2024, 12, 8), date(2024, 12, 9), date(2024, 12, 10)]
+
+    def test_interrupted_resume_keeps_retries(self, tmp_path):
+        """Test retried dates not yet stored survive a crash of the resumed run."""
+        manager = make_manager(tmp_path)
+        requested = []
+        manager.usccb.session = mock_session(readings_handler(requested))
+        _save_checkpoint(
+            str(tmp_path / "checkpoint.json"), date(2024, 12, 1), date(2024, 12, 10),
+            date(2024, 12, 8), [date(2024, 12, 2), date(2024, 12, 3)],
+        )
+
+        def crash(stats):
+            raise RuntimeError("interrupted")
+
+        with pytest.raises(RuntimeError):
+            run_backfill(manager, tmp_path, date(2024, 12, 1), date(2024, 12, 10),
+                         concurrency=1, batch_size=1, progress=crash)
+
+        checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+        assert checkpoint["next"] == "2024-12-08"
+        assert checkpoint["failed"] == ["2024-12-03"]
+
+        run_backfill(manager, tmp_path, date(2024, 12, 1), date(2024, 12, 10))
+        assert manager.store.dates() == [
+            date(2024, 12, 2), date(2024, 12, 3), date(2024, 12, 8), date(2024, 12, 9), date(2024, 12, 10)
+        ]
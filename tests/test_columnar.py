@@ -0,0 +1,80 @@
+"""
+Tests for the columnar (Arrow IPC / Parquet) calendar exports.
+"""
+
+import io
+from datetime import date
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from app.cli import main
+from app.services.columnar import iter_columnar, year_batch
+
+
+class TestYearBatch:
+    """Test building a year of liturgical days as a record batch."""
+
+    def test_rows_and_columns(self):
+        """Test a batch has one row per day with calendar and lectionary columns."""
+        batch = year_batch(2024)
+        christmas = batch.slice(359, 1).to_pylist()[0]
+
+        assert batch.num_rows == 366
+        assert christmas["date"] == date(2024, 12, 25)
+        assert christmas["celebration"] == "Nativity of the Lord"
+        assert christmas["lectionary_number"] == 16
+        assert christmas["gospel"] == "John 1:1-18"
+
+    def test_region(self):
+        """Test a regional batch follows the regional calendar."""
+        row = year_batch(2025, "us").slice(4, 1).to_pylist()[0]
+
+        assert row["celebration"] == "Epiphany of the Lord"
+        assert row["lectionary_number"] == 20
+
+
+class TestStreaming:
+    """Test multi-year exports are written one year at a time."""
+
+    def test_arrow_stream(self):
+        """Test the Arrow IPC stream yields a chunk per year and reads back whole."""
+        chunks = list(iter_columnar(2023, 2025, "arrow"))
+        table = pa.ipc.open_stream(b"".join(chunks)).read_all()
+
+        assert len(chunks) == 4  # Schema and first year, two more years, end of stream
+        assert table.num_rows == 365 + 366 + 365
+
+    def test_parquet_row_groups(self):
+        """Test Parquet exports have a row group per year."""
+        data = b"".join(iter_columnar(2023, 2025, "parquet"))
+        parquet = pq.ParquetFile(io.BytesIO(data))
+
+        assert parquet.metadata.num_row_groups == 3
+        assert parquet.metadata.num_rows == 1096
+
+
+class TestExportCommand:
+    """Test the export-calendar command and endpoint."""
+
+    def test_command(self, tmp_path):
+        """Test the command writes a Parquet file."""
+        output = tmp_path / "calendar.parquet"
+
+        assert main(["export-calendar", "2024", "2025", "--output", str(output)]) == 0
+        assert pq.read_table(output).num_rows == 731
+
+    def test_endpoint(self, client):
+        """Test the endpoint streams an Arrow IPC stream."""
+        response = client.get("/api/v1/calendar/export/2024/2025?format=arrow&region=us")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        assert pa.ipc.open_stream(response.content).read_all().num_rows == 731
+
+    def test_endpoint_limits(self, client):
+        """Test unknown formats and reversed ranges are rejected."""
+        assert client.get("/api/v1/calendar/export/2024/2025?format=xlsx").status_code == 400
+        assert client.get("/api/v1/calendar/export/2025/2024").status_code == 400
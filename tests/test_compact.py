@@ -0,0 +1,78 @@
+"""
+Tests for the compact internal representations.
+"""
+
+from datetime import date, datetime
+
+from app.models.compact import CompactReadings
+from app.models.liturgical import DailyReadings, Reading, Psalm
+from app.services.liturgical_calendar import LiturgicalCalendar, FIXED_CELEBRATIONS
+
+
+def make_readings() -> DailyReadings:
+    """Build readings as the USCCB parser would."""
+    return DailyReadings(
+        date=date(2024, 12, 25),
+        first_reading=Reading(reference="Isaiah 9:1-6", citation="Isaiah 9:1-6", text="The people...", source="USCCB"),
+        responsorial_psalm=Psalm(reference="Psalm 96", refrain="Today is born our Savior", verses=["Sing to the LORD"], source="USCCB"),
+        gospel=Reading(reference="Luke 2:1-14", citation="Lk 2:1-14", source="USCCB"),
+        source="USCCB - United States Conference of Catholic Bishops",
+        last_updated=datetime(2024, 12, 1),
+    )
+
+
+class TestCompactReadings:
+    """Test the compact form of daily readings."""
+
+    def test_round_trip(self):
+        """Test converting to the compact form and back loses nothing."""
+        readings = make_readings()
+
+        assert CompactReadings.from_model(readings).to_model() == readings
+
+    def test_citation_stored_once(self):
+        """Test a citation equal to the reference is not stored separately."""
+        compact = CompactReadings.from_model(make_readings())
+
+        assert compact.first_reading.citation is None
+        assert compact.gospel.citation == "Lk 2:1-14"
+
+    def test_sources_are_interned(self):
+        """Test repeated source strings share one object."""
+        first = CompactReadings.from_model(make_readings())
+        second = CompactReadings.from_model(make_readings())
+
+        assert first.source is second.source
+        assert first.gospel.source is second.first_reading.source
+
+    def test_no_instance_dict(self):
+        """Test compact records are slotted."""
+        compact = CompactReadings.from_model(make_readings())
+
+        assert not hasattr(compact, "__dict__")
+        assert not hasattr(compact.gospel, "__dict__")
+
+
+class TestYearTable:
+    """Test the per-year calendar table."""
+
+    def test_covers_every_day(self):
+        """Test the table has one entry per day, leap years included."""
+        assert len(LiturgicalCalendar(2024).year_table) == 366
+        assert len(LiturgicalCalendar(2025).year_table) == 365
+
+    def test_celebrations_are_shared(self):
+        """Test table entries reference the shared celebration definitions."""
+        calendar = LiturgicalCalendar(2024)
+
+        entry = calendar.get_compact_day(date(2024, 12, 25))
+
+        assert entry.celebrations[0] is FIXED_CELEBRATIONS[(12, 25)]
+
+    def test_other_year_dates(self):
+        """Test dates outside the calendar's year use that year's table."""
+        calendar = LiturgicalCalendar(2024)
+
+        day = calendar.get_liturgical_day(date(2025, 4, 20))
+
+        assert day.primary_celebration.name == "Easter Sunday"
@@ -0,0 +1,175 @@
+"""
+Tests for response compression and the precompressed response cache.
+"""
+
+import gzip
+import zlib
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, cache_control, negotiate_encoding
+
+
+def build_app(calls: list, compress: bool = True) -> FastAPI:
+    """Create a small app, wrapped in the compression middleware unless disabled."""
+    app = FastAPI()
+    if compress:
+        app.add_middleware(CompressionMiddleware, minimum_size=100, cache_entries=10)
+
+    @app.get("/public")
+    async def public(response: Response):
+        calls.append("public")
+        response.headers["Cache-Control"] = cache_control(60)
+        return {"text": "Glory be to the Father " * 50}
+
+    @app.get("/private")
+    async def private():
+        calls.append("private")
+        return {"text": "Glory be to the Father " * 50}
+
+    @app.get("/tagged")
+    async def tagged(response: Response):
+        calls.append("tagged")
+        response.headers["Cache-Control"] = cache_control(60)
+        response.headers["ETag"] = '"v1"'
+        return {"text": "Glory be to the Father " * 50}
+
+    @app.get("/localized")
+    async def localized(response: Response):
+        calls.append("localized")
+        response.headers["Cache-Control"] = cache_control(60)
+        response.headers["Vary"] = "Accept-Language"
+        return {"text": "Gloria Patri et Filio " * 50}
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for i in range(20):
+                yield f'{{"line": {i}, "text": "{"Amen " * 20}"}}\n'.encode()
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return app
+
+
+class TestNegotiation:
+    """Test Accept-Encoding negotiation."""
+
+    def test_gzip(self):
+        """Test gzip is chosen when accepted."""
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+
+    def test_identity(self):
+        """Test identity is used when nothing supported is accepted."""
+        assert negotiate_encoding("") == "identity"
+        assert negotiate_encoding("gzip;q=0") == "identity"
+
+
+class TestCompressionMiddleware:
+    """Test compression and caching behaviour."""
+
+    def test_compresses_large_json(self):
+        """Test large responses are gzip-compressed."""
+        client = TestClient(build_app([]))
+        response = client.get("/private", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["text"].startswith("Glory be")
+        assert "Accept-Encoding" in response.headers["vary"]
+
+    def test_small_responses_not_compressed(self):
+        """Test tiny responses are sent as-is."""
+        client = TestClient(build_app([]))
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+    def test_public_responses_cached(self):
+        """Test public responses are rendered once and then served from the cache."""
+        calls = []
+        client = TestClient(build_app(calls))
+
+        first = client.get("/public", headers={"Accept-Encoding": "gzip"})
+        second = client.get("/public", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/public", headers={"Accept-Encoding": "identity"})
+
+        assert calls == ["public"]
+        assert first.content == second.content == plain.content
+        assert second.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in plain.headers
+
+    def test_compressed_once_per_entry(self):
+        """Test the compressed variant is stored alongside the entry."""
+        middleware = CompressionMiddleware(build_app([], compress=False), minimum_size=100, cache_entries=10)
+        client = TestClient(middleware)
+        client.get("/public", headers={"Accept-Encoding": "gzip"})
+
+        entry = middleware.cache.get("/public?")
+        assert set(entry.bodies) == {"identity", "gzip"}
+        assert gzip.decompress(entry.bodies["gzip"]) == entry.bodies["identity"]
+
+    def test_cached_etag_revalidated(self):
+        """Test conditional requests matching a cached response's ETag get 304."""
+        calls = []
+        client = TestClient(build_app(calls))
+        client.get("/tagged")
+
+        response = client.get("/tagged", headers={"If-None-Match": '"v1"'})
+        stale = client.get("/tagged", headers={"If-None-Match": '"v0"'})
+
+        assert calls == ["tagged"]
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == '"v1"'
+        assert stale.status_code == 200
+
+    def test_private_responses_not_cached(self):
+        """Test responses without public Cache-Control always reach the app."""
+        calls = []
+        client = TestClient(build_app(calls))
+        client.get("/private")
+        client.get("/private")
+        assert calls == ["private", "private"]
+
+    def test_varying_responses_not_cached(self):
+        """Test responses varying by headers other than Accept-Encoding are not shared."""
+        calls = []
+        client = TestClient(build_app(calls))
+        client.get("/localized")
+        response = client.get("/localized", headers={"Accept-Encoding": "gzip"})
+
+        assert calls == ["localized", "localized"]
+        assert "Accept-Language" in response.headers["vary"]
+        assert "Accept-Encoding" in response.headers["vary"]
+
+    def test_streaming_compressed_incrementally(self):
+        """Test streamed responses are compressed chunk by chunk."""
+        client = TestClient(build_app([]))
+        with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+            raw = b"".join(response.iter_raw())
+            assert response.headers["content-encoding"] == "gzip"
+
+        text = zlib.decompress(raw, 16 + zlib.MAX_WBITS).decode()
+        assert len(text.splitlines()) == 20
+
+
+class TestCachedEndpoints:
+    """Test which API responses are marked cacheable."""
+
+    def test_prayers_cacheable(self, client):
+        """Test prayers are publicly cacheable."""
+        response = client.get("/api/v1/prayers/common")
+        assert response.headers["cache-control"].startswith("public")
+
+    def test_past_readings_cacheable(self, client):
+        """Test readings found for a past date are publicly cacheable."""
+        response = client.get("/api/v1/readings/2024-12-25")
+        assert response.headers["cache-control"].startswith("public")
+
+    def test_today_not_cacheable(self, client):
+        """Test 'today' responses are never cached under a fixed URL."""
+        response = client.get("/api/v1/calendar/today")
+        assert "cache-control" not in response.headers
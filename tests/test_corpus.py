@@ -0,0 +1,100 @@
+"""
+Tests for the compiled, memory-mapped readings corpus.
+"""
+
+import asyncio
+from datetime import date, datetime
+
+import pytest
+
+from app.models.liturgical import DailyReadings, Reading
+from app.services.corpus import ReadingsCorpus, write_corpus
+from app.services.storage import ReadingsStore
+
+
+def make_readings(target_date: date) -> DailyReadings:
+    """Build readings for a date."""
+    return DailyReadings(
+        date=target_date,
+        gospel=Reading(reference="Luke 2:1-14", citation="Luke 2:1-14", text="In those days… ✝", source="USCCB"),
+        source="USCCB - United States Conference of Catholic Bishops",
+        last_updated=datetime(2024, 12, 1),
+    )
+
+
+def build_corpus(tmp_path, dates) -> ReadingsCorpus:
+    """Store readings for dates and compile them into a corpus."""
+    store = ReadingsStore(str(tmp_path / "readings.db"))
+    store.put_many(
+        {"readings": make_readings(d), "fetched_at": datetime(2024, 12, 1)} for d in dates
+    )
+    path = str(tmp_path / "readings.corpus")
+    write_corpus(path, store.iter_json())
+    store.close()
+    return ReadingsCorpus(path)
+
+
+class TestReadingsCorpus:
+    """Test compiling and reading the corpus file."""
+
+    def test_round_trip(self, tmp_path):
+        """Test compiled readings are read back unchanged."""
+        corpus = build_corpus(tmp_path, [date(2024, 12, 25), date(2024, 1, 1), date(2024, 6, 29)])
+
+        assert len(corpus) == 3
+        for target_date in (date(2024, 12, 25), date(2024, 1, 1), date(2024, 6, 29)):
+            assert corpus.get(target_date) == make_readings(target_date)
+        corpus.close()
+
+    def test_missing_date(self, tmp_path):
+        """Test dates outside the corpus are not found."""
+        corpus = build_corpus(tmp_path, [date(2024, 12, 25)])
+
+        assert corpus.get_json(date(2024, 12, 24)) is None
+        assert corpus.get(date(2025, 1, 1)) is None
+        corpus.close()
+
+    def test_slices_are_views(self, tmp_path):
+        """Test readings JSON is a view into the mapped file."""
+        corpus = build_corpus(tmp_path, [date(2024, 12, 25)])
+
+        data = corpus.get_json(date(2024, 12, 25))
+
+        assert isinstance(data, memoryview)
+        assert DailyReadings.parse_raw(bytes(data)) == make_readings(date(2024, 12, 25))
+        data.release()
+        corpus.close()
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test a file that is not a corpus is refused."""
+        path = tmp_path / "other.corpus"
+        path.write_bytes(b"not a corpus at all")
+
+        with pytest.raises(ValueError):
+            ReadingsCorpus(str(path)).get(date(2024, 12, 25))
+
+
+class TestCorpusServing:
+    """Test readings are served from the corpus without the network."""
+
+    def test_manager_uses_corpus(self, tmp_path, manager):
+        """Test compiled dates are answered without an upstream request."""
+        manager.corpus = build_corpus(tmp_path, [date(2024, 12, 25)])
+
+        readings = asyncio.run(manager.get_daily_readings(date(2024, 12, 25)))
+
+        assert readings.gospel.reference == "Luke 2:1-14"
+        assert manager.requested == []
+
+    def test_endpoint_serves_compiled_json(self, tmp_path, manager, client):
+        """Test the readings endpoint returns the compiled JSON in its envelope."""
+        manager.corpus = build_corpus(tmp_path, [date(2024, 12, 25)])
+
+        response = client.get("/api/v1/readings/2024-12-25")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["success"] is True
+        assert body["readings"]["gospel"]["text"] == "In those days… ✝"
+        assert "public" in response.headers["cache-control"]
+        assert manager.requested == []
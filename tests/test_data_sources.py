@@ -0,0 +1,241 @@
+"""
+Tests for data source fetching and caching (network access is mocked).
+"""
+
+import asyncio
+import threading
+import httpx
+from datetime import date, datetime, timedelta
+
+from app.services.data_sources import (
+    DataSourceManager, USCCBDataSource, VaticanDataSource, VATICAN_DOCUMENT_URLS
+)
+from app.services.archive import HTMLArchive
+from app.services.storage import DocumentStore, ReadingsStore
+
+
+READINGS_HTML = """
+<html><body>
+  <div class="reading">
+    <h3>Reading I</h3>
+    <span class="reference">Isaiah 9:1-6</span>
+    <div class="reading-text">The people who walked in darkness have seen a great light.</div>
+  </div>
+  <div class="reading">
+    <h3>Gospel</h3>
+    <span class="reference">Luke 2:1-14</span>
+    <div class="reading-text">In those days a decree went out from Caesar Augustus.</div>
+  </div>
+</body></html>
+"""
+
+
+DOCUMENT_HTML = """
+<html><body>
+  <h1>General Instruction of the Roman Missal</h1>
+  <div class="content">Celebration of the Eucharist.</div>
+</body></html>
+"""
+
+
+def mock_session(handler) -> httpx.AsyncClient:
+    """Create an HTTP session whose requests are answered by handler."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def make_manager(tmp_path) -> DataSourceManager:
+    """Create a data source manager whose storage lives under tmp_path."""
+    return DataSourceManager(
+        store=ReadingsStore(str(tmp_path / "readings.db")),
+        archive=HTMLArchive(str(tmp_path / "archive")),
+    )
+
+
+class TestVaticanDataSource:
+    """Test Vatican document fetching and caching."""
+
+    def test_fetches_all_documents(self, tmp_path):
+        """Test every configured document is fetched and stored."""
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(200, text=DOCUMENT_HTML, headers={"ETag": '"v1"'})
+
+        source = VaticanDataSource(store=DocumentStore(str(tmp_path / "cache.db")))
+        source.session = mock_session(handler)
+
+        documents = asyncio.run(source.get_liturgical_documents())
+
+        assert len(documents) == len(VATICAN_DOCUMENT_URLS)
+        assert documents[0]["title"] == "General Instruction of the Roman Missal"
+        assert set(documents[0]) == {"title", "url", "content", "source"}
+        assert len(requested) == len(VATICAN_DOCUMENT_URLS)
+
+    def test_store_used_off_event_loop(self, tmp_path):
+        """Test store reads and writes run in worker threads, not on the event loop."""
+        threads = []
+        store = DocumentStore(str(tmp_path / "cache.db"))
+        for name in ("get", "put"):
+            method = getattr(store, name)
+
+            def record(*args, method=method):
+                threads.append(threading.current_thread())
+                return method(*args)
+
+            setattr(store, name, record)
+
+        source = VaticanDataSource(store=store)
+        source.session = mock_session(lambda request: httpx.Response(200, text=DOCUMENT_HTML))
+        asyncio.run(source.get_liturgical_documents())
+
+        assert len(threads) == 2 * len(VATICAN_DOCUMENT_URLS)
+        assert threading.main_thread() not in threads
+
+    def test_repeat_calls_served_from_memory(self, tmp_path):
+        """Test fresh documents are not fetched again."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, text=DOCUMENT_HTML)
+
+        source = VaticanDataSource(store=DocumentStore(str(tmp_path / "cache.db")))
+        source.session = mock_session(handler)
+
+        asyncio.run(source.get_liturgical_documents())
+        asyncio.run(source.get_liturgical_documents())
+
+        assert len(calls) == len(VATICAN_DOCUMENT_URLS)
+
+    def test_stale_documents_are_revalidated(self, tmp_path):
+        """Test stale documents are revalidated and kept on 304."""
+        store = DocumentStore(str(tmp_path / "cache.db"))
+        seen_headers = []
+
+        def first(request):
+            return httpx.Response(
+                200, text=DOCUMENT_HTML,
+                headers={"ETag": '"v1"', "Last-Modified": "Mon, 17 Mar 2003 00:00:00 GMT"},
+            )
+
+        source = VaticanDataSource(store=store)
+        source.session = mock_session(first)
+        asyncio.run(source.get_liturgical_documents())
+
+        # A new worker starts from the persistent store with stale entries
+        for document in source._documents.values():
+            store.touch(document["url"], datetime.utcnow() - timedelta(days=30))
+
+        def revalidate(request):
+            seen_headers.append(request.headers)
+            return httpx.Response(304)
+
+        restarted = VaticanDataSource(store=store)
+        restarted.session = mock_session(revalidate)
+        documents = asyncio.run(restarted.get_liturgical_documents())
+
+        assert len(documents) == len(VATICAN_DOCUMENT_URLS)
+        assert all(h["If-None-Match"] == '"v1"' for h in seen_headers)
+        assert all("If-Modified-Since" in h for h in seen_headers)
+        stored = store.get(documents[0]["url"])
+        assert datetime.utcnow() - stored["fetched_at"] < timedelta(minutes=1)
+
+    def test_stale_copy_served_on_error(self, tmp_path):
+        """Test a cached document is returned when the source is unreachable."""
+        store = DocumentStore(str(tmp_path / "cache.db"))
+        source = VaticanDataSource(store=store)
+        source.session = mock_session(lambda request: httpx.Response(200, text=DOCUMENT_HTML))
+        asyncio.run(source.get_liturgical_documents())
+
+        for document in source._documents.values():
+            document["fetched_at"] = datetime.utcnow() - timedelta(days=30)
+
+        def fail(request):
+            raise httpx.ConnectError("unreachable", request=request)
+
+        source.session = mock_session(fail)
+        documents = asyncio.run(source.get_liturgical_documents())
+
+        assert len(documents) == len(VATICAN_DOCUMENT_URLS)
+
+
+class TestUSCCBConditionalRequests:
+    """Test revalidation of cached USCCB readings."""
+
+    def test_parses_readings_and_keeps_validators(self):
+        """Test a full response is parsed and its validators recorded."""
+        source = USCCBDataSource()
+        source.session = mock_session(
+            lambda request: httpx.Response(200, text=READINGS_HTML, headers={"ETag": '"abc"'})
+        )
+
+        entry = asyncio.run(source.fetch_readings(date(2024, 12, 25)))
+
+        assert entry.readings.first_reading.reference == "Isaiah 9:1-6"
+        assert entry.readings.gospel.reference == "Luke 2:1-14"
+        assert entry.etag == '"abc"'
+
+    def test_not_modified_skips_parse(self, tmp_path, monkeypatch):
+        """Test a 304 renews the cached entry without parsing."""
+        manager = make_manager(tmp_path)
+        target = date(2024, 12, 25)
+        manager.usccb.session = mock_session(
+            lambda request: httpx.Response(
+                200, text=READINGS_HTML,
+                headers={"ETag": '"abc"', "Last-Modified": "Wed, 25 Dec 2024 00:00:00 GMT"},
+            )
+        )
+        first = asyncio.run(manager.get_daily_readings(target))
+
+        entry = manager._cache[f"readings_{target.isoformat()}"]
+        entry.fetched_at = datetime.utcnow() - timedelta(days=2)
+
+        seen_headers = []
+
+        def not_modified(request):
+            seen_headers.append(request.headers)
+            return httpx.Response(304)
+
+        def fail_parse(*args):
+            raise AssertionError("304 responses must not be parsed")
+
+        manager.usccb.session = mock_session(not_modified)
+        monkeypatch.setattr(manager.usccb, "_parse_usccb_readings", fail_parse)
+
+        second = asyncio.run(manager.get_daily_readings(target))
+
+        assert second == first
+        assert seen_headers[0]["If-None-Match"] == '"abc"'
+        assert seen_headers[0]["If-Modified-Since"] == "Wed, 25 Dec 2024 00:00:00 GMT"
+        assert entry.is_fresh(datetime.utcnow())
+
+    def test_fresh_entries_skip_network(self, tmp_path):
+        """Test fresh cache entries are served without any request."""
+        manager = make_manager(tmp_path)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, text=READINGS_HTML)
+
+        manager.usccb.session = mock_session(handler)
+        asyncio.run(manager.get_daily_readings(date(2024, 12, 25)))
+        asyncio.run(manager.get_daily_readings(date(2024, 12, 25)))
+
+        assert len(calls) == 1
+
+    def test_readings_persist_across_restarts(self, tmp_path):
+        """Test readings written through to the store are served after a restart."""
+        manager = make_manager(tmp_path)
+        manager.usccb.session = mock_session(lambda request: httpx.Response(200, text=READINGS_HTML))
+        asyncio.run(manager.get_daily_readings(date(2024, 12, 25)))
+
+        def fail(request):
+            raise AssertionError("stored readings must not be fetched again")
+
+        restarted = make_manager(tmp_path)
+        restarted.usccb.session = mock_session(fail)
+        readings = asyncio.run(restarted.get_daily_readings(date(2024, 12, 25)))
+
+        assert readings.gospel.reference == "Luke 2:1-14"
@@ -0,0 +1,88 @@
+"""
+Tests for the iCalendar and CSV calendar exports.
+"""
+
+import csv
+import io
+
+from app.services.export import export_year, _ics_line
+
+
+class TestICalendar:
+    """Test the iCalendar export."""
+
+    def test_events(self):
+        """Test celebrations and Sundays are all-day events."""
+        body = export_year("ics", 2024).body.decode("utf-8")
+
+        assert body.startswith("BEGIN:VCALENDAR\r\n")
+        assert body.endswith("END:VCALENDAR\r\n")
+        assert "DTSTART;VALUE=DATE:20241225\r\nDTEND;VALUE=DATE:20241226\r\nSUMMARY:Nativity of the Lord\r\n" in body
+        assert "SUMMARY:Sunday\\, Ordinary Time Week 11\r\n" in body
+        assert "DTSTART;VALUE=DATE:20241203\r\n" not in body  # Advent weekday
+
+    def test_regional_events(self):
+        """Test a regional export follows the regional calendar."""
+        body = export_year("ics", 2025, "us").body.decode("utf-8")
+
+        assert "UID:2025-01-05-us@catholic-missal-api\r\n" in body
+        assert "DTSTART;VALUE=DATE:20250105\r\nDTEND;VALUE=DATE:20250106\r\nSUMMARY:Epiphany of the Lord\r\n" in body
+
+    def test_long_lines_folded(self):
+        """Test lines are folded at 75 octets without splitting characters."""
+        folded = _ics_line("DESCRIPTION:" + "Brébeuf " * 20)
+        lines = folded[:-2].split("\r\n")
+
+        assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+        assert all(line.startswith(" ") for line in lines[1:])
+        assert "".join(line[1:] if i else line for i, line in enumerate(lines)) == "DESCRIPTION:" + "Brébeuf " * 20
+
+
+class TestCSV:
+    """Test the CSV export."""
+
+    def test_one_row_per_day(self):
+        """Test every day of the year has a row."""
+        rows = list(csv.DictReader(io.StringIO(export_year("csv", 2024).body.decode("utf-8"))))
+
+        assert len(rows) == 366
+        christmas = rows[359]
+        assert christmas["date"] == "2024-12-25"
+        assert christmas["celebration"] == "Nativity of the Lord"
+        assert christmas["season"] == "Christmas"
+        assert christmas["sunday_cycle"] == "C"
+
+
+class TestExportCache:
+    """Test finished exports are cached per format, year and region."""
+
+    def test_blob_reused(self):
+        """Test the same export is built once and shared."""
+        assert export_year("ics", 2024) is export_year("ics", 2024, "universal")
+        assert export_year("ics", 2024, "us").etag != export_year("ics", 2024).etag
+
+
+class TestExportEndpoints:
+    """Test the export endpoints."""
+
+    def test_ics_endpoint(self, client):
+        """Test the iCalendar endpoint serves the export with an ETag."""
+        response = client.get("/api/v1/calendar/2024.ics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/calendar")
+        assert response.headers["etag"] == export_year("ics", 2024).etag
+        assert response.headers["cache-control"].startswith("public")
+
+    def test_not_modified(self, client):
+        """Test polling with a current ETag returns 304."""
+        etag = client.get("/api/v1/calendar/2024.csv?region=us").headers["etag"]
+        response = client.get("/api/v1/calendar/2024.csv?region=us", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_date_route_still_matches(self, client):
+        """Test dates are not taken for exports."""
+        assert client.get("/api/v1/calendar/2024-12-25").status_code == 200
+        assert client.get("/api/v1/calendar/1200.ics").status_code == 422
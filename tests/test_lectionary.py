@@ -0,0 +1,89 @@
+"""
+Tests for the local lectionary index.
+"""
+
+from datetime import date
+
+from app.services.lectionary import lectionary_number, lectionary_citations, lectionary_readings
+from app.services.liturgical_calendar import LiturgicalCalendar
+
+
+class TestCycles:
+    """Test the Sunday and weekday lectionary cycles."""
+
+    def test_sunday_cycle(self):
+        """Test the Sunday cycle changes on the First Sunday of Advent."""
+        calendar = LiturgicalCalendar(2024)
+
+        assert calendar.get_sunday_cycle(date(2024, 11, 30)) == "B"
+        assert calendar.get_sunday_cycle(date(2024, 12, 1)) == "C"
+        assert calendar.get_sunday_cycle(date(2023, 12, 3)) == "B"
+        assert calendar.get_sunday_cycle(date(2022, 11, 27)) == "A"
+
+    def test_weekday_cycle(self):
+        """Test odd liturgical years use cycle I and even years cycle II."""
+        calendar = LiturgicalCalendar(2024)
+
+        assert calendar.get_weekday_cycle(date(2024, 6, 3)) == "II"
+        assert calendar.get_weekday_cycle(date(2024, 12, 2)) == "I"
+
+
+class TestLectionaryNumbers:
+    """Test mapping liturgical days to lectionary numbers."""
+
+    def test_celebrations(self):
+        """Test celebrations with their own readings."""
+        assert lectionary_number(date(2024, 12, 25)) == 16
+        assert lectionary_number(date(2024, 3, 31)) == 42
+        assert lectionary_number(date(2025, 6, 15)) == 166  # Trinity Sunday, year C
+
+    def test_season_sundays(self):
+        """Test Sundays are numbered by season, week and cycle."""
+        assert lectionary_number(date(2024, 12, 1)) == 3  # First Sunday of Advent, year C
+        assert lectionary_number(date(2024, 2, 18)) == 23  # First Sunday of Lent, year B
+        assert lectionary_number(date(2025, 4, 27)) == 45  # Second Sunday of Easter, year C
+        assert lectionary_number(date(2025, 6, 1)) == 61  # Seventh Sunday of Easter, year C
+        assert lectionary_number(date(2024, 6, 16)) == 92  # Eleventh Sunday in Ordinary Time, year B
+        assert lectionary_number(date(2024, 11, 24)) == 161  # Christ the King, year B
+
+    def test_weekdays_not_indexed(self):
+        """Test ordinary weekdays have no number."""
+        assert lectionary_number(date(2024, 12, 3)) is None
+
+
+class TestLectionaryReadings:
+    """Test reading references answered from the index."""
+
+    def test_cycle_specific_citations(self):
+        """Test the gospel of Palm Sunday follows the Sunday cycle."""
+        assert lectionary_citations(date(2024, 3, 24)).gospel == "Mark 14:1—15:47"
+        assert lectionary_citations(date(2025, 4, 13)).gospel == "Luke 22:14—23:56"
+
+    def test_readings_have_references_only(self):
+        """Test indexed readings carry references but no text."""
+        readings = lectionary_readings(date(2024, 12, 25))
+
+        assert readings.first_reading.reference == "Isaiah 52:7-10"
+        assert readings.gospel.reference == "John 1:1-18"
+        assert readings.gospel.text is None
+
+    def test_unindexed_dates(self):
+        """Test dates without citations are left to the network sources."""
+        assert lectionary_readings(date(2024, 12, 3)) is None
+
+    def test_endpoint_answers_references_locally(self, manager, client):
+        """Test reference-only projections are answered without an upstream request."""
+        response = client.get("/api/v1/readings/2024-12-25?fields=gospel.reference,first_reading.reference")
+
+        assert response.status_code == 200
+        assert response.json()["readings"] == {
+            "first_reading": {"reference": "Isaiah 52:7-10"},
+            "gospel": {"reference": "John 1:1-18"},
+        }
+        assert manager.requested == []
+
+    def test_endpoint_fetches_text(self, manager, client):
+        """Test requests for text still go to the network."""
+        client.get("/api/v1/readings/2024-12-25?fields=gospel.text")
+
+        assert manager.requested
@@ -110,6 +110,68 @@ class TestLiturgicalCalendar:
         assert liturgical_day.season == LiturgicalSeason.CHRISTMAS
         assert len(liturgical_day.celebrations) >= 1
         assert liturgical_day.primary_celebration.name == "Nativity of the Lord"
+    
+    def test_ordinary_time_weeks(self):
+        """Test Ordinary Time weeks before Lent and after Pentecost."""
+        calendar = LiturgicalCalendar(2024)
+        
+        # The Monday after the Baptism of the Lord begins week 1
+        assert calendar.get_liturgical_season(date(2024, 1, 8)) == (LiturgicalSeason.ORDINARY_TIME, 1)
+        assert calendar.get_liturgical_season(date(2024, 2, 13)) == (LiturgicalSeason.ORDINARY_TIME, 6)
+        
+        # After Pentecost, weeks are counted back from Christ the King (week 34)
+        assert calendar.get_liturgical_season(date(2024, 5, 20)) == (LiturgicalSeason.ORDINARY_TIME, 7)
+        assert calendar.get_liturgical_season(date(2024, 6, 16)) == (LiturgicalSeason.ORDINARY_TIME, 11)
+        assert calendar.get_liturgical_season(date(2024, 11, 24)) == (LiturgicalSeason.ORDINARY_TIME, 34)
+        assert calendar.get_liturgical_season(date(2024, 11, 30)) == (LiturgicalSeason.ORDINARY_TIME, 34)
+        
+        # Christ the King is the Sunday before Advent
+        liturgical_day = calendar.get_liturgical_day(date(2024, 11, 24))
+        assert liturgical_day.primary_celebration.name == "Our Lord Jesus Christ, King of the Universe"
+    
+    def test_ordinary_time_weeks_after_monday_baptism(self):
+        """Test weeks still begin on Sundays when the Baptism anchor is a Monday."""
+        calendar = LiturgicalCalendar(2024)
+        calendar.anchors["baptism_of_the_lord"] = date(2024, 1, 8)
+        
+        assert calendar.get_liturgical_season(date(2024, 1, 9)) == (LiturgicalSeason.ORDINARY_TIME, 1)
+        assert calendar.get_liturgical_season(date(2024, 1, 13)) == (LiturgicalSeason.ORDINARY_TIME, 1)
+        assert calendar.get_liturgical_season(date(2024, 1, 14)) == (LiturgicalSeason.ORDINARY_TIME, 2)
+        assert calendar.get_liturgical_season(date(2024, 1, 21)) == (LiturgicalSeason.ORDINARY_TIME, 3)
+    
+    def test_lectionary_cycles(self):
+        """Test Sunday and weekday cycles are reported for each day."""
+        calendar = LiturgicalCalendar(2024)
+        
+        # Liturgical year 2024 (Advent 2023 - Advent 2024) is year B, cycle II
+        liturgical_day = calendar.get_liturgical_day(date(2024, 6, 16))
+        assert liturgical_day.sunday_cycle == "B"
+        assert liturgical_day.weekday_cycle == "II"
+        
+        # The First Sunday of Advent begins year C, cycle I
+        liturgical_day = calendar.get_liturgical_day(date(2024, 12, 1))
+        assert liturgical_day.sunday_cycle == "C"
+        assert liturgical_day.weekday_cycle == "I"
+    
+    def test_psalter_week(self):
+        """Test the psalter week follows the weeks of each season."""
+        calendar = LiturgicalCalendar(2024)
+        
+        # Ash Wednesday to the following Saturday use week IV
+        assert calendar.get_liturgical_day(date(2024, 2, 14)).psalter_week == 4
+        assert calendar.get_liturgical_day(date(2024, 2, 17)).psalter_week == 4
+        
+        # Lent, Easter and Advent restart at week I
+        assert calendar.get_liturgical_day(date(2024, 2, 18)).psalter_week == 1
+        assert calendar.get_liturgical_day(date(2024, 2, 25)).psalter_week == 2
+        assert calendar.get_liturgical_day(date(2024, 4, 1)).psalter_week == 1
+        assert calendar.get_liturgical_day(date(2024, 4, 7)).psalter_week == 2
+        assert calendar.get_liturgical_day(date(2024, 12, 1)).psalter_week == 1
+        assert calendar.get_liturgical_day(date(2024, 12, 22)).psalter_week == 4
+        
+        # Christmas and the Triduum have no psalter week
+        assert calendar.get_liturgical_day(date(2024, 12, 25)).psalter_week is None
+        assert calendar.get_liturgical_day(date(2024, 3, 31)).psalter_week is None
 
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+"""
+Tests for time-zone aware "today" resolution.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, cache_control
+from app.core.local_date import LocalDateMiddleware, get_zone, local_today
+
+
+def zone_today(name: str) -> str:
+    """Today's ISO date in a zone."""
+    return datetime.now(ZoneInfo(name)).date().isoformat()
+
+
+class TestZones:
+    """Test zone lookups."""
+
+    def test_cached(self):
+        """Test zones are looked up once."""
+        assert get_zone("Europe/Rome") is get_zone("Europe/Rome")
+
+    def test_unknown(self):
+        """Test unknown and malformed zones raise ValueError."""
+        for name in ("Nowhere/Zone", "../etc/passwd", "America"):
+            with pytest.raises(ValueError):
+                get_zone(name)
+
+    def test_local_today(self):
+        """Test today follows the zone."""
+        assert local_today("Pacific/Kiritimati").isoformat() == zone_today("Pacific/Kiritimati")
+        assert local_today("Pacific/Pago_Pago").isoformat() == zone_today("Pacific/Pago_Pago")
+
+
+class TestTodayEndpoints:
+    """Test the tz parameter on the 'today' endpoints."""
+
+    def test_calendar_tz(self, client):
+        """Test the calendar's today follows ?tz=."""
+        response = client.get("/api/v1/calendar/today?tz=Pacific/Kiritimati")
+        assert response.status_code == 200
+        assert response.json()["liturgical_day"]["date"] == zone_today("Pacific/Kiritimati")
+        assert "cache-control" not in response.headers
+
+    def test_header(self, client):
+        """Test the X-Timezone header is accepted."""
+        response = client.get("/api/v1/calendar/today", headers={"X-Timezone": "Pacific/Pago_Pago"})
+        assert response.json()["liturgical_day"]["date"] == zone_today("Pacific/Pago_Pago")
+
+    def test_readings_tz(self, client):
+        """Test the readings' today follows ?tz=."""
+        response = client.get("/api/v1/readings/today?tz=Pacific/Kiritimati")
+        assert response.status_code == 200
+        assert response.json()["readings"]["date"] == zone_today("Pacific/Kiritimati")
+
+    def test_unknown_zone(self, client):
+        """Test unknown zones are rejected."""
+        for path in ("/api/v1/calendar/today", "/api/v1/readings/today", "/api/v1/prayers/today"):
+            response = client.get(f"{path}?tz=Nowhere/Zone")
+            assert response.status_code == 400
+            assert "Nowhere/Zone" in response.json()["detail"]
+
+
+class TestLocalDateMiddleware:
+    """Test 'today' paths share the cache entries of their dates."""
+
+    def build_client(self, calls: list) -> TestClient:
+        """A small cached app with a 'today' alias for its dated path."""
+        app = FastAPI()
+
+        @app.get("/days/{day}")
+        async def day(day: str, response: Response):
+            calls.append(day)
+            response.headers["Cache-Control"] = cache_control(60)
+            return {"day": day, "text": "Glory be to the Father " * 50}
+
+        compressed = CompressionMiddleware(app, minimum_size=100, cache_entries=10)
+        return TestClient(LocalDateMiddleware(compressed, paths={"/days/today": "/days/{date}"}))
+
+    def test_zones_share_entry(self):
+        """Test zones on the same date are served one cached response."""
+        calls = []
+        client = self.build_client(calls)
+        first = client.get("/days/today?tz=UTC")
+        second = client.get("/days/today?tz=Etc/UTC")
+        dated = client.get(f"/days/{zone_today('UTC')}")
+
+        assert calls == [zone_today("UTC")]
+        assert first.content == second.content == dated.content
+        assert "cache-control" not in first.headers
+        assert dated.headers["cache-control"].startswith("public")
+
+    def test_unknown_zone_passed_through(self):
+        """Test requests with unknown zones are not rewritten."""
+        calls = []
+        client = self.build_client(calls)
+        client.get("/days/today?tz=Nowhere/Zone")
+        assert calls == ["today"]
@@ -0,0 +1,138 @@
+"""
+Tests for the packaged prayer catalog and language negotiation.
+"""
+
+from datetime import date
+
+from app.routers.prayers import prayer_bodies, prayers_json
+from app.services.prayer_catalog import get_prayer_catalog, negotiate_language
+
+
+class TestNegotiation:
+    """Test Accept-Language negotiation."""
+
+    def test_regional_tag_falls_back_to_language(self):
+        """Test a regional tag matches its base language."""
+        assert negotiate_language("es-MX,es;q=0.9,en;q=0.8", ("en", "es", "la")) == "es"
+
+    def test_quality_order(self):
+        """Test the highest quality available language wins."""
+        assert negotiate_language("fr, la;q=0.5, es;q=0.7", ("en", "es", "la")) == "es"
+
+    def test_default(self):
+        """Test English is used when nothing requested is available."""
+        assert negotiate_language(None, ("en", "es")) == "en"
+        assert negotiate_language("de, fr;q=0.5", ("en", "es")) == "en"
+
+
+class TestPrayerCatalog:
+    """Test catalog lookups."""
+
+    def test_categories_and_seasons(self):
+        """Test the catalog covers the categories and seasons served."""
+        catalog = get_prayer_catalog()
+        assert {"common", "marian", "penitential", "eucharistic"} <= set(catalog.categories)
+        assert {"advent", "christmas", "lent", "easter"} <= set(catalog.seasons)
+        assert {"en", "es", "la"} <= set(catalog.languages)
+
+    def test_translated(self):
+        """Test prayers are returned in the requested language."""
+        names = [p.name for p in get_prayer_catalog().category("common", "la")]
+        assert "Pater Noster" in names
+        assert "Ave Maria" in names
+
+    def test_untranslated_falls_back_to_english(self):
+        """Test prayers without a translation are served in English."""
+        prayer = get_prayer_catalog().named("memorare", "la")
+        assert prayer.name == "Memorare"
+        assert prayer.language == "en"
+
+    def test_named_in_any_language(self):
+        """Test prayers are found by key or by a translated name."""
+        catalog = get_prayer_catalog()
+        assert catalog.named("Padre Nuestro", "en").name == "Our Father"
+        assert catalog.named("hail-mary", "es").name == "Ave María"
+        assert catalog.named("unknown") is None
+
+
+class TestPrayerEndpoints:
+    """Test language selection on the prayer endpoints."""
+
+    def test_accept_language(self, client):
+        """Test the Accept-Language header selects the language."""
+        response = client.get("/api/v1/prayers/common", headers={"Accept-Language": "la"})
+        assert response.status_code == 200
+        assert response.headers["content-language"] == "la"
+        assert "Accept-Language" in response.headers["vary"]
+        assert response.json()["prayers"][0]["name"] == "Pater Noster"
+
+    def test_lang_parameter(self, client):
+        """Test ?lang= takes precedence over Accept-Language."""
+        response = client.get("/api/v1/prayers/common?lang=es", headers={"Accept-Language": "la"})
+        assert response.json()["prayers"][0]["name"] == "Padre Nuestro"
+
+    def test_unknown_lang(self, client):
+        """Test an unknown ?lang= is rejected."""
+        response = client.get("/api/v1/prayers/common?lang=xx")
+        assert response.status_code == 400
+
+    def test_by_name(self, client):
+        """Test a single prayer is found by name."""
+        response = client.get("/api/v1/prayers/name/Ave Maria?lang=en")
+        assert response.status_code == 200
+        assert response.json()["prayers"][0]["name"] == "Hail Mary"
+        assert client.get("/api/v1/prayers/name/unknown").status_code == 404
+
+    def test_common_not_a_category(self, client):
+        """Test 'common' is only served by /common."""
+        response = client.get("/api/v1/prayers/category/common")
+        assert response.status_code == 404
+        assert "marian" in response.json()["detail"]
+
+    def test_serialized_once(self):
+        """Test each response is rendered once and reused."""
+        assert prayers_json("season", "lent", "es") is prayers_json("season", "lent", "es")
+        assert prayers_json("season", "unknown", "en") is None
+
+    def test_unknown_keys_not_stored(self):
+        """Test lookups of unknown names never grow the response table."""
+        size = len(prayer_bodies())
+        for i in range(100):
+            assert prayers_json("name", f"unknown-{i}", "en") is None
+        assert len(prayer_bodies()) == size
+        assert prayers_json("name", "Ave Maria", "la") is prayers_json("name", "hail-mary", "la")
+
+
+class TestDailyPrayers:
+    """Test the prayers-for-a-day endpoints."""
+
+    def test_lent(self, client):
+        """Test a Lenten weekday gets the Lenten prayers and the day itself."""
+        data = client.get("/api/v1/prayers/for/2025-03-12").json()
+        assert data["liturgical_day"]["season"] == "Lent"
+        assert [p["name"] for p in data["season_prayers"]] == ["Lenten Prayer"]
+        assert "Our Father" in [p["name"] for p in data["common_prayers"]]
+
+    def test_easter_sunday(self, client):
+        """Test Easter Sunday gets the Easter prayers."""
+        data = client.get("/api/v1/prayers/for/2025-04-20").json()
+        assert [p["name"] for p in data["season_prayers"]] == ["Easter Prayer"]
+
+    def test_ordinary_time(self, client):
+        """Test Ordinary Time has only the common prayers."""
+        data = client.get("/api/v1/prayers/for/2025-07-15?lang=la").json()
+        assert data["season_prayers"] == []
+        assert data["language"] == "la"
+        assert data["common_prayers"][0]["name"] == "Pater Noster"
+
+    def test_today(self, client):
+        """Test today's prayers are served without a shared cache lifetime."""
+        response = client.get("/api/v1/prayers/today")
+        assert response.status_code == 200
+        assert "cache-control" not in response.headers
+        assert response.json()["liturgical_day"]["date"] == date.today().isoformat()
+
+    def test_invalid_date(self, client):
+        """Test malformed dates are rejected."""
+        assert client.get("/api/v1/prayers/for/2025-13-01").status_code == 400
+        assert client.get("/api/v1/prayers/for/today?region=xx").status_code == 400
@@ -0,0 +1,90 @@
+"""
+Tests for liturgical precedence and the transfer of impeded solemnities.
+"""
+
+from datetime import date
+
+from app.models.compact import CompactCelebration
+from app.models.liturgical import LiturgicalColor, LiturgicalRank, LiturgicalSeason
+from app.services.liturgical_calendar import LiturgicalCalendar, get_calendar
+from app.services.precedence import resolve_year
+
+
+def primary(target_date: date) -> str:
+    """Name of the primary celebration of a date, if any."""
+    celebration = LiturgicalCalendar(target_date.year).get_liturgical_day(target_date).primary_celebration
+    return celebration.name if celebration else None
+
+
+class TestTransfers:
+    """Test solemnities impeded by days of higher precedence."""
+
+    def test_annunciation_in_holy_week(self):
+        """Test the Annunciation moves to the Monday after the Second Sunday of Easter."""
+        assert primary(date(2024, 3, 25)) is None
+        assert primary(date(2024, 4, 8)) == "Annunciation of the Lord"
+
+    def test_annunciation_in_easter_octave(self):
+        """Test the Annunciation is moved out of the Easter Octave."""
+        assert primary(date(2008, 3, 25)) is None
+        assert primary(date(2008, 3, 31)) == "Annunciation of the Lord"
+
+    def test_saint_joseph_in_holy_week(self):
+        """Test Saint Joseph is anticipated to the Saturday before Palm Sunday."""
+        assert primary(date(2008, 3, 19)) is None
+        assert primary(date(2008, 3, 15)) == "Saint Joseph"
+
+    def test_solemnity_on_lent_sunday(self):
+        """Test a solemnity on a Sunday of Lent moves to the Monday."""
+        assert primary(date(2023, 3, 19)) is None
+        assert primary(date(2023, 3, 20)) == "Saint Joseph"
+
+    def test_solemnity_on_advent_sunday(self):
+        """Test a solemnity on a Sunday of Advent moves to the Monday."""
+        assert primary(date(2024, 12, 8)) is None
+        assert primary(date(2024, 12, 9)) == "Immaculate Conception"
+
+    def test_transfer_is_noted(self):
+        """Test transferred celebrations say where they come from."""
+        day = LiturgicalCalendar(2024).get_liturgical_day(date(2024, 12, 9))
+
+        assert "transferred from December 8" in day.primary_celebration.description
+
+    def test_transfers_never_share_a_day(self):
+        """Test impeded solemnities move in order of precedence to distinct days (Ireland, 2008)."""
+        calendar = get_calendar(2008, "ie")
+
+        for target_date, name in ((date(2008, 3, 31), "Annunciation of the Lord"), (date(2008, 4, 1), "Saint Patrick")):
+            celebrations = calendar.get_liturgical_day(target_date).celebrations
+            assert [c.name for c in celebrations] == [name]
+
+    def test_fixed_transfer_date_occupied(self):
+        """Test the Annunciation moves on when the Monday after the Second Sunday of Easter is taken."""
+        calendar = LiturgicalCalendar(2008)
+        anchors = calendar.anchors
+        proper = CompactCelebration("Proper Solemnity", LiturgicalRank.SOLEMNITY, LiturgicalColor.WHITE, precedence=4)
+        annunciation = CompactCelebration("Annunciation of the Lord", LiturgicalRank.SOLEMNITY, LiturgicalColor.WHITE)
+        day_ranks = {date(2008, 3, 25): 2}
+
+        resolved = resolve_year(
+            {date(2008, 3, 25): [annunciation], date(2008, 3, 31): [proper]}, day_ranks, anchors
+        )
+
+        assert [c.name for c in resolved[date(2008, 3, 31)]] == ["Proper Solemnity"]
+        assert [c.name for c in resolved[date(2008, 4, 1)]] == ["Annunciation of the Lord"]
+
+    def test_solemnity_on_ordinary_sunday(self):
+        """Test solemnities take precedence over Sundays in Ordinary Time."""
+        assert primary(date(2026, 11, 1)) == "All Saints"
+
+
+class TestDayPrecedence:
+    """Test the days of the Triduum."""
+
+    def test_triduum_season(self):
+        """Test Holy Thursday to Easter Sunday form the Triduum."""
+        calendar = LiturgicalCalendar(2024)
+
+        assert calendar.get_liturgical_season(date(2024, 3, 27))[0] == LiturgicalSeason.LENT
+        for day in (28, 29, 30, 31):
+            assert calendar.get_liturgical_season(date(2024, 3, day)) == (LiturgicalSeason.EASTER_TRIDUUM, None)
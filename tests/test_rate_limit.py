@@ -0,0 +1,161 @@
+"""
+Tests for inbound rate limiting and load shedding.
+"""
+
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.rate_limit import RateLimiter, RateLimitMiddleware
+
+
+def build_app(limiter: RateLimiter, max_concurrent: int = 100, api_keys=("one", "two")) -> FastAPI:
+    """Create a small app wrapped in the rate limiting middleware."""
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=limiter,
+        max_concurrent=max_concurrent,
+        path_prefix="/api",
+        api_keys=api_keys,
+    )
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/docs-page")
+    async def docs_page():
+        return {"ok": True}
+
+    return app
+
+
+class TestRateLimiter:
+    """Test token bucket behaviour."""
+
+    def test_burst_then_reject(self):
+        """Test a client can use its burst and is then throttled."""
+        limiter = RateLimiter(requests_per_minute=60, burst=3)
+        assert [limiter.acquire("a", now=0.0) for _ in range(3)] == [0, 0, 0]
+        assert limiter.acquire("a", now=0.0) == pytest.approx(1.0)
+
+    def test_refill(self):
+        """Test tokens refill over time at the configured rate."""
+        limiter = RateLimiter(requests_per_minute=60, burst=1)
+        assert limiter.acquire("a", now=0.0) == 0
+        assert limiter.acquire("a", now=0.5) > 0
+        assert limiter.acquire("a", now=2.0) == 0
+
+    def test_clients_are_independent(self):
+        """Test one client's usage does not affect another."""
+        limiter = RateLimiter(requests_per_minute=60, burst=1)
+        assert limiter.acquire("a", now=0.0) == 0
+        assert limiter.acquire("a", now=0.0) > 0
+        assert limiter.acquire("b", now=0.0) == 0
+
+    def test_tracked_clients_are_bounded(self):
+        """Test the bucket table never grows past max_clients."""
+        limiter = RateLimiter(requests_per_minute=60, burst=1, max_clients=10)
+        for i in range(100):
+            limiter.acquire(f"client-{i}", now=0.0)
+        assert len(limiter._buckets) == 10
+
+
+class TestRateLimitMiddleware:
+    """Test the ASGI middleware."""
+
+    def test_returns_429_with_retry_after(self):
+        """Test throttled requests get 429 and a Retry-After header."""
+        client = TestClient(build_app(RateLimiter(requests_per_minute=1, burst=2)))
+        assert client.get("/api/ping").status_code == 200
+        assert client.get("/api/ping").status_code == 200
+
+        response = client.get("/api/ping")
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) > 0
+
+    def test_api_key_identifies_client(self):
+        """Test requests with different known API keys use separate buckets."""
+        client = TestClient(build_app(RateLimiter(requests_per_minute=1, burst=1)))
+        assert client.get("/api/ping", headers={"X-API-Key": "one"}).status_code == 200
+        assert client.get("/api/ping", headers={"X-API-Key": "one"}).status_code == 429
+        assert client.get("/api/ping", headers={"X-API-Key": "two"}).status_code == 200
+
+    def test_unknown_api_keys_limited_by_ip(self):
+        """Test rotating unknown API keys does not escape the client's IP limit."""
+        limiter = RateLimiter(requests_per_minute=1, burst=2, max_clients=10)
+        client = TestClient(build_app(limiter))
+        statuses = [
+            client.get("/api/ping", headers={"X-API-Key": f"random-{i}"}).status_code
+            for i in range(5)
+        ]
+        assert statuses == [200, 200, 429, 429, 429]
+        assert list(limiter._buckets) == ["ip:testclient"]
+
+    def test_paths_outside_prefix_are_not_limited(self):
+        """Test documentation paths are never throttled."""
+        client = TestClient(build_app(RateLimiter(requests_per_minute=1, burst=1)))
+        for _ in range(5):
+            assert client.get("/docs-page").status_code == 200
+
+    def test_sheds_load_when_saturated(self):
+        """Test requests beyond the concurrency limit get 503 immediately."""
+        sent = []
+
+        async def slow_app(scope, receive, send):
+            await asyncio.sleep(0.05)
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = RateLimitMiddleware(
+            slow_app,
+            limiter=RateLimiter(requests_per_minute=6000, burst=100),
+            max_concurrent=1,
+            path_prefix="/api",
+        )
+
+        async def call():
+            messages = []
+
+            async def send(message):
+                messages.append(message)
+
+            scope = {"type": "http", "path": "/api/ping", "headers": [], "client": ("1.2.3.4", 0)}
+            await middleware(scope, None, send)
+            sent.append(messages[0]["status"])
+
+        async def run():
+            await asyncio.gather(call(), call())
+
+        asyncio.run(run())
+        assert sorted(sent) == [200, 503]
+        assert middleware.active == 0
+
+    def test_shed_requests_keep_rate_budget(self):
+        """Test a request rejected with 503 does not use up the client's tokens."""
+        limiter = RateLimiter(requests_per_minute=1, burst=1)
+
+        async def slow_app(scope, receive, send):
+            await asyncio.sleep(0.05)
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = RateLimitMiddleware(slow_app, limiter=limiter, max_concurrent=1, path_prefix="/api")
+
+        async def call(address):
+            messages = []
+
+            async def send(message):
+                messages.append(message)
+
+            scope = {"type": "http", "path": "/api/ping", "headers": [], "client": (address, 0)}
+            await middleware(scope, None, send)
+            return messages[0]["status"]
+
+        async def run():
+            return await asyncio.gather(call("1.2.3.4"), call("5.6.7.8"))
+
+        assert asyncio.run(run()) == [200, 503]
+        assert asyncio.run(call("5.6.7.8")) == 200
@@ -0,0 +1,108 @@
+"""
+Tests for regional calendar overlays.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.services.liturgical_calendar import get_calendar
+from app.services.regions import resolve_region
+
+
+def primary(target_date: date, region: str = None) -> str:
+    """Name of the primary celebration of a date in a region, if any."""
+    day = get_calendar(target_date.year, region).get_liturgical_day(target_date)
+    return day.primary_celebration.name if day.primary_celebration else None
+
+
+class TestMovedSolemnities:
+    """Test solemnities moved to Sunday by some regions."""
+
+    def test_epiphany_on_sunday(self):
+        """Test the Epiphany falls on the Sunday between January 2 and 8."""
+        assert primary(date(2025, 1, 5), "us") == "Epiphany of the Lord"
+        assert primary(date(2025, 1, 6), "us") != "Epiphany of the Lord"
+        assert primary(date(2025, 1, 6)) == "Epiphany of the Lord"
+
+    def test_baptism_after_late_epiphany(self):
+        """Test the Baptism of the Lord moves to Monday after an Epiphany on January 7 or 8."""
+        assert get_calendar(2025, "us").anchors["baptism_of_the_lord"] == date(2025, 1, 12)
+        assert get_calendar(2024, "us").anchors["epiphany"] == date(2024, 1, 7)
+        assert get_calendar(2024, "us").anchors["baptism_of_the_lord"] == date(2024, 1, 8)
+
+    def test_ordinary_time_after_monday_baptism(self):
+        """Test Ordinary Time Sundays keep their numbers when the Baptism is on Monday."""
+        for year, first_sunday in ((2024, date(2024, 1, 14)), (2023, date(2023, 1, 15))):
+            calendar = get_calendar(year, "us")
+            assert calendar.anchors["baptism_of_the_lord"].weekday() == 0
+            for week in (2, 3, 6):
+                day = calendar.get_liturgical_day(first_sunday + timedelta(weeks=week - 2))
+                assert (day.season_week, day.psalter_week) == (week, (week - 1) % 4 + 1)
+            assert calendar.get_liturgical_day(first_sunday - timedelta(days=5)).season_week == 1
+
+    def test_ascension_on_sunday(self):
+        """Test the Ascension replaces the Seventh Sunday of Easter."""
+        assert primary(date(2025, 6, 1), "us") == "Ascension of the Lord"
+        assert primary(date(2025, 5, 29), "us") != "Ascension of the Lord"
+        assert primary(date(2025, 5, 29)) == "Ascension of the Lord"
+
+
+class TestProperCelebrations:
+    """Test celebrations proper to a region."""
+
+    def test_proper_solemnity(self):
+        """Test Saint Patrick is a solemnity in Ireland only."""
+        assert primary(date(2025, 3, 17), "ie") == "Saint Patrick"
+        assert primary(date(2025, 3, 17)) != "Saint Patrick"
+
+    def test_outranked_proper_feast_is_omitted(self):
+        """Test a proper feast on a Sunday of Advent is not celebrated."""
+        assert primary(date(2024, 12, 12), "us") == "Our Lady of Guadalupe"
+        assert primary(date(2027, 12, 12), "us") is None
+
+    def test_unknown_region(self):
+        """Test unknown regions are rejected."""
+        with pytest.raises(KeyError):
+            resolve_region("xx")
+
+
+class TestLayering:
+    """Test regional years share the universal table."""
+
+    def test_base_is_shared(self):
+        """Test a regional table holds only its differences from the universal year."""
+        table = get_calendar(2025, "us").year_table
+
+        assert table.base is get_calendar(2025).year_table
+        assert len(table) == len(table.base)
+        assert 0 < len(table.overrides) < 30
+
+    def test_universal_is_default(self):
+        """Test the universal region is the default calendar."""
+        assert get_calendar(2025, "universal") is get_calendar(2025)
+
+
+class TestRegionEndpoints:
+    """Test the region query parameter."""
+
+    def test_region_parameter(self, client):
+        """Test a date can be looked up in a regional calendar."""
+        response = client.get("/api/v1/calendar/2025-06-01?region=us")
+
+        assert response.status_code == 200
+        assert response.json()["liturgical_day"]["primary_celebration"]["name"] == "Ascension of the Lord"
+
+    def test_region_season(self, client):
+        """Test key dates follow the region."""
+        response = client.get("/api/v1/calendar/season/2025?region=us")
+
+        assert response.json()["data"]["epiphany"] == "2025-01-05"
+        assert response.json()["data"]["ascension"] == "2025-06-01"
+
+    def test_unknown_region(self, client):
+        """Test unknown regions return 400."""
+        response = client.get("/api/v1/calendar/2025-06-01?region=xx")
+
+        assert response.status_code == 400
+        assert "universal" in response.json()["detail"]
@@ -0,0 +1,131 @@
+"""
+Tests for scripture reference parsing and the passage index.
+"""
+
+import asyncio
+from datetime import date, datetime
+
+import pytest
+
+from app.models.liturgical import DailyReadings, Reading
+from app.services.scripture import ScriptureIndex, ScriptureReferenceError, parse_reference
+
+
+def make_readings(target_date: date, first: str, gospel: str) -> DailyReadings:
+    """Readings with a first reading and a gospel reference."""
+    return DailyReadings(
+        date=target_date,
+        first_reading=Reading(reference=first, citation=first, source="Test"),
+        gospel=Reading(reference=gospel, citation=gospel, source="Test"),
+        source="Test",
+        last_updated=datetime(2024, 1, 1),
+    )
+
+
+class TestParseReference:
+    """Test parsing and normalizing references."""
+
+    def test_abbreviations(self):
+        """Test abbreviations and full names normalize to the same book."""
+        assert parse_reference("Jn 6:51-58") == parse_reference("John 6:51-58")
+        assert str(parse_reference("1 Cor 11:23-26")[0]) == "1 Corinthians 11:23-26"
+
+    def test_lists_and_part_verses(self):
+        """Test verse lists keep their chapter and ignore part-verse letters."""
+        ranges = parse_reference("2 Sm 7:1-5, 8b-12, 14a, 16")
+
+        assert [str(r) for r in ranges] == [
+            "2 Samuel 7:1-5", "2 Samuel 7:8-12", "2 Samuel 7:14", "2 Samuel 7:16",
+        ]
+
+    def test_ranges_across_chapters(self):
+        """Test ranges spanning chapters, with any kind of dash."""
+        assert str(parse_reference("Mk 14:1—15:47")[0]) == "Mark 14:1-15:47"
+
+    def test_whole_chapters(self):
+        """Test chapter-only references cover the whole chapter."""
+        chapter = parse_reference("John 6")[0]
+
+        assert chapter.overlaps(parse_reference("Jn 6:51-58")[0])
+        assert not chapter.overlaps(parse_reference("Jn 7:1")[0])
+
+    def test_alternatives(self):
+        """Test semicolons and 'or' separate further passages."""
+        assert [str(r) for r in parse_reference("Is 7:10-14; 8:10")] == ["Isaiah 7:10-14", "Isaiah 8:10"]
+        assert len(parse_reference("Lk 2:1-14 or 2:1-5")) == 2
+
+    def test_invalid(self):
+        """Test unknown books and malformed references are rejected."""
+        for reference in ("Hezekiah 1:1", "6:51", "John 6:58-51"):
+            with pytest.raises(ScriptureReferenceError):
+                parse_reference(reference)
+
+
+class TestScriptureIndex:
+    """Test overlap queries on the passage index."""
+
+    def build(self) -> ScriptureIndex:
+        index = ScriptureIndex()
+        index.add_readings(make_readings(date(2024, 8, 11), "1 Kgs 19:4-8", "Jn 6:41-51"))
+        index.add_readings(make_readings(date(2024, 8, 18), "Prv 9:1-6", "Jn 6:51-58"))
+        index.add_readings(make_readings(date(2024, 12, 25), "Is 52:7-10", "Jn 1:1-18"))
+        return index
+
+    def test_overlap(self):
+        """Test every reading overlapping the passage is found, in date order."""
+        matches = self.build().find(parse_reference("Jn 6:51-58"))
+
+        assert [(m.date, m.part) for m in matches] == [
+            (date(2024, 8, 11), "gospel"), (date(2024, 8, 18), "gospel"),
+        ]
+
+    def test_no_overlap(self):
+        """Test adjacent passages do not match."""
+        assert self.build().find(parse_reference("Jn 6:59-71")) == []
+
+    def test_date_range(self):
+        """Test matches can be limited to a date range."""
+        matches = self.build().find(parse_reference("John 6"), start=date(2024, 8, 12))
+
+        assert [m.date for m in matches] == [date(2024, 8, 18)]
+
+    def test_replace(self):
+        """Test re-indexing a date replaces its references."""
+        index = self.build()
+        index.add_readings(make_readings(date(2024, 8, 18), "Prv 9:1-6", "Mk 1:1-8"))
+
+        assert [m.date for m in index.find(parse_reference("John 6"))] == [date(2024, 8, 11)]
+
+
+class TestPassageEndpoint:
+    """Test the passage lookup endpoint."""
+
+    def test_stored_readings(self, client, manager):
+        """Test the index is built from the store and kept current."""
+        asyncio.run(manager.get_daily_readings(date(2023, 12, 25)))
+        manager.store.put({
+            "readings": make_readings(date(2024, 8, 18), "Prv 9:1-6", "Jn 6:51-58"),
+            "fetched_at": datetime(2024, 8, 18),
+        })
+
+        response = client.get("/api/v1/readings/passage?ref=Jn 6:55")
+        assert response.status_code == 200
+        assert response.json()["passages"] == ["John 6:55"]
+        assert response.json()["readings"] == [{"date": "2024-08-18", "part": "gospel", "reference": "Jn 6:51-58"}]
+
+        asyncio.run(manager.get_daily_readings(date(2022, 12, 25)))
+        response = client.get("/api/v1/readings/passage?ref=Luke 2&start=2023-01-01")
+        assert [r["date"] for r in response.json()["readings"]] == ["2023-12-25"]
+
+    def test_index_built_once(self, manager):
+        """Test concurrent first requests share one index built off the event loop."""
+        async def run():
+            return await asyncio.gather(manager.get_scripture_index(), manager.get_scripture_index())
+
+        first, second = asyncio.run(run())
+
+        assert first is second
+
+    def test_invalid_reference(self, client):
+        """Test unparseable references return 400."""
+        assert client.get("/api/v1/readings/passage?ref=Hezekiah 1:1").status_code == 400
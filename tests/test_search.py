@@ -0,0 +1,129 @@
+"""
+Tests for the full-text search index and endpoint.
+"""
+
+import asyncio
+from datetime import date, datetime
+
+from app.models.liturgical import DailyReadings, Reading
+from app.services.search import SearchIndex, tokenize
+from tests.test_corpus import build_corpus
+from tests.test_data_sources import make_manager
+
+
+def make_readings(target_date: date, gospel_reference: str, gospel_text: str) -> DailyReadings:
+    """Readings with only a gospel."""
+    return DailyReadings(
+        date=target_date,
+        gospel=Reading(reference=gospel_reference, citation=gospel_reference, text=gospel_text, source="Test"),
+        source="Test",
+        last_updated=datetime(2024, 1, 1),
+    )
+
+
+class TestSearchIndex:
+    """Test indexing, ranking and updates."""
+
+    def test_tokenize(self):
+        """Test terms are lowercase and unaccented."""
+        assert tokenize("Brébeuf, Jogues & Companions") == ["brebeuf", "jogues", "companions"]
+
+    def test_all_terms_must_match(self):
+        """Test multi-word queries only match documents with every term."""
+        index = SearchIndex()
+        index.add("a", "prayer", "Hail Mary", "full of grace")
+        index.add("b", "prayer", "Memorare", "gracious Virgin Mary")
+
+        total, hits = index.search("mary grace")
+
+        assert total == 1
+        assert hits[0][0].doc_id == "a"
+
+    def test_ranking(self):
+        """Test title matches rank above passing mentions."""
+        index = SearchIndex()
+        index.add("a", "prayer", "Glory Be", "to the Father and to the Son")
+        index.add("b", "prayer", "Prayer of the Father", "Father of mercies")
+
+        _, hits = index.search("father")
+
+        assert [document.doc_id for document, _ in hits] == ["b", "a"]
+
+    def test_pagination(self):
+        """Test pages of results and the total count."""
+        index = SearchIndex()
+        for i in range(5):
+            index.add(f"doc{i}", "prayer", f"Prayer {i}", "Amen")
+
+        total, page = index.search("amen", offset=2, limit=2)
+
+        assert total == 5
+        assert [document.doc_id for document, _ in page] == ["doc2", "doc3"]
+
+    def test_replace_and_remove(self):
+        """Test re-adding a document replaces its terms."""
+        index = SearchIndex()
+        index.add("a", "reading", "Gospel John 6:51-58", "I am the living bread")
+        index.add("a", "reading", "Gospel Luke 2:1-14", "a savior has been born")
+
+        assert index.search("bread")[0] == 0
+        assert index.search("savior")[0] == 1
+
+        index.remove("a")
+        assert len(index) == 0
+        assert index.search("savior")[0] == 0
+
+    def test_readings_by_part(self):
+        """Test each reading of a day is its own document."""
+        index = SearchIndex()
+        index.add_readings(make_readings(date(2024, 8, 18), "John 6:51-58", "I am the living bread"))
+
+        _, hits = index.search("john 6", kind="reading")
+
+        assert hits[0][0].payload == {"date": "2024-08-18", "part": "gospel", "reference": "John 6:51-58"}
+
+
+class TestSearchEndpoint:
+    """Test the search endpoint."""
+
+    def test_prayers_indexed(self, client):
+        """Test prayers are searchable."""
+        response = client.get("/api/v1/search?q=memorare")
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+        assert response.json()["results"][0]["name"] == "Memorare"
+
+    def test_cached_readings_searchable(self, client, manager):
+        """Test readings become searchable once cached."""
+        asyncio.run(manager.get_daily_readings(date(2023, 12, 25)))
+
+        response = client.get("/api/v1/search?q=caesar+augustus&kind=reading")
+
+        assert response.json()["results"][0]["date"] == "2023-12-25"
+
+    def test_compiled_readings_searchable(self, tmp_path, manager, client):
+        """Test readings in the compiled corpus are searchable without being requested."""
+        compiled = tmp_path / "compiled"
+        compiled.mkdir()
+        manager.corpus = build_corpus(compiled, [date(2024, 12, 25)])
+
+        response = client.get("/api/v1/search?q=luke&kind=reading")
+
+        assert [result["date"] for result in response.json()["results"]] == ["2024-12-25"]
+        assert manager.requested == []
+
+    def test_managers_have_own_index(self, tmp_path, manager, client):
+        """Test readings fetched by one manager are not searchable through another."""
+        asyncio.run(manager.get_daily_readings(date(2023, 12, 25)))
+        (tmp_path / "other").mkdir()
+        other = make_manager(tmp_path / "other")
+
+        index = asyncio.run(other.get_search_index())
+
+        assert index.search("caesar augustus", "reading")[0] == 0
+
+    def test_invalid_parameters(self, client):
+        """Test unknown kinds and oversized pages are rejected."""
+        assert client.get("/api/v1/search?q=amen&kind=saint").status_code == 400
+        assert client.get("/api/v1/search?q=amen&page_size=1000").status_code == 400
@@ -0,0 +1,87 @@
+"""
+Tests for application startup cost.
+
+Imports are measured in fresh interpreters, since the test session has
+already imported everything.
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from app.routers import calendar, documents, readings
+from app.services import data_sources
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Generous, so slow CI machines pass; a regression to importing the scraping
+# stack or pyarrow at startup roughly doubles the import time
+IMPORT_BUDGET_SECONDS = 2.0
+
+HEAVY_MODULES = ["httpx", "bs4", "lxml", "pyarrow"]
+
+
+def run_python(code: str, **env) -> dict:
+    """Run code in a fresh interpreter at the repository root and return the JSON it prints."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+IMPORT_APP = f"""
+import json, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed": elapsed,
+    "heavy": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+    "routers": sorted(m for m in sys.modules if m.startswith("app.routers.")),
+}}))
+"""
+
+
+class TestStartup:
+    """Test what importing the application costs."""
+
+    def test_scraping_stack_not_imported(self):
+        """Test httpx, BeautifulSoup and pyarrow are only imported when needed."""
+        assert run_python(IMPORT_APP)["heavy"] == []
+
+    def test_import_budget(self):
+        """Test the application imports within the budget."""
+        assert run_python(IMPORT_APP)["elapsed"] < IMPORT_BUDGET_SECONDS
+
+    def test_calendar_only_worker(self):
+        """Test only the configured routers are imported."""
+        result = run_python(IMPORT_APP, API_ROUTERS='["calendar"]')
+        assert result["routers"] == ["app.routers.calendar"]
+
+    def test_prayers_only_worker(self):
+        """Test the prayers router does not pull in the calendar router."""
+        result = run_python(IMPORT_APP, API_ROUTERS='["prayers"]')
+        assert result["routers"] == ["app.routers.prayers"]
+
+
+class TestSharedManager:
+    """Test routers share one lazily created data source manager."""
+
+    def test_created_once_on_first_use(self, monkeypatch):
+        """Test the manager is built on first use and shared by every router."""
+        created = []
+        monkeypatch.setattr(data_sources, "_shared_manager", None)
+        monkeypatch.setattr(data_sources, "DataSourceManager", lambda: created.append(1) or object())
+
+        managers = [asyncio.run(module.get_data_manager()) for module in (calendar, readings, documents)]
+
+        assert len(created) == 1
+        assert managers[0] is managers[1] is managers[2]